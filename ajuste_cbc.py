@@ -0,0 +1,187 @@
+# ajuste_cbc.py
+"""Ajuste automático dos parâmetros do CBC para a família de modelos de escala.
+
+Roda uma busca em grade ou aleatória sobre as opções do PULP_CBC_CMD
+(presolve, cuts, strong, gapRel, threads, maxNodes) em instâncias geradas por
+gerar_dados_aleatorios, em processos paralelos, classifica as configurações
+pelo tempo médio e P95 e salva a vencedora como JSON de solver, legível com
+pulp.getSolverFromJson.
+
+Uso:
+    python ajuste_cbc.py --modo aleatorio --amostras 20 --processos 4 --saida cbc_ajustado.json
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import itertools
+import math
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import pulp
+
+from cenarios_comparacao import gerar_dados_aleatorios
+from solver import Dados, build_model_from_data
+
+# valores testados para cada opção (None = padrão do CBC)
+ESPACO_BUSCA: Dict[str, List[Any]] = {
+    "presolve": [None, True, False],
+    "cuts": [None, True, False],
+    "strong": [None, 0, 10],
+    "gapRel": [None, 0.001, 0.01],
+    "threads": [None, 1, 2],
+    "maxNodes": [None, 1000, 10000],
+}
+
+# mesmos tamanhos de testar_cenarios (colaboradores, turnos, linhas)
+TAMANHOS = [(36, 4, 3), (18, 8, 3), (18, 4, 6), (24, 6, 4)]
+
+Configuracao = Dict[str, Any]
+
+
+@dataclass
+class Classificacao:
+    configuracao: Configuracao
+    media: float
+    p95: float
+    falhas: int
+    gap_max: float  # maior afastamento relativo do melhor objetivo por instância
+
+
+def gerar_configuracoes(modo: str, amostras: int, seed: Optional[int] = None) -> List[Configuracao]:
+    """Configurações da grade completa ou uma amostra aleatória dela"""
+    chaves = list(ESPACO_BUSCA)
+    grade = [dict(zip(chaves, valores))
+             for valores in itertools.product(*(ESPACO_BUSCA[k] for k in chaves))]
+    if modo == "grade":
+        return grade
+    if modo == "aleatorio":
+        rng = random.Random(seed)
+        padrao = {k: None for k in chaves}
+        resto = [c for c in grade if c != padrao]
+        # a configuração padrão sempre entra como referência
+        return [padrao] + rng.sample(resto, min(amostras, len(resto)))
+    raise ValueError(f"Modo de busca desconhecido: {modo}")
+
+
+def gerar_instancias(n_por_tamanho: int, seed: int) -> List[Dados]:
+    """Instâncias reprodutíveis nos tamanhos de testar_cenarios"""
+    random.seed(seed)
+    return [gerar_dados_aleatorios(*tamanho)
+            for tamanho in TAMANHOS for _ in range(n_por_tamanho)]
+
+
+def percentil(valores: List[float], p: float) -> float:
+    """Percentil pelo método do posto mais próximo"""
+    ordenados = sorted(valores)
+    posto = max(1, math.ceil(p / 100 * len(ordenados)))
+    return ordenados[posto - 1]
+
+
+def _avaliar(indice_config: int, configuracao: Configuracao, indice_instancia: int,
+             dados: Dados, limite_tempo: float) -> Tuple[int, int, float, str, float]:
+    """Resolve uma instância com uma configuração (executado nos processos filhos)"""
+    model, _x, _w, _swap = build_model_from_data(dados)
+    model.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=limite_tempo, **configuracao))
+    status = pulp.LpStatus[model.status]
+    objetivo = pulp.value(model.objective) if status in ["Optimal", "Feasible"] else float("inf")
+    return indice_config, indice_instancia, model.solutionTime, status, objetivo
+
+
+def ajustar(configuracoes: List[Configuracao], instancias: List[Dados],
+            processos: Optional[int] = None, limite_tempo: float = 60.0,
+            msg: bool = True) -> List[Classificacao]:
+    """Avalia todas as configurações em todas as instâncias e as classifica"""
+    tempos: Dict[int, List[float]] = {c: [] for c in range(len(configuracoes))}
+    objetivos: Dict[Tuple[int, int], float] = {}
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = [
+            executor.submit(_avaliar, c, configuracao, n, dados, limite_tempo)
+            for c, configuracao in enumerate(configuracoes)
+            for n, dados in enumerate(instancias)
+        ]
+        for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+            c, n, tempo, status, objetivo = futuro.result()
+            tempos[c].append(tempo)
+            objetivos[(c, n)] = objetivo
+            if msg and concluidos % 50 == 0:
+                print(f"  {concluidos}/{len(futuros)} execuções concluídas")
+
+    # melhor objetivo encontrado em cada instância, entre todas as configurações
+    melhor = {n: min(objetivos[(c, n)] for c in range(len(configuracoes)))
+              for n in range(len(instancias))}
+
+    classificacao = []
+    for c, configuracao in enumerate(configuracoes):
+        # só é falha quando outra configuração achou solução (instâncias
+        # inviáveis para todas não contam contra nenhuma)
+        falhas = sum(1 for n in range(len(instancias))
+                     if math.isinf(objetivos[(c, n)]) and math.isfinite(melhor[n]))
+        gaps = [abs(objetivos[(c, n)] - melhor[n]) / max(1.0, abs(melhor[n]))
+                for n in range(len(instancias))
+                if math.isfinite(objetivos[(c, n)]) and math.isfinite(melhor[n])]
+        classificacao.append(Classificacao(
+            configuracao=configuracao,
+            media=statistics.mean(tempos[c]),
+            p95=percentil(tempos[c], 95),
+            falhas=falhas,
+            gap_max=max(gaps, default=0.0),
+        ))
+
+    # sem falhas primeiro, depois menor tempo médio e menor P95
+    classificacao.sort(key=lambda r: (r.falhas, r.media, r.p95))
+    return classificacao
+
+
+def _descrever(configuracao: Configuracao) -> str:
+    ativas = {k: v for k, v in configuracao.items() if v is not None}
+    return ", ".join(f"{k}={v}" for k, v in ativas.items()) or "padrão"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ajuste de parâmetros do CBC para o modelo de escalas")
+    parser.add_argument("--modo", choices=["grade", "aleatorio"], default="aleatorio")
+    parser.add_argument("--amostras", type=int, default=20,
+                        help="configurações sorteadas no modo aleatório")
+    parser.add_argument("--instancias", type=int, default=3,
+                        help="instâncias por tamanho de cenário")
+    parser.add_argument("--processos", type=int, default=os.cpu_count())
+    parser.add_argument("--limite-tempo", type=float, default=60.0,
+                        help="timeLimit do CBC por execução (s)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--saida", default="cbc_ajustado.json",
+                        help="arquivo JSON do solver vencedor")
+    parser.add_argument("--tolerancia-gap", type=float, default=0.01,
+                        help="maior afastamento relativo do melhor objetivo aceito para a vencedora")
+    args = parser.parse_args()
+
+    configuracoes = gerar_configuracoes(args.modo, args.amostras, args.seed)
+    instancias = gerar_instancias(args.instancias, args.seed)
+    print(f"Avaliando {len(configuracoes)} configurações em {len(instancias)} instâncias "
+          f"com {args.processos} processos...")
+
+    classificacao = ajustar(configuracoes, instancias, args.processos, args.limite_tempo)
+
+    print(f"\n{'#':>3} | {'média':>8} | {'P95':>8} | {'falhas':>6} | {'gap máx':>8} | configuração")
+    for posicao, r in enumerate(classificacao, start=1):
+        print(f"{posicao:3d} | {r.media:7.3f}s | {r.p95:7.3f}s | {r.falhas:6d} | "
+              f"{r.gap_max:8.4f} | {_descrever(r.configuracao)}")
+
+    # a vencedora não pode sacrificar a qualidade da solução além da tolerância
+    aceitas = [r for r in classificacao if r.falhas == 0 and r.gap_max <= args.tolerancia_gap]
+    if not aceitas:
+        print("\nNenhuma configuração resolveu todas as instâncias dentro da tolerância.")
+        return
+    vencedora = aceitas[0]
+    solver = pulp.PULP_CBC_CMD(msg=False, **vencedora.configuracao)
+    solver.toJson(args.saida)
+    print(f"\nVencedora: {_descrever(vencedora.configuracao)} "
+          f"(média {vencedora.media:.3f}s, P95 {vencedora.p95:.3f}s)")
+    print(f"Solver salvo em {args.saida}; use pulp.getSolverFromJson('{args.saida}')")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmark_expressoes.py
+"""Microbenchmark da montagem de expressões do modelo de escalas.
+
+Mede, sobre a mesma instância, a função objetivo e as linhas de cobertura de
+build_model_from_data montadas de duas formas:
+
+* genérico: como o pulp fazia antes, `coef * var` passando por uma expressão
+  de um termo (LpAffineExpression(var) * coef) e a soma por
+  LpAffineExpression().addInPlace, que testa o tipo de cada termo;
+* rápido: `coef * var` e pulp.lpSum atuais, que criam o termo direto e
+  escrevem variáveis e expressões no dicionário da soma.
+
+Uso:
+    python benchmark_expressoes.py --tamanho 2000 6 4 --repeticoes 5
+"""
+from typing import Callable, Dict, List
+import argparse
+import statistics
+import time
+
+import pulp
+
+from cenarios_comparacao import gerar_dados_aleatorios
+from solver import Dados, valid_index_sets
+
+
+def _termo_generico(coef, var):
+    return pulp.LpAffineExpression(var) * coef
+
+
+def _soma_generica(termos):
+    return pulp.LpAffineExpression().addInPlace(termos)
+
+
+def _termo_rapido(coef, var):
+    return coef * var
+
+
+MODOS = {
+    "genérico": (_termo_generico, _soma_generica),
+    "rápido": (_termo_rapido, pulp.lpSum),
+}
+
+
+def montar_expressoes(dados: Dados, termo: Callable, soma: Callable) -> Dict[str, float]:
+    """Tempo (s) para montar o objetivo, as linhas de skill e as de cobertura"""
+    (employees, shifts, lines, shift_cost, employee_cost,
+     availability, skill_level, shift_class, min_skill_required, min_cover) = dados
+    x_keys, available = valid_index_sets(dados)
+    x_vars = {(i, j): pulp.LpVariable(f"X_{i}_{j}", cat=pulp.LpBinary) for (i, j) in x_keys}
+    w_vars = {(i, j, k): pulp.LpVariable(f"W_{i}_{j}_{k}", cat=pulp.LpBinary)
+              for (j, k), colabs in available.items() for i in colabs}
+
+    tempos = {}
+    inicio = time.perf_counter()
+    soma(termo(shift_cost[j] + employee_cost[i], x_vars[(i, j)]) for (i, j) in x_keys)
+    tempos["objetivo"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for (j, k), colabs in available.items():
+        soma(termo(skill_level[(i, k)], w_vars[(i, j, k)]) for i in colabs if skill_level[(i, k)])
+    tempos["skill"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for (j, k), colabs in available.items():
+        soma(w_vars[(i, j, k)] for i in colabs)
+    tempos["cobertura"] = time.perf_counter() - inicio
+    return tempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de lpSum e coef * var")
+    parser.add_argument("--tamanho", type=int, nargs=3, default=[2000, 6, 4],
+                        metavar=("COLABORADORES", "TURNOS", "LINHAS"))
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    dados = gerar_dados_aleatorios(*args.tamanho)
+    medidas: Dict[str, Dict[str, List[float]]] = {modo: {} for modo in MODOS}
+    for _ in range(args.repeticoes):
+        for modo, (termo, soma) in MODOS.items():
+            for parte, tempo in montar_expressoes(dados, termo, soma).items():
+                medidas[modo].setdefault(parte, []).append(tempo)
+
+    print(f"{'parte':10} | {'genérico':>10} | {'rápido':>10} | {'ganho':>6}")
+    for parte in medidas["rápido"]:
+        generico = statistics.median(medidas["genérico"][parte])
+        rapido = statistics.median(medidas["rápido"][parte])
+        print(f"{parte:10} | {generico * 1000:8.1f}ms | {rapido * 1000:8.1f}ms | "
+              f"{generico / rapido:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# cortes_habilidade.py
+"""Desigualdades válidas para as restrições de cobertura de skill.
+
+Para cada turno j e linha k, a restrição
+
+    sum_i skill_level[i,k] * W[i,j,k] >= min_skill_required[k]
+
+é uma mochila de cobertura sobre binárias. Como W[i,j,k] = 0 quando o
+colaborador não atende a linha, o coeficiente efetivo é
+a_i = skill_level[i,k] * availability[i,k]. Dela e da linha de cardinalidade
+sum_i W[i,j,k] >= min_cover[k] derivamos, antes de resolver:
+
+* cardinalidade reforçada: se são necessários pelo menos p colaboradores
+  (os p maiores a_i) para atingir o skill mínimo e p > min_cover[k], a linha
+  de cardinalidade passa a sum_i W[i,j,k] >= p;
+* coberturas estendidas (lifted cover): para cada limiar t, seja
+  L = {i : a_i <= t}. Se sum_{i in L} a_i < min_skill_required[k], mesmo
+  escalando todos de L faltam skills, então precisamos de pelo menos r
+  colaboradores de H = {i : a_i > t}, onde r é o menor número dos maiores a_i
+  de H que cobre o que falta: sum_{i in H} W[i,j,k] >= r.
+
+Uso (benchmark contra a formulação original nos tamanhos de testar_cenarios):
+    python cortes_habilidade.py
+"""
+from typing import Dict, List, Tuple
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import pulp
+
+from solver import Dados, build_model_from_data, cbc_node_count
+
+# (linha, colaboradores, lado direito, descrição)
+Corte = Tuple[int, List[int], int, str]
+
+
+def _minimo_de_colaboradores(skills: List[int], falta: float) -> int:
+    """Menor quantidade dos maiores skills cuja soma atinge `falta`"""
+    if falta <= 0:
+        return 0
+    total = 0
+    for quantidade, a in enumerate(sorted(skills, reverse=True), start=1):
+        total += a
+        if total >= falta:
+            return quantidade
+    return len(skills) + 1
+
+
+def gerar_cortes(dados: Dados) -> List[Corte]:
+    """Desigualdades de cobertura e cobertura estendida para cada linha
+
+    Elas valem igualmente para todos os turnos, por isso não dependem de j.
+    """
+    (employees, _shifts, lines, _shift_cost, _employee_cost,
+     availability, skill_level, _shift_class, min_skill_required, min_cover) = dados
+
+    cortes: List[Corte] = []
+    for k in lines:
+        a = {i: skill_level[(i, k)] * availability[(i, k)] for i in employees}
+        positivos = [i for i in employees if a[i] > 0]
+        b = min_skill_required[k]
+        if sum(a[i] for i in positivos) < b:
+            # a linha é inviável por si só; o CBC detecta sem ajuda
+            continue
+
+        # cardinalidade reforçada (colaboradores com skill 0 contam para
+        # min_cover, por isso a soma é sobre todos os disponíveis)
+        p = _minimo_de_colaboradores([a[i] for i in positivos], b)
+        if p > min_cover[k]:
+            disponiveis = [i for i in employees if availability[(i, k)] == 1]
+            cortes.append((k, disponiveis, p, "cardinalidade"))
+
+        # coberturas estendidas por limiar de skill (t = 0: só quem tem skill)
+        for t in [0] + sorted({a[i] for i in positivos}):
+            soma_baixos = sum(a[i] for i in positivos if a[i] <= t)
+            if soma_baixos >= b:
+                break
+            altos = [i for i in positivos if a[i] > t]
+            r = _minimo_de_colaboradores([a[i] for i in altos], b - soma_baixos)
+            if altos and r >= 1:
+                cortes.append((k, altos, r, f"cobertura_t{t}"))
+    return cortes
+
+
+def adicionar_cortes(model: pulp.LpProblem, w_vars: Dict[Tuple[int, int, int], pulp.LpVariable],
+                     dados: Dados) -> int:
+    """Adiciona ao modelo os cortes de gerar_cortes em todos os turnos
+
+    Só entram as W do modelo: sem `allow_swap`, build_model_from_data não cria
+    as do período oposto, e o corte continua válido sem elas (valem 0).
+    """
+    shifts = dados[1]
+    n = 0
+    for k, colaboradores, rhs, descricao in gerar_cortes(dados):
+        for j in shifts:
+            model += (pulp.lpSum(w_vars[(i, j, k)] for i in colaboradores
+                                 if (i, j, k) in w_vars) >= rhs,
+                      f"Corte_{descricao}_j{j}_k{k}")
+            n += 1
+    return n
+
+
+def _resolver(dados: Dados, com_cortes: bool, limite_tempo: float) -> Tuple[str, float, float, int, int]:
+    model, _x, w_vars, _swap = build_model_from_data(dados)
+    n_cortes = adicionar_cortes(model, w_vars, dados) if com_cortes else 0
+    fd, log_path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        model.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=limite_tempo, logPath=log_path))
+        nos = cbc_node_count(log_path)
+    finally:
+        os.remove(log_path)
+    status = pulp.LpStatus[model.status]
+    custo = pulp.value(model.objective) if status in ["Optimal", "Feasible"] else float("inf")
+    return status, custo, model.solutionTime, nos, n_cortes
+
+
+def benchmark(instancias_por_cenario: int = 5, limite_tempo: float = 120.0, seed: int = 42):
+    """Nós e tempo do CBC com e sem os cortes nos cenários de testar_cenarios"""
+    from cenarios_comparacao import gerar_dados_aleatorios
+
+    cenarios = [
+        ("Cenário 1: Mais Colaboradores", 36, 4, 3),
+        ("Cenário 2: Mais Turnos", 18, 8, 3),
+        ("Cenário 3: Mais Linhas", 18, 4, 6),
+        ("Cenário 4: Completo", 24, 6, 4),
+    ]
+    random.seed(seed)
+    print(f"{'cenário':32} | {'formulação':10} | {'nós (média)':>11} | "
+          f"{'tempo (média)':>13} | {'tempo (máx)':>11} | cortes")
+    for nome, n_colabs, n_turnos, n_linhas in cenarios:
+        instancias = [gerar_dados_aleatorios(n_colabs, n_turnos, n_linhas)
+                      for _ in range(instancias_por_cenario)]
+        for com_cortes in (False, True):
+            resultados = [_resolver(dados, com_cortes, limite_tempo) for dados in instancias]
+            # instâncias inviáveis não entram nas médias
+            viaveis = [r for r in resultados if r[0] in ["Optimal", "Feasible"]]
+            if not viaveis:
+                continue
+            print(f"{nome:32} | {'reforçada' if com_cortes else 'original':10} | "
+                  f"{statistics.mean(r[3] for r in viaveis):11.1f} | "
+                  f"{statistics.mean(r[2] for r in viaveis):12.2f}s | "
+                  f"{max(r[2] for r in viaveis):10.2f}s | "
+                  f"{statistics.mean(r[4] for r in viaveis):.0f}")
+
+
+if __name__ == "__main__":
+    start_time = time.time()
+    benchmark()
+    print(f"\nTempo total: {time.time() - start_time:.1f}s")
@@ -0,0 +1,222 @@
+# escala_robusta.py
+"""Escala robusta/estocástica sobre cenários amostrados de demanda.
+
+A demanda (min_cover e min_skill_required) é incerta: sorteamos S cenários,
+cada um com a sua demanda por (turno, linha), e montamos um único modelo em
+forma estendida:
+
+* primeiro estágio, compartilhado por todos os cenários: X[i,j] e Swap[i];
+* para cada (j, k), as variáveis agregadas Pessoas[j,k] = sum_i Y_ik X_ij e
+  Skill[j,k] = sum_i skill_ik Y_ik X_ij são definidas UMA vez (substituem
+  W = X·Y, que só servia para essas somas);
+* recurso por cenário: as faltas FaltaPessoas[s,j,k] e FaltaSkill[s,j,k],
+  com linhas de dois termos, Pessoas[j,k] + FaltaPessoas[s,j,k] >= demanda.
+
+Assim cada cenário acrescenta só 2·|turnos|·|linhas| linhas de 2 termos, e a
+construção cresce linearmente em S sem repetir as somas sobre colaboradores.
+
+Modos:
+* "estocastico": minimiza custo + média da penalidade de falta nos cenários;
+* "robusto": minimiza custo + pior penalidade de falta (epígrafe Z >= falta_s).
+
+Uso:
+    python escala_robusta.py --cenarios 10 100 500
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+import pulp
+
+from solver import Dados, default_data, is_night_shift
+
+# (pessoas exigidas por (j, k), skill exigido por (j, k)) de um cenário
+Demanda = Tuple[Dict[Tuple[int, int], int], Dict[Tuple[int, int], int]]
+
+MODOS = ("estocastico", "robusto")
+
+
+@dataclass
+class ResultadoRobusto:
+    modo: str
+    cenarios: int
+    status: str
+    custo_escala: float      # salários + penalidade de troca
+    falta_media: float       # penalidade de falta média nos cenários
+    falta_pior: float        # penalidade de falta no pior cenário
+    tempo_construcao: float
+    tempo_solver: float
+    escala: Dict[int, Optional[int]]
+
+
+def amostrar_demandas(dados: Dados, n_cenarios: int, variacao: float = 0.3,
+                      seed: Optional[int] = None) -> List[Demanda]:
+    """Sorteia demandas por (turno, linha) em [1 - variacao, 1 + variacao] da nominal"""
+    shifts, lines = dados[1], dados[2]
+    min_skill_required, min_cover = dados[8], dados[9]
+    rng = random.Random(seed)
+    demandas = []
+    for _ in range(n_cenarios):
+        pessoas = {(j, k): max(0, round(min_cover[k] * rng.uniform(1 - variacao, 1 + variacao)))
+                   for j in shifts for k in lines}
+        skill = {(j, k): max(0, round(min_skill_required[k] * rng.uniform(1 - variacao, 1 + variacao)))
+                 for j in shifts for k in lines}
+        demandas.append((pessoas, skill))
+    return demandas
+
+
+def build_modelo_robusto(dados: Dados, demandas: List[Demanda], modo: str = "estocastico",
+                         penalidade_pessoa: float = 1000, penalidade_skill: float = 200,
+                         swap_penalty: float = 5000, cobertura_nominal: bool = True):
+    """Forma estendida sobre os cenários de `demandas`
+
+    Com `cobertura_nominal`, a demanda nominal dos dados continua obrigatória e os
+    cenários só penalizam o que exceder a escala.
+
+    :return: (model, x_vars, swap, falta), onde falta[s] é a expressão da
+        penalidade de falta do cenário s
+    """
+    if modo not in MODOS:
+        raise ValueError(f"modo deve ser um de {MODOS}: {modo}")
+    (employees, shifts, lines, shift_cost, employee_cost,
+     availability, skill_level, shift_class, min_skill_required, min_cover) = dados
+
+    model = pulp.LpProblem(f"Escalas_{modo}", pulp.LpMinimize)
+
+    # Primeiro estágio (compartilhado)
+    x_vars = {(i, j): pulp.LpVariable(f"X_{i}_{j}", cat=pulp.LpBinary)
+              for i in employees for j in shifts}
+    swap = {i: pulp.LpVariable(f"Swap_{i}", cat=pulp.LpBinary) for i in employees}
+    pessoas = {(j, k): pulp.LpVariable(f"Pessoas_{j}_{k}", lowBound=0)
+               for j in shifts for k in lines}
+    skill = {(j, k): pulp.LpVariable(f"Skill_{j}_{k}", lowBound=0)
+             for j in shifts for k in lines}
+
+    for i in employees:
+        model += pulp.lpSum(x_vars[(i, j)] for j in shifts) <= 1, f"Um_turno_{i}"
+        cat_period = "D" if "D" in shift_class[i] else "N"
+        for j in shifts:
+            if is_night_shift(j, shift_cost) == (cat_period == "D"):
+                model += swap[i] >= x_vars[(i, j)], f"Troca_{i}_{j}"
+
+    # Agregados definidos uma única vez por (j, k)
+    for j in shifts:
+        for k in lines:
+            atendem = [i for i in employees if availability[(i, k)] == 1]
+            definicao = pulp.LpAffineExpression([(x_vars[(i, j)], -1) for i in atendem])
+            definicao[pessoas[(j, k)]] = 1
+            model += pulp.LpConstraint(definicao, pulp.LpConstraintEQ, f"Def_pessoas_{j}_{k}", 0)
+            definicao = pulp.LpAffineExpression(
+                [(x_vars[(i, j)], -skill_level[(i, k)]) for i in atendem if skill_level[(i, k)]])
+            definicao[skill[(j, k)]] = 1
+            model += pulp.LpConstraint(definicao, pulp.LpConstraintEQ, f"Def_skill_{j}_{k}", 0)
+            if cobertura_nominal:
+                model += pessoas[(j, k)] >= min_cover[k], f"Nominal_pessoas_{j}_{k}"
+                model += skill[(j, k)] >= min_skill_required[k], f"Nominal_skill_{j}_{k}"
+
+    # Recurso por cenário: linhas de dois termos montadas diretamente
+    falta = []
+    for s, (pessoas_s, skill_s) in enumerate(demandas):
+        termos = []
+        for j in shifts:
+            for k in lines:
+                fp = pulp.LpVariable(f"FaltaPessoas_{s}_{j}_{k}", lowBound=0)
+                fs = pulp.LpVariable(f"FaltaSkill_{s}_{j}_{k}", lowBound=0)
+                model.addConstraint(pulp.LpConstraint(
+                    pulp.LpAffineExpression([(pessoas[(j, k)], 1), (fp, 1)]),
+                    pulp.LpConstraintGE, f"Cen_pessoas_{s}_{j}_{k}", pessoas_s[(j, k)]))
+                model.addConstraint(pulp.LpConstraint(
+                    pulp.LpAffineExpression([(skill[(j, k)], 1), (fs, 1)]),
+                    pulp.LpConstraintGE, f"Cen_skill_{s}_{j}_{k}", skill_s[(j, k)]))
+                termos.append((fp, penalidade_pessoa))
+                termos.append((fs, penalidade_skill))
+        falta.append(pulp.LpAffineExpression(termos))
+
+    custo = pulp.LpAffineExpression(
+        [(x_vars[(i, j)], shift_cost[j] + employee_cost[i]) for i in employees for j in shifts]
+        + [(swap[i], swap_penalty) for i in employees])
+    if modo == "estocastico":
+        peso = 1.0 / max(1, len(demandas))
+        model += custo + pulp.LpAffineExpression(
+            [(v, c * peso) for expr in falta for v, c in expr.items()])
+    else:
+        pior = pulp.LpVariable("Falta_pior", lowBound=0)
+        for s, expr in enumerate(falta):
+            linha = pulp.LpAffineExpression(expr)
+            linha[pior] = -1
+            model.addConstraint(pulp.LpConstraint(linha, pulp.LpConstraintLE, f"Epigrafe_{s}", 0))
+        model += custo + pior
+
+    return model, x_vars, swap, falta
+
+
+def resolver_robusto(dados: Dados, demandas: List[Demanda], modo: str = "estocastico",
+                     limite_tempo: Optional[float] = None, **kwargs) -> ResultadoRobusto:
+    start_time = time.time()
+    model, x_vars, swap, falta = build_modelo_robusto(dados, demandas, modo, **kwargs)
+    tempo_construcao = time.time() - start_time
+
+    model.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=limite_tempo))
+    status = pulp.LpStatus[model.status]
+    if status not in ["Optimal", "Feasible"]:
+        return ResultadoRobusto(modo=modo, cenarios=len(demandas), status=status,
+                                custo_escala=float("inf"), falta_media=float("inf"),
+                                falta_pior=float("inf"), tempo_construcao=tempo_construcao,
+                                tempo_solver=model.solutionTime, escala={})
+
+    shift_cost, employee_cost = dados[3], dados[4]
+    swap_penalty = kwargs.get("swap_penalty", 5000)
+    escala = {i: None for i in dados[0]}
+    custo_escala = 0.0
+    for (i, j), var in x_vars.items():
+        if var.value() > 0.5:
+            escala[i] = j
+            custo_escala += shift_cost[j] + employee_cost[i]
+    custo_escala += swap_penalty * sum(var.value() for var in swap.values())
+    valores = [expr.value() for expr in falta] or [0.0]
+
+    return ResultadoRobusto(
+        modo=modo,
+        cenarios=len(demandas),
+        status=status,
+        custo_escala=custo_escala,
+        falta_media=statistics.mean(valores),
+        falta_pior=max(valores),
+        tempo_construcao=tempo_construcao,
+        tempo_solver=model.solutionTime,
+        escala=escala,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escala robusta sobre cenários de demanda")
+    parser.add_argument("--cenarios", type=int, nargs="+", default=[10, 100, 500],
+                        help="quantidades de cenários a testar")
+    parser.add_argument("--variacao", type=float, default=0.3,
+                        help="variação relativa da demanda em torno da nominal")
+    parser.add_argument("--limite-tempo", type=float, default=60.0, help="timeLimit do CBC (s)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    dados = default_data()
+    print(f"{'modo':12} | {'S':>5} | {'construção':>10} | {'memória':>9} | {'solver':>8} | "
+          f"{'custo escala':>12} | {'falta média':>11} | {'falta pior':>10}")
+    for n_cenarios in args.cenarios:
+        demandas = amostrar_demandas(dados, n_cenarios, args.variacao, args.seed)
+        for modo in MODOS:
+            tracemalloc.start()
+            build_modelo_robusto(dados, demandas, modo)
+            memoria = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            r = resolver_robusto(dados, demandas, modo, args.limite_tempo)
+            print(f"{modo:12} | {n_cenarios:5d} | {r.tempo_construcao:9.2f}s | "
+                  f"{memoria:7.1f}MB | {r.tempo_solver:7.2f}s | {r.custo_escala:12.2f} | "
+                  f"{r.falta_media:11.2f} | {r.falta_pior:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# instancias.py
+"""Leitura e escrita de instâncias de escala em arquivos JSON ou CSV.
+
+O arquivo guarda a mesma tupla de dados de gerar_dados_aleatorios/default_data.
+No JSON, parâmetros indexados por (colaborador, linha) são gravados como listas
+[i, k, valor], já que JSON não aceita tuplas como chave.
+
+O CSV tem uma linha por valor, com cabeçalho parametro,indice1,indice2,valor
+(indice2 vazio para parâmetros de um índice):
+
+    parametro,indice1,indice2,valor
+    shift_cost,1,,1
+    employee_cost,1,,100.0
+    availability,1,1,1
+    skill_level,1,1,5
+    shift_class,1,,MDA
+    min_skill_required,1,,6
+    min_cover,1,,1
+
+Colaboradores, turnos e linhas são as chaves de employee_cost, shift_cost e
+min_cover, respectivamente.
+"""
+from typing import List
+import csv
+import json
+import os
+
+from solver import Dados
+
+EXTENSOES = (".json", ".csv")
+
+CABECALHO_CSV = ["parametro", "indice1", "indice2", "valor"]
+
+
+def dados_para_dict(dados: Dados) -> dict:
+    (employees, shifts, lines, shift_cost, employee_cost,
+     availability, skill_level, shift_class, min_skill_required, min_cover) = dados
+    return {
+        "employees": list(employees),
+        "shifts": list(shifts),
+        "lines": list(lines),
+        "shift_cost": {str(j): c for j, c in shift_cost.items()},
+        "employee_cost": {str(i): c for i, c in employee_cost.items()},
+        "availability": [[i, k, v] for (i, k), v in availability.items()],
+        "skill_level": [[i, k, v] for (i, k), v in skill_level.items()],
+        "shift_class": {str(i): c for i, c in shift_class.items()},
+        "min_skill_required": {str(k): v for k, v in min_skill_required.items()},
+        "min_cover": {str(k): v for k, v in min_cover.items()},
+    }
+
+
+def dict_para_dados(data: dict) -> Dados:
+    return (
+        list(data["employees"]),
+        list(data["shifts"]),
+        list(data["lines"]),
+        {int(j): c for j, c in data["shift_cost"].items()},
+        {int(i): c for i, c in data["employee_cost"].items()},
+        {(i, k): v for i, k, v in data["availability"]},
+        {(i, k): v for i, k, v in data["skill_level"]},
+        {int(i): c for i, c in data["shift_class"].items()},
+        {int(k): v for k, v in data["min_skill_required"].items()},
+        {int(k): v for k, v in data["min_cover"].items()},
+    )
+
+
+def _salvar_csv(dados: Dados, caminho: str) -> None:
+    (_employees, _shifts, _lines, shift_cost, employee_cost,
+     availability, skill_level, shift_class, min_skill_required, min_cover) = dados
+    with open(caminho, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CABECALHO_CSV)
+        for parametro, valores in (("shift_cost", shift_cost), ("employee_cost", employee_cost),
+                                   ("shift_class", shift_class),
+                                   ("min_skill_required", min_skill_required),
+                                   ("min_cover", min_cover)):
+            writer.writerows([parametro, chave, "", valor] for chave, valor in valores.items())
+        for parametro, valores in (("availability", availability), ("skill_level", skill_level)):
+            writer.writerows([parametro, i, k, valor] for (i, k), valor in valores.items())
+
+
+def _carregar_csv(caminho: str) -> Dados:
+    tipos = {"shift_cost": int, "employee_cost": float, "availability": int,
+             "skill_level": int, "shift_class": str, "min_skill_required": int, "min_cover": int}
+    parametros = {nome: {} for nome in tipos}
+    with open(caminho, newline="") as f:
+        for linha in csv.DictReader(f):
+            nome = linha["parametro"]
+            if nome not in tipos:
+                raise ValueError(f"{caminho}: parâmetro desconhecido {nome!r}")
+            chave = int(linha["indice1"])
+            if linha["indice2"]:
+                chave = (chave, int(linha["indice2"]))
+            parametros[nome][chave] = tipos[nome](linha["valor"])
+    return (
+        sorted(parametros["employee_cost"]),
+        sorted(parametros["shift_cost"]),
+        sorted(parametros["min_cover"]),
+        parametros["shift_cost"],
+        parametros["employee_cost"],
+        parametros["availability"],
+        parametros["skill_level"],
+        parametros["shift_class"],
+        parametros["min_skill_required"],
+        parametros["min_cover"],
+    )
+
+
+def salvar_instancia(dados: Dados, caminho: str) -> None:
+    """Grava em CSV se a extensão for .csv, senão em JSON"""
+    if caminho.endswith(".csv"):
+        _salvar_csv(dados, caminho)
+        return
+    with open(caminho, "w") as f:
+        json.dump(dados_para_dict(dados), f)
+
+
+def carregar_instancia(caminho: str) -> Dados:
+    """Lê CSV se a extensão for .csv, senão JSON"""
+    if caminho.endswith(".csv"):
+        return _carregar_csv(caminho)
+    with open(caminho) as f:
+        return dict_para_dados(json.load(f))
+
+
+def listar_instancias(caminhos: List[str]) -> List[str]:
+    """Expande diretórios nos arquivos de instância que contêm (ordem alfabética)"""
+    arquivos = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            arquivos.extend(
+                os.path.join(caminho, nome)
+                for nome in sorted(os.listdir(caminho))
+                if nome.endswith(EXTENSOES)
+            )
+        else:
+            arquivos.append(caminho)
+    return arquivos
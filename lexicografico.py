@@ -0,0 +1,159 @@
+# lexicografico.py
+"""Objetivos lexicográficos para a escala, sem a penalidade 5000 * swap.
+
+Em vez de somar 5000 * swap[i] ao custo (coeficientes grandes pioram o
+condicionamento do LP e o desempenho do CBC), resolve em dois estágios com
+LpProblem.sequentialSolve: primeiro minimiza o número de trocas Diurno↔Noturno
+e depois minimiza o custo com o número de trocas limitado ao ótimo do primeiro
+estágio. Cada estágio parte (warmStart) da solução do anterior; o primeiro
+parte da escala gulosa, quando ela existe.
+
+Uso (comparação com a versão big-M nos tamanhos de testar_cenarios):
+    python lexicografico.py
+"""
+from typing import List, Optional, Tuple
+import os
+import random
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+
+import pulp
+
+from lns_escalas import aplicar_escala, escala_gulosa
+from solver import Dados, build_model_from_data, cbc_node_count
+
+
+class _CBCComEstatisticas(pulp.PULP_CBC_CMD):
+    """PULP_CBC_CMD que guarda o tempo e os nós de cada chamada ao CBC.
+
+    sequentialSolve usa o mesmo solver em todos os estágios, e o log do CBC
+    é sobrescrito a cada chamada; por isso cada chamada usa um log próprio.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.estagios: List[Tuple[float, int]] = []  # (tempo, nós)
+
+    def actualSolve(self, lp, **kwargs):
+        fd, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(fd)
+        self.optionsDict["logPath"] = log_path
+        start_time = time.time()
+        try:
+            status = super().actualSolve(lp, **kwargs)
+            self.estagios.append((time.time() - start_time, cbc_node_count(log_path)))
+        finally:
+            del self.optionsDict["logPath"]
+            os.remove(log_path)
+        return status
+
+
+@dataclass
+class ResultadoObjetivo:
+    modo: str
+    status: str
+    custo: float          # custo salarial, sem penalidade
+    trocas: int
+    tempo: float
+    nos: int
+    estagios: List[Tuple[float, int]]
+
+
+def _custo_e_trocas(dados: Dados, x_vars, swap) -> Tuple[float, int]:
+    shift_cost, employee_cost = dados[3], dados[4]
+    custo = sum((shift_cost[j] + employee_cost[i]) * var.value()
+                for (i, j), var in x_vars.items())
+    return custo, int(round(sum(var.value() for var in swap.values())))
+
+
+def resolver_lexicografico(dados: Dados, limite_tempo: Optional[float] = None) -> ResultadoObjetivo:
+    """Minimiza trocas e, depois, custo (dois estágios com warmStart)"""
+    (employees, shifts, _lines, shift_cost, employee_cost,
+     _availability, _skill_level, _shift_class, _min_skill_required, _min_cover) = dados
+
+    model, x_vars, w_vars, swap = build_model_from_data(dados, swap_penalty=0)
+    trocas = pulp.lpSum(swap[i] for i in employees)
+    custo = pulp.lpSum((shift_cost[j] + employee_cost[i]) * x_vars[(i, j)]
+                       for i in employees for j in shifts)
+
+    try:
+        aplicar_escala(escala_gulosa(dados), dados, x_vars, w_vars, swap)
+    except ValueError:
+        pass  # sem escala gulosa, o primeiro estágio parte do zero
+
+    solver = _CBCComEstatisticas(msg=False, warmStart=True, timeLimit=limite_tempo)
+    # trocas são inteiras: a folga de 0.5 só absorve erros de arredondamento
+    statuses = model.sequentialSolve([trocas, custo], absoluteTols=[0.5, 0], solver=solver)
+
+    status = pulp.LpStatus[statuses[-1]]
+    if status not in ["Optimal", "Feasible"]:
+        valor, n_trocas = float("inf"), 0
+    else:
+        valor, n_trocas = _custo_e_trocas(dados, x_vars, swap)
+    return ResultadoObjetivo(
+        modo="lexicografico", status=status, custo=valor, trocas=n_trocas,
+        tempo=sum(t for t, _n in solver.estagios),
+        nos=sum(n for _t, n in solver.estagios),
+        estagios=solver.estagios,
+    )
+
+
+def resolver_big_m(dados: Dados, limite_tempo: Optional[float] = None,
+                   swap_penalty: float = 5000) -> ResultadoObjetivo:
+    """Formulação original: custo + swap_penalty * trocas num único objetivo"""
+    model, x_vars, _w_vars, swap = build_model_from_data(dados, swap_penalty)
+    solver = _CBCComEstatisticas(msg=False, timeLimit=limite_tempo)
+    model.solve(solver)
+
+    status = pulp.LpStatus[model.status]
+    if status not in ["Optimal", "Feasible"]:
+        valor, n_trocas = float("inf"), 0
+    else:
+        valor, n_trocas = _custo_e_trocas(dados, x_vars, swap)
+    return ResultadoObjetivo(
+        modo="big_m", status=status, custo=valor, trocas=n_trocas,
+        tempo=sum(t for t, _n in solver.estagios),
+        nos=sum(n for _t, n in solver.estagios),
+        estagios=solver.estagios,
+    )
+
+
+def comparar(instancias_por_cenario: int = 5, limite_tempo: float = 120.0, seed: int = 42):
+    """Tempo total e nós das duas abordagens nos cenários de testar_cenarios"""
+    from cenarios_comparacao import gerar_dados_aleatorios
+
+    cenarios = [
+        ("Cenário 1: Mais Colaboradores", 36, 4, 3),
+        ("Cenário 2: Mais Turnos", 18, 8, 3),
+        ("Cenário 3: Mais Linhas", 18, 4, 6),
+        ("Cenário 4: Completo", 24, 6, 4),
+    ]
+    random.seed(seed)
+    print(f"{'cenário':32} | {'modo':13} | {'nós (média)':>11} | "
+          f"{'tempo (média)':>13} | {'tempo (máx)':>11} | diferenças")
+    for nome, n_colabs, n_turnos, n_linhas in cenarios:
+        instancias = [gerar_dados_aleatorios(n_colabs, n_turnos, n_linhas)
+                      for _ in range(instancias_por_cenario)]
+        big_m = [resolver_big_m(dados, limite_tempo) for dados in instancias]
+        lex = [resolver_lexicografico(dados, limite_tempo) for dados in instancias]
+        # instâncias inviáveis não entram nas médias
+        pares = [(b, l) for b, l in zip(big_m, lex) if b.status in ["Optimal", "Feasible"]]
+        if not pares:
+            continue
+        # as duas abordagens devem chegar às mesmas trocas e ao mesmo custo
+        diferencas = sum(1 for b, l in pares
+                         if b.trocas != l.trocas or abs(b.custo - l.custo) > 1e-6)
+        for modo, resultados in (("big-M", [b for b, _l in pares]),
+                                 ("lexicográfico", [l for _b, l in pares])):
+            print(f"{nome:32} | {modo:13} | "
+                  f"{statistics.mean(r.nos for r in resultados):11.1f} | "
+                  f"{statistics.mean(r.tempo for r in resultados):12.2f}s | "
+                  f"{max(r.tempo for r in resultados):10.2f}s | {diferencas}")
+
+
+if __name__ == "__main__":
+    start_time = time.time()
+    comparar()
+    print(f"\nTempo total: {time.time() - start_time:.1f}s")
@@ -0,0 +1,211 @@
+# lns_escalas.py
+"""Busca em vizinhança grande (LNS) para escalas com milhares de colaboradores.
+
+Parte de uma escala viável e, a cada iteração, libera uma vizinhança
+(um turno, uma linha ou um subconjunto aleatório de colaboradores), fixa as
+demais variáveis X pelos limites e resolve o subproblema com o CBC sob um
+`timeLimit` curto. O mesmo LpProblem é reaproveitado em todas as iterações.
+"""
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import random
+import time
+from dataclasses import dataclass
+
+import pulp
+
+from solver import Dados, build_model_from_data, is_night_shift
+
+# colaborador -> turno alocado (None = não alocado)
+Escala = Dict[int, Optional[int]]
+
+
+@dataclass
+class ResultadoLNS:
+    custo: float
+    escala: Escala
+    tempo: float
+    iteracoes: int
+    melhorias: int
+    trajetoria: List[Tuple[float, float]]  # (tempo decorrido, melhor custo)
+
+
+def _eh_troca(i: int, j: int, dados: Dados) -> bool:
+    """True se alocar i no turno j é uma troca Diurno↔Noturno"""
+    shift_cost, shift_class = dados[3], dados[7]
+    return is_night_shift(j, shift_cost) == ("D" in shift_class[i])
+
+
+def custo_escala(dados: Dados, escala: Escala, swap_penalty: float = 5000) -> float:
+    """Valor da função objetivo de build_model_from_data para uma escala"""
+    shift_cost, employee_cost = dados[3], dados[4]
+    custo = 0.0
+    for i, j in escala.items():
+        if j is not None:
+            custo += shift_cost[j] + employee_cost[i]
+            if _eh_troca(i, j, dados):
+                custo += swap_penalty
+    return custo
+
+
+def escala_gulosa(dados: Dados, allow_swap: bool = True) -> Escala:
+    """Escala viável construída de forma gulosa.
+
+    Para cada turno e linha, aloca colaboradores ainda livres até atingir a
+    cobertura mínima de pessoas e de skill, preferindo quem não troca de
+    período, depois o maior skill na linha e por fim o menor custo. Sem
+    `allow_swap`, quem trocaria de período não é candidato.
+    """
+    (employees, shifts, lines, shift_cost, employee_cost,
+     availability, skill_level, shift_class, min_skill_required, min_cover) = dados
+
+    escala: Escala = {i: None for i in employees}
+    pessoas = {(j, k): 0 for j in shifts for k in lines}
+    skill = {(j, k): 0 for j in shifts for k in lines}
+
+    for j in shifts:
+        for k in lines:
+            while (pessoas[(j, k)] < min_cover[k]
+                   or skill[(j, k)] < min_skill_required[k]):
+                candidatos = [i for i in employees
+                              if escala[i] is None and availability[(i, k)] == 1
+                              and (allow_swap or not _eh_troca(i, j, dados))]
+                if not candidatos:
+                    raise ValueError(
+                        f"Não foi possível cobrir o Turno {j}, Linha {k} de forma gulosa"
+                    )
+                i = min(candidatos, key=lambda i: (_eh_troca(i, j, dados),
+                                                   -skill_level[(i, k)],
+                                                   employee_cost[i] + shift_cost[j]))
+                escala[i] = j
+                for kk in lines:
+                    if availability[(i, kk)] == 1:
+                        pessoas[(j, kk)] += 1
+                        skill[(j, kk)] += skill_level[(i, kk)]
+    return escala
+
+
+def aplicar_escala(escala: Escala, dados: Dados, x_vars, w_vars, swap) -> None:
+    """Carrega a escala nas variáveis (ponto de partida para o warmStart)"""
+    availability = dados[5]
+    for (i, j), var in x_vars.items():
+        var.setInitialValue(1 if escala[i] == j else 0)
+    for (i, j, k), var in w_vars.items():
+        var.setInitialValue(availability[(i, k)] if escala[i] == j else 0)
+    for i, var in swap.items():
+        j = escala[i]
+        var.setInitialValue(1 if j is not None and _eh_troca(i, j, dados) else 0)
+
+
+def _vizinhanca(tipo: str, escala: Escala, dados: Dados, tamanho: int,
+                rng: random.Random) -> Set[int]:
+    """Colaboradores cujas variáveis X serão liberadas na iteração"""
+    employees, shifts, lines, availability = dados[0], dados[1], dados[2], dados[5]
+
+    if tipo == "turno":
+        # quem está no turno sorteado + alguns não alocados para substituí-los
+        j = rng.choice(shifts)
+        no_turno = [i for i in employees if escala[i] == j]
+        livres = [i for i in employees if escala[i] is None]
+        metade = tamanho // 2
+        escolhidos = rng.sample(no_turno, min(len(no_turno), metade))
+        escolhidos += rng.sample(livres, min(len(livres), tamanho - len(escolhidos)))
+        return set(escolhidos)
+    if tipo == "linha":
+        k = rng.choice(lines)
+        aptos = [i for i in employees if availability[(i, k)] == 1]
+        return set(rng.sample(aptos, min(len(aptos), tamanho)))
+    if tipo == "aleatoria":
+        return set(rng.sample(employees, min(len(employees), tamanho)))
+    raise ValueError(f"Vizinhança desconhecida: {tipo}")
+
+
+def lns(
+    dados: Dados,
+    escala_inicial: Optional[Escala] = None,
+    iteracoes: int = 100,
+    tempo_max: float = 60.0,
+    tempo_subproblema: float = 2.0,
+    tamanho: int = 40,
+    vizinhancas: Sequence[str] = ("turno", "linha", "aleatoria"),
+    swap_penalty: float = 5000,
+    allow_swap: bool = True,
+    seed: Optional[int] = None,
+    msg: bool = False,
+) -> ResultadoLNS:
+    """Executa o LNS a partir de `escala_inicial` (ou da escala gulosa)
+
+    `allow_swap` é repassado a build_model_from_data: sem ele só existem as X
+    dos índices válidos do modelo.
+    """
+    start_time = time.time()
+    rng = random.Random(seed)
+    employees = dados[0]
+
+    model, x_vars, w_vars, swap = build_model_from_data(dados, swap_penalty, allow_swap)
+    solver = pulp.PULP_CBC_CMD(msg=False, timeLimit=tempo_subproblema, warmStart=True)
+
+    escala = dict(escala_inicial) if escala_inicial is not None else escala_gulosa(dados, allow_swap)
+    melhor_custo = custo_escala(dados, escala, swap_penalty)
+    trajetoria = [(time.time() - start_time, melhor_custo)]
+    melhorias = 0
+
+    it = 0
+    while it < iteracoes and time.time() - start_time < tempo_max:
+        it += 1
+        tipo = rng.choice(list(vizinhancas))
+        livres = _vizinhanca(tipo, escala, dados, tamanho, rng)
+
+        # fixa X fora da vizinhança pelos limites
+        for (i, j), var in x_vars.items():
+            if i in livres:
+                var.bounds(0, 1)
+            else:
+                v = 1 if escala[i] == j else 0
+                var.bounds(v, v)
+
+        aplicar_escala(escala, dados, x_vars, w_vars, swap)
+        model.solve(solver)
+
+        if model.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+            custo = pulp.value(model.objective)
+            if custo < melhor_custo - 1e-6:
+                melhor_custo = custo
+                melhorias += 1
+                for i in livres:
+                    escala[i] = next((j for j in dados[1] if (i, j) in x_vars
+                                      and x_vars[(i, j)].value() > 0.5), None)
+        trajetoria.append((time.time() - start_time, melhor_custo))
+        if msg:
+            print(f"  it {it:4d} [{tipo:9}] |livres|={len(livres):4d} "
+                  f"custo={melhor_custo:.2f} t={trajetoria[-1][0]:.2f}s")
+
+    # devolve o modelo sem fixações, com a melhor escala carregada
+    for var in x_vars.values():
+        var.bounds(0, 1)
+    aplicar_escala(escala, dados, x_vars, w_vars, swap)
+
+    return ResultadoLNS(
+        custo=melhor_custo,
+        escala={i: escala[i] for i in employees},
+        tempo=time.time() - start_time,
+        iteracoes=it,
+        melhorias=melhorias,
+        trajetoria=trajetoria,
+    )
+
+
+if __name__ == "__main__":
+    from cenarios_comparacao import gerar_dados_aleatorios
+
+    random.seed(42)
+    dados = gerar_dados_aleatorios(2000, 4, 3)
+
+    print("LNS em instância com 2000 colaboradores, 4 turnos, 3 linhas")
+    resultado = lns(dados, iteracoes=30, tempo_max=60, seed=42, msg=True)
+
+    print(f"\nCusto final: {resultado.custo:.2f} "
+          f"({resultado.melhorias} melhorias em {resultado.iteracoes} iterações, "
+          f"{resultado.tempo:.2f}s)")
+    print("Trajetória custo x tempo:")
+    for t, c in resultado.trajetoria:
+        print(f"  {t:7.2f}s  {c:10.2f}")
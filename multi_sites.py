@@ -0,0 +1,171 @@
+# multi_sites.py
+"""Resolução paralela de escalas para vários laboratórios (sites) independentes.
+
+Cada arquivo de instância do diretório é um site. Os sites são construídos e
+resolvidos num pool de processos do tamanho do número de núcleos, os
+resultados são mostrados à medida que ficam prontos e, ao final, é impresso
+um resumo agregado de custo e cobertura. O tempo total fica próximo do site
+mais lento, e não da soma dos tempos.
+
+Uso:
+    python multi_sites.py sites/ --processos 8
+    python multi_sites.py sites/ --gerar 24   # cria 24 sites aleatórios de 18 colaboradores
+"""
+from typing import Dict, Iterator, List, Optional
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import numpy as np
+import pulp
+
+from instancias import carregar_instancia, listar_instancias, salvar_instancia
+from solver import build_model_from_data, solution_view
+
+
+@dataclass
+class ResultadoSite:
+    site: str
+    status: str
+    custo: float
+    tempo: float
+    escalados: int
+    pares_cobertos: int    # pares (turno, linha) com pessoas e skill mínimos
+    pares_total: int
+    cobertura_minima: float  # menor razão atendido/exigido entre pessoas e skill
+    erro: Optional[str] = None  # mensagem quando o site não pôde ser resolvido
+
+
+def resolver_site(caminho: str, limite_tempo: Optional[float] = None) -> ResultadoSite:
+    """Constrói e resolve um site (executado nos processos filhos)"""
+    start_time = time.time()
+    dados = carregar_instancia(caminho)
+    (_employees, shifts, lines, _shift_cost, _employee_cost,
+     _availability, _skill_level, _shift_class, min_skill_required, min_cover) = dados
+
+    model, x_vars, w_vars, _swap = build_model_from_data(dados)
+    # um processo por núcleo: o CBC de cada site usa uma única thread
+    model.solve(pulp.PULP_CBC_CMD(msg=False, threads=1, timeLimit=limite_tempo))
+
+    status = pulp.LpStatus[model.status]
+    site = os.path.splitext(os.path.basename(caminho))[0]
+    pares_total = len(shifts) * len(lines)
+    if status not in ["Optimal", "Feasible"]:
+        return ResultadoSite(site=site, status=status, custo=float("inf"),
+                             tempo=time.time() - start_time, escalados=0,
+                             pares_cobertos=0, pares_total=pares_total, cobertura_minima=0.0)
+
+    view = solution_view(dados, x_vars, w_vars)
+    pessoas = view.coverage()
+    skill = view.skill_sum()
+    exigido_pessoas = np.array([min_cover[k] for k in lines], dtype=float)
+    exigido_skill = np.array([min_skill_required[k] for k in lines], dtype=float)
+    cobertos = (pessoas >= exigido_pessoas) & (skill >= exigido_skill)
+    cobertura_minima = min((pessoas / np.maximum(1, exigido_pessoas)).min(),
+                           (skill / np.maximum(1, exigido_skill)).min())
+
+    return ResultadoSite(
+        site=site,
+        status=status,
+        custo=pulp.value(model.objective),
+        tempo=time.time() - start_time,
+        escalados=int(round(view.x.sum())),
+        pares_cobertos=int(cobertos.sum()),
+        pares_total=pares_total,
+        cobertura_minima=float(cobertura_minima),
+    )
+
+
+def resolver_sites(caminhos: List[str], processos: Optional[int] = None,
+                   limite_tempo: Optional[float] = None) -> Iterator[ResultadoSite]:
+    """Resolve os sites em paralelo, entregando cada resultado assim que fica pronto.
+
+    Um site que falha (arquivo ilegível ou malformado, erro do solver) é
+    entregue com status "Erro" e não interrompe os demais.
+    """
+    arquivos = listar_instancias(caminhos)
+    with ProcessPoolExecutor(max_workers=processos or os.cpu_count()) as executor:
+        futuros = {executor.submit(resolver_site, arquivo, limite_tempo): arquivo
+                   for arquivo in arquivos}
+        for futuro in as_completed(futuros):
+            try:
+                yield futuro.result()
+            except Exception as e:
+                site = os.path.splitext(os.path.basename(futuros[futuro]))[0]
+                yield ResultadoSite(site=site, status="Erro", custo=float("inf"),
+                                    tempo=0.0, escalados=0, pares_cobertos=0,
+                                    pares_total=0, cobertura_minima=0.0,
+                                    erro=f"{type(e).__name__}: {e}")
+
+
+def resumo_agregado(resultados: List[ResultadoSite]) -> Dict[str, float]:
+    """Resumo de custo e cobertura do conjunto de sites"""
+    viaveis = [r for r in resultados if r.status in ["Optimal", "Feasible"]]
+    return {
+        "sites": len(resultados),
+        "viaveis": len(viaveis),
+        "custo_total": sum(r.custo for r in viaveis),
+        "escalados": sum(r.escalados for r in viaveis),
+        "pares_cobertos": sum(r.pares_cobertos for r in resultados),
+        "pares_total": sum(r.pares_total for r in resultados),
+        "cobertura_minima": min((r.cobertura_minima for r in viaveis), default=0.0),
+        "tempo_soma": sum(r.tempo for r in resultados),
+        "tempo_maximo": max((r.tempo for r in resultados), default=0.0),
+    }
+
+
+def gerar_sites(diretorio: str, n_sites: int, seed: int = 42) -> None:
+    """Cria `n_sites` instâncias aleatórias de 18 colaboradores, 4 turnos e 3 linhas"""
+    from cenarios_comparacao import gerar_dados_aleatorios
+
+    os.makedirs(diretorio, exist_ok=True)
+    random.seed(seed)
+    for s in range(1, n_sites + 1):
+        salvar_instancia(gerar_dados_aleatorios(18, 4, 3),
+                         os.path.join(diretorio, f"site_{s:03d}.json"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalas de vários sites em paralelo")
+    parser.add_argument("caminhos", nargs="+", help="diretórios ou arquivos de instância")
+    parser.add_argument("--processos", type=int, default=None,
+                        help="tamanho do pool (padrão: número de núcleos)")
+    parser.add_argument("--limite-tempo", type=float, default=None,
+                        help="timeLimit do CBC por site (s)")
+    parser.add_argument("--gerar", type=int, default=0,
+                        help="gera N sites aleatórios no primeiro diretório antes de resolver")
+    args = parser.parse_args()
+
+    if args.gerar:
+        gerar_sites(args.caminhos[0], args.gerar)
+
+    start_time = time.time()
+    resultados = []
+    for r in resolver_sites(args.caminhos, args.processos, args.limite_tempo):
+        resultados.append(r)
+        status_icon = "✓" if r.status in ["Optimal", "Feasible"] else "✗"
+        print(f"{status_icon} {r.site:20} | Custo: {r.custo:9.2f} | "
+              f"Escalados: {r.escalados:3d} | "
+              f"Cobertura: {r.pares_cobertos}/{r.pares_total} | "
+              f"Tempo: {r.tempo:6.2f}s"
+              + (f" | {r.erro}" if r.erro else ""), flush=True)
+    tempo_total = time.time() - start_time
+
+    resumo = resumo_agregado(resultados)
+    print(f"\n{'='*60}")
+    print("RESUMO AGREGADO")
+    print(f"{'='*60}")
+    print(f"Sites viáveis: {resumo['viaveis']}/{resumo['sites']}")
+    print(f"Custo total: {resumo['custo_total']:.2f}")
+    print(f"Colaboradores escalados: {resumo['escalados']}")
+    print(f"Pares (turno, linha) cobertos: {resumo['pares_cobertos']}/{resumo['pares_total']}")
+    print(f"Menor razão de cobertura: {resumo['cobertura_minima']:.2f}")
+    print(f"Tempo total: {tempo_total:.2f}s "
+          f"(soma dos sites: {resumo['tempo_soma']:.2f}s, site mais lento: {resumo['tempo_maximo']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,8 @@ Copyright 2007- Stuart Mitchell (s.mitchell@auckland.ac.nz)
 from .constants import VERSION
 
 from .pulp import *
+from .blocks import LpVariableBlock
+from .arrays import LpArrays, LpEvaluator
 from .apis import *
 from .utilities import *
 from .constants import *
@@ -211,12 +211,12 @@ class LpSolver:
         self.c2n = {}
         self.n2c = {}
         i = 0
-        for c in lp.constraints:
-            rhsValues[i] = -lp.constraints[c].constant
+        for c, constraint in lp.constraints.items():
+            rhsValues[i] = -constraint.constant
             # for ranged constraints a<= constraint >=b
             rangeValues[i] = 0.0
             rowNames[i] = to_string(c)
-            rowType[i] = to_string(senseDict[lp.constraints[c].sense])
+            rowType[i] = to_string(senseDict[constraint.sense])
             self.c2n[c] = i
             self.n2c[i] = c
             i = i + 1
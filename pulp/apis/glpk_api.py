@@ -134,7 +134,7 @@ class GLPK_CMD(LpSolver_CMD):
 
         status, values = self.readsol(tmpOut, tmpSol)
 
-        vars = dict([(var.name, var) for var in lp.variables()])
+        vars = lp._variableNameIndex()
         for name, value in values.items():
             if name not in vars:  # __dummy
                 continue
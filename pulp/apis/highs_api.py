@@ -272,14 +272,16 @@ class HiGHS_CMD(LpSolver_CMD):
 
 
 highspy = None
+np = None
 
 
 class HiGHS(LpSolver):
     name = "HiGHS"
 
     try:
-        global highspy
+        global highspy, np
         import highspy  # type: ignore[import-not-found, import-untyped, unused-ignore]
+        import numpy as np  # type: ignore[import-not-found, import-untyped, unused-ignore]
     except:
         hscb = None
 
@@ -359,53 +361,74 @@ class HiGHS(LpSolver):
             for key, value in self.optionsDict.items():
                 lp.solverModel.setOptionValue(key, value)
 
-        def buildSolverModel(self, lp):
-            inf = highspy.kHighsInf
-
-            obj_mult = -1 if lp.sense == constants.LpMaximize else 1
-
-            for i, var in enumerate(lp.variables()):
-                lb = var.lowBound
-                ub = var.upBound
-                lp.solverModel.addCol(
-                    obj_mult * lp.objective.get(var, 0.0),
-                    -inf if lb is None else lb,
-                    inf if ub is None else ub,
-                    0,
-                    [],
-                    [],
-                )
-                var.index = i
-
-                if var.cat == constants.LpInteger and self.mip:
-                    lp.solverModel.changeColIntegrality(
-                        var.index, highspy.HighsVarType.kInteger
-                    )
+        def buildSolverModel(self, lp, changes=None):
+            """
+            Builds the HiGHS model of lp from its matrix form
 
+            :param changes: the full changes of lp (see
+                :meth:`~pulp.changes.LpChangeLog.changes`), if already computed
+            """
+            if changes is None:
+                changes = lp.changeLog.changes(full=True)
+            arrays = changes.arrays
+            columns = np.arange(len(changes.variables), dtype=np.int32)
+            rows = np.arange(len(arrays.row_names), dtype=np.int32)
+            self._addColumns(lp, arrays, columns)
+            self._addRows(lp, arrays, rows, columns)
+
+            for i, var in enumerate(changes.variables):
+                var.index = i
             for i, constraint in enumerate(lp.constraints.values()):
-                non_zero_constraint_items = [
-                    (var.index, coefficient)
-                    for var, coefficient in constraint.items()
-                    if coefficient != 0
-                ]
-
-                if len(non_zero_constraint_items) == 0:
-                    indices, coefficients = [], []
-                else:
-                    indices, coefficients = zip(*non_zero_constraint_items)
-
                 constraint.index = i
 
-                lb = constraint.getLb()
-                ub = constraint.getUb()
-                lp.solverModel.addRow(
-                    -inf if lb is None else lb,
-                    inf if ub is None else ub,
-                    len(indices),
-                    indices,
-                    coefficients,
+        def _addColumns(self, lp, arrays, columns):
+            # appends the columns of arrays at the given positions, empty
+            obj_mult = -1 if arrays.sense == constants.LpMaximize else 1
+            empty = np.zeros(0, dtype=np.int32)
+            lp.solverModel.addCols(
+                len(columns),
+                obj_mult * arrays.c[columns],
+                arrays.col_lower[columns],
+                arrays.col_upper[columns],
+                0,
+                empty,
+                empty,
+                np.zeros(0),
+            )
+            if self.mip:
+                integer = np.flatnonzero(arrays.integrality[columns])
+                first = lp.solverModel.getNumCol() - len(columns)
+                lp.solverModel.changeColsIntegrality(
+                    len(integer),
+                    (first + integer).astype(np.int32),
+                    np.full(
+                        len(integer), int(highspy.HighsVarType.kInteger), np.uint8
+                    ),
                 )
 
+        @staticmethod
+        def _addRows(lp, arrays, rows, solverColumns):
+            # appends the rows of arrays at the given positions; solverColumns
+            # is the HiGHS column of each column of arrays
+            starts = arrays.csr_indptr[rows]
+            lengths = arrays.csr_indptr[rows + 1] - starts
+            entries = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+            entries += np.arange(len(entries))
+            values = arrays.csr_data[entries]
+            nonzero = values != 0
+            rowOf = np.repeat(np.arange(len(rows)), lengths)[nonzero]
+            indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+            np.cumsum(np.bincount(rowOf, minlength=len(rows)), out=indptr[1:])
+            lp.solverModel.addRows(
+                len(rows),
+                arrays.row_lower[rows],
+                arrays.row_upper[rows],
+                int(indptr[-1]),
+                indptr[:-1],
+                solverColumns[arrays.csr_indices[entries[nonzero]]].astype(np.int32),
+                values[nonzero],
+            )
+
         def findSolutionValues(self, lp):
             status = lp.solverModel.getModelStatus()
             obj_value = lp.solverModel.getObjectiveValue()
@@ -484,7 +507,11 @@ class HiGHS(LpSolver):
             }
 
             col_values = list(solution.col_value)
+            # a model that was solved as an LP keeps its duals after a change
+            # to a MIP: only read them when they are from this solve
             col_duals = list(solution.col_dual)
+            if not solution.dual_valid:
+                col_duals = [0.0] * len(col_values)
 
             # Assign values to the variables as with lp.assignVarsVals()
             lp_variables = lp.variables()
@@ -492,10 +519,15 @@ class HiGHS(LpSolver):
                 var.varValue = col_values[var.index]
                 var.dj = col_duals[var.index]
 
-            constraints_list = list(lp.constraints.values())
+            constraints_list = list(lp.constraints)
+            solution_row = lp._solutionRows()
             row_values = list(solution.row_value)
             row_duals = list(solution.row_dual)
-            for constraint in constraints_list:
+            if not solution.dual_valid:
+                row_duals = [0.0] * len(row_values)
+            for name in constraints_list:
+                # the row of this problem when it shares it with a clone
+                constraint = solution_row(name)
                 # PuLP returns LpConstraint.constant as if it were on the
                 # left-hand side, which means the signs on the following line
                 # are correct
@@ -517,8 +549,18 @@ class HiGHS(LpSolver):
                 return status_dict[status]
 
         def actualSolve(self, lp):  # type: ignore[misc]
+            # the change log only follows lp once it was resolved
+            self._buildModel(lp, commit=lp.changeLog.committed)
+            return self._solveModel(lp)
+
+        def _buildModel(self, lp, commit):
+            changes = lp.changeLog.changes(full=True)
             self.createAndConfigureSolver(lp)
-            self.buildSolverModel(lp)
+            self.buildSolverModel(lp, changes)
+            if commit:
+                lp.changeLog.commit(changes)
+
+        def _solveModel(self, lp):
             self.callSolver(lp)
 
             status, sol_status = self.findSolutionValues(lp)
@@ -527,11 +569,114 @@ class HiGHS(LpSolver):
                 var.modified = False
 
             for constraint in lp.constraints.values():
-                constraint.modifier = False
+                constraint.modified = False
 
+            lp.resolveOK = True
             lp.assignStatus(status, sol_status)
 
             return status
 
         def actualResolve(self, lp, **kwargs):
-            raise PulpSolverError("HiGHS: Resolving is not supported")
+            """
+            Solves lp again with the HiGHS model of the last resolve, after
+            applying the changes made to lp since then
+
+            The first resolve builds the model again and commits it to the
+            change log of lp (see :class:`~pulp.changes.LpChangeLog`), so that
+            a problem solved only once does not keep a copy of its state.
+            """
+            if lp.solverModel is not None and lp.changeLog.committed:
+                changes = lp.changeLog.changes()
+                if not changes.senseChanged:
+                    self.applyChanges(lp, changes)
+                    lp.changeLog.commit(changes)
+                    return self._solveModel(lp)
+            self._buildModel(lp, commit=True)
+            return self._solveModel(lp)
+
+        def applyChanges(self, lp, changes):
+            """
+            Updates the HiGHS model of lp with the changes from the change log
+            """
+            model = lp.solverModel
+            arrays = changes.arrays
+            if changes.removedConstraints:
+                oldRow = {name: i for i, name in enumerate(changes.oldRows)}
+                removed = [oldRow[name] for name in changes.removedConstraints]
+                model.deleteRows(len(removed), np.array(sorted(removed), np.int32))
+            if changes.removedVariables:
+                oldColumn = {v: i for i, v in enumerate(changes.oldColumns)}
+                removed = [oldColumn[v] for v in changes.removedVariables]
+                model.deleteCols(len(removed), np.array(sorted(removed), np.int32))
+
+            column = {v: j for j, v in enumerate(changes.variables)}
+            solverColumn = {v: i for i, v in enumerate(changes.columns)}
+            # the HiGHS column of each column of arrays
+            solverColumns = np.array(
+                [solverColumn[v] for v in changes.variables], dtype=np.int64
+            )
+            self._addColumns(
+                lp,
+                arrays,
+                np.array([column[v] for v in changes.addedVariables], dtype=np.int64),
+            )
+
+            def columnsOf(variables):
+                positions = np.array([column[v] for v in variables], dtype=np.int64)
+                return positions, solverColumns[positions].astype(np.int32)
+
+            if changes.boundChanges:
+                positions, indices = columnsOf(changes.boundChanges)
+                model.changeColsBounds(
+                    len(indices),
+                    indices,
+                    arrays.col_lower[positions],
+                    arrays.col_upper[positions],
+                )
+            if changes.categoryChanges and self.mip:
+                positions, indices = columnsOf(changes.categoryChanges)
+                model.changeColsIntegrality(
+                    len(indices), indices, arrays.integrality[positions].astype(np.uint8)
+                )
+            if changes.objectiveChanges:
+                obj_mult = -1 if arrays.sense == constants.LpMaximize else 1
+                positions, indices = columnsOf(changes.objectiveChanges)
+                model.changeColsCost(
+                    len(indices), indices, obj_mult * arrays.c[positions]
+                )
+
+            row = {name: r for r, name in enumerate(arrays.row_names)}
+            solverRow = {name: i for i, name in enumerate(changes.rows)}
+            for name, terms in changes.coefficientChanges.items():
+                r = solverRow[name]
+                # the row's terms are all given: the ones HiGHS has besides
+                # them were removed
+                coefficients = {solverColumn[v]: value for v, value in terms.items()}
+                _, columns, _ = model.getRowEntries(r)
+                for j in columns.tolist():
+                    if j not in coefficients:
+                        model.changeCoeff(r, j, 0.0)
+                for j, value in coefficients.items():
+                    model.changeCoeff(r, j, value)
+            if changes.rhsChanges:
+                positions = np.array([row[name] for name in changes.rhsChanges])
+                indices = np.array(
+                    [solverRow[name] for name in changes.rhsChanges], dtype=np.int32
+                )
+                model.changeRowsBounds(
+                    len(indices),
+                    indices,
+                    arrays.row_lower[positions],
+                    arrays.row_upper[positions],
+                )
+            self._addRows(
+                lp,
+                arrays,
+                np.array([row[name] for name in changes.addedConstraints], np.int64),
+                solverColumns,
+            )
+
+            for v in changes.variables:
+                v.index = solverColumn[v]
+            for name, constraint in lp.constraints.items():
+                constraint.index = solverRow[name]
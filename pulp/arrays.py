@@ -0,0 +1,382 @@
+"""
+Matrix form of a problem.
+
+:func:`toArrays` turns an :class:`~pulp.LpProblem` into an :class:`LpArrays`:
+the objective vector, the constraint matrix in both CSR and CSC form, the
+row and column bounds, the integrality of the columns and their names, in one
+pass over the nonzeros. :func:`fromArrays` builds the problem back.
+
+:class:`LpEvaluator` checks candidate solutions, one or a batch at a time,
+against the arrays.
+
+The arrays are numpy arrays when numpy is installed and :mod:`array` buffers
+otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from . import constants as const
+from .blocks import _linear
+from .pulp import LpAffineExpression, LpConstraint, LpProblem, LpVariable
+
+try:
+    import numpy as np  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+@dataclass
+class LpArrays:
+    """
+    A problem ``min/max c x + objective_constant`` subject to
+    ``row_lower <= A x <= row_upper`` and ``col_lower <= x <= col_upper``
+
+    Missing bounds are ``-inf``/``inf``; an equality row has
+    ``row_lower == row_upper``. ``A`` is given twice: by rows in
+    ``csr_indptr``, ``csr_indices`` (columns) and ``csr_data``, and by columns
+    in ``csc_indptr``, ``csc_indices`` (rows) and ``csc_data``; the latter are
+    None when built with ``toArrays(lp, csc=False)``. ``integrality`` is 1 for
+    integer columns and 0 for continuous ones.
+    """
+
+    name: str
+    sense: int
+    c: Any
+    objective_constant: float
+    csr_indptr: Any
+    csr_indices: Any
+    csr_data: Any
+    csc_indptr: Any
+    csc_indices: Any
+    csc_data: Any
+    row_lower: Any
+    row_upper: Any
+    col_lower: Any
+    col_upper: Any
+    integrality: Any
+    row_names: list[str]
+    col_names: list[str]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The number of rows and columns of ``A``"""
+        return len(self.row_names), len(self.col_names)
+
+
+def _rowBounds(sense: int, rhs: float) -> tuple[float, float]:
+    if sense == const.LpConstraintLE:
+        return -math.inf, rhs
+    if sense == const.LpConstraintGE:
+        return rhs, math.inf
+    return rhs, rhs
+
+
+def _transpose(indptr, indices, data, columns: int):
+    # CSR -> CSC by a counting sort on the column of each coefficient
+    if np is not None:
+        indptr, indices, data = (
+            np.frombuffer(a, a.typecode) if isinstance(a, array) else np.asarray(a)
+            for a in (indptr, indices, data)
+        )
+        order = np.argsort(indices, kind="stable")
+        rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+        starts = np.zeros(columns + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=columns), out=starts[1:])
+        return (
+            array("q", starts.tobytes()),
+            array("q", rows[order].tobytes()),
+            array("d", data[order].tobytes()),
+        )
+    counts = [0] * (columns + 1)
+    for col in indices:
+        counts[col + 1] += 1
+    for col in range(columns):
+        counts[col + 1] += counts[col]
+    starts = array("q", counts)
+    position = counts[:-1]
+    rows = array("q", bytes(8 * len(indices)))
+    values = array("d", bytes(8 * len(data)))
+    for row in range(len(indptr) - 1):
+        for k in range(indptr[row], indptr[row + 1]):
+            col = indices[k]
+            rows[position[col]] = row
+            values[position[col]] = data[k]
+            position[col] += 1
+    return starts, rows, values
+
+
+def toArrays(lp: LpProblem, csc: bool = True) -> LpArrays:
+    """
+    Returns the matrix form of ``lp``. The columns follow
+    :meth:`~pulp.LpProblem.variables` and the rows the order of the
+    constraints; rows added with
+    :meth:`~pulp.LpProblem.add_constraints_from_arrays` are copied from their
+    arrays without building :class:`~pulp.LpConstraint` objects.
+
+    :param csc: also build ``A`` by columns. Without it the ``csc_*`` fields
+        are None, for callers that only read the rows
+    """
+    variables = lp.variables()
+    column = {v: i for i, v in enumerate(variables)}
+    c = array("d", bytes(8 * len(variables)))
+    objective_constant = 0.0
+    if lp.objective is not None:
+        for v, a in lp.objective.items():
+            c[column[v]] = a
+        objective_constant = float(lp.objective.constant)
+
+    indptr = array("q", [0])
+    indices = array("q")
+    data = array("d")
+    row_lower = array("d")
+    row_upper = array("d")
+    row_names = []
+    for name, constraint in lp._constraints.items():
+        expr = constraint.expr
+        indices.extend(map(column.__getitem__, expr.keys()))
+        data.extend(expr.values())
+        indptr.append(len(indices))
+        lower, upper = _rowBounds(constraint.sense, -constraint.constant)
+        row_lower.append(lower)
+        row_upper.append(upper)
+        row_names.append(name)
+    for block in lp._constraintBlocks:
+        columns = np.array([column[v] for v in block.variables], dtype=np.int64)
+        offset = len(indices)
+        indices.frombytes(columns[block.indices].tobytes())
+        data.frombytes(block.data.tobytes())
+        indptr.frombytes((block.indptr[1:] + offset).tobytes())
+        row_lower.frombytes(
+            np.where(block.senses == const.LpConstraintLE, -np.inf, block.rhs).tobytes()
+        )
+        row_upper.frombytes(
+            np.where(block.senses == const.LpConstraintGE, np.inf, block.rhs).tobytes()
+        )
+        row_names.extend(block.names(lp))
+
+    # with the bounds the problem sets on its variables (LpProblem.setBounds)
+    with lp._boundsApplied():
+        col_lower = array(
+            "d", [-math.inf if v.lowBound is None else v.lowBound for v in variables]
+        )
+        col_upper = array(
+            "d", [math.inf if v.upBound is None else v.upBound for v in variables]
+        )
+    integrality = array("b", [v.cat == const.LpInteger for v in variables])
+    buffers = dict(
+        c=c,
+        csr_indptr=indptr,
+        csr_indices=indices,
+        csr_data=data,
+        row_lower=row_lower,
+        row_upper=row_upper,
+        col_lower=col_lower,
+        col_upper=col_upper,
+        integrality=integrality,
+    )
+    if csc:
+        buffers["csc_indptr"], buffers["csc_indices"], buffers["csc_data"] = (
+            _transpose(indptr, indices, data, len(variables))
+        )
+    if np is not None:
+        buffers = {k: np.frombuffer(a, a.typecode) for k, a in buffers.items()}
+    return LpArrays(
+        name=lp.name,
+        sense=lp.sense,
+        objective_constant=objective_constant,
+        csc_indptr=buffers.pop("csc_indptr", None),
+        csc_indices=buffers.pop("csc_indices", None),
+        csc_data=buffers.pop("csc_data", None),
+        row_names=[str(name) for name in row_names],
+        col_names=[v.name for v in variables],
+        **buffers,
+    )
+
+
+def _rowSense(lower: float, upper: float) -> tuple[int, float]:
+    if lower == upper:
+        return const.LpConstraintEQ, upper
+    if lower == -math.inf and upper != math.inf:
+        return const.LpConstraintLE, upper
+    if upper == math.inf and lower != -math.inf:
+        return const.LpConstraintGE, lower
+    raise const.PulpError(f"Cannot build a constraint with bounds {lower}, {upper}")
+
+
+def _rowSenses(lower, upper):
+    # _rowSense for numpy arrays of bounds
+    equal = lower == upper
+    le = ~equal & (lower == -np.inf) & (upper != np.inf)
+    ge = ~equal & (upper == np.inf) & (lower != -np.inf)
+    invalid = ~(equal | le | ge)
+    if invalid.any():
+        row = int(np.argmax(invalid))
+        _rowSense(float(lower[row]), float(upper[row]))
+    senses = np.full(len(lower), const.LpConstraintEQ, dtype=np.int8)
+    senses[le] = const.LpConstraintLE
+    senses[ge] = const.LpConstraintGE
+    return senses, np.where(ge, lower, upper)
+
+
+def fromArrays(arrays: LpArrays) -> tuple[dict[str, LpVariable], LpProblem]:
+    """
+    Builds the problem described by ``arrays``, reading ``A`` from its CSR
+    form. With numpy the rows are added with
+    :meth:`~pulp.LpProblem.add_constraints_from_arrays`.
+
+    :return: a tuple with a dictionary of variables and a :class:`~pulp.LpProblem`
+    """
+    prob = LpProblem(name=arrays.name, sense=arrays.sense)
+    variables = [
+        LpVariable(
+            name,
+            None if lower == -math.inf else lower,
+            None if upper == math.inf else upper,
+            const.LpInteger if integer else const.LpContinuous,
+        )
+        for name, lower, upper, integer in zip(
+            arrays.col_names,
+            arrays.col_lower.tolist(),
+            arrays.col_upper.tolist(),
+            arrays.integrality.tolist(),
+        )
+    ]
+    prob.addVariables(variables)
+    objective = {v: a for v, a in zip(variables, arrays.c.tolist()) if a}
+    prob.setObjective(LpAffineExpression(objective, arrays.objective_constant))
+
+    if np is not None:
+        senses, rhs = _rowSenses(
+            np.asarray(arrays.row_lower, dtype=float),
+            np.asarray(arrays.row_upper, dtype=float),
+        )
+        A = SimpleNamespace(
+            shape=arrays.shape,
+            indptr=arrays.csr_indptr,
+            indices=arrays.csr_indices,
+            data=arrays.csr_data,
+        )
+        prob.add_constraints_from_arrays(variables, A, senses, rhs, arrays.row_names)
+    else:
+        senses, rhs = [], []
+        for lower, upper in zip(arrays.row_lower.tolist(), arrays.row_upper.tolist()):
+            sense, value = _rowSense(lower, upper)
+            senses.append(sense)
+            rhs.append(value)
+        indptr = arrays.csr_indptr.tolist()
+        indices = arrays.csr_indices.tolist()
+        data = arrays.csr_data.tolist()
+        for row, name in enumerate(arrays.row_names):
+            start, end = indptr[row], indptr[row + 1]
+            expr = _linear(
+                [variables[col] for col in indices[start:end]], data[start:end]
+            )
+            prob.addConstraint(LpConstraint(expr, senses[row], name, rhs[row]))
+    return {v.name: v for v in variables}, prob
+
+
+class LpEvaluator:
+    """
+    Evaluates candidate solutions of a problem in matrix form
+
+    Built once from an :class:`LpArrays` (see
+    :meth:`~pulp.LpProblem.evaluator`), it computes the row activities,
+    slacks and violations of a candidate vector ``x``, in the order of
+    :attr:`LpArrays.col_names`, or of a batch of candidates given as the rows
+    of a 2d array. Values that are not set can be given as NaN; they make the
+    candidate infeasible. Requires numpy.
+
+    :param arrays: the problem, as returned by :meth:`~pulp.LpProblem.to_arrays`
+    """
+
+    def __init__(self, arrays: LpArrays):
+        if np is None:
+            raise const.PulpError("LpEvaluator requires numpy")
+        self.shape = arrays.shape
+        indptr = np.asarray(arrays.csr_indptr, dtype=np.int64)
+        self._starts = indptr[:-1]
+        self._empty = indptr[1:] == self._starts
+        self._indices = np.asarray(arrays.csr_indices, dtype=np.int64)
+        self._data = np.asarray(arrays.csr_data, dtype=float)
+        self.c = np.asarray(arrays.c, dtype=float)
+        self.objective_constant = arrays.objective_constant
+        self.row_lower = np.asarray(arrays.row_lower, dtype=float)
+        self.row_upper = np.asarray(arrays.row_upper, dtype=float)
+        self.col_lower = np.asarray(arrays.col_lower, dtype=float)
+        self.col_upper = np.asarray(arrays.col_upper, dtype=float)
+        self._integer = np.asarray(arrays.integrality, dtype=bool)
+        # as LpConstraint.slack: rhs - activity
+        self.rhs = np.where(np.isfinite(self.row_upper), self.row_upper, self.row_lower)
+
+    def _candidates(self, x):
+        x = np.asarray(x, dtype=float)
+        if x.ndim not in (1, 2) or x.shape[-1] != self.shape[1]:
+            raise ValueError(
+                f"expected {self.shape[1]} values per candidate, got shape {x.shape}"
+            )
+        return x
+
+    def _rowSums(self, x):
+        nonzeros = len(self._data)
+        # a trailing zero so that empty rows at the end sum to 0 in reduceat
+        products = np.zeros(nonzeros + 1)
+        np.multiply(x[self._indices], self._data, out=products[:nonzeros])
+        sums = np.add.reduceat(products, self._starts)
+        sums[self._empty] = 0
+        return sums
+
+    def activity(self, x):
+        """The value of ``A x`` for each row (and candidate)"""
+        x = self._candidates(x)
+        if x.ndim == 2:
+            # gathering the whole batch at once is slower: it does not fit in cache
+            return np.array([self._rowSums(candidate) for candidate in x]).reshape(
+                len(x), self.shape[0]
+            )
+        return self._rowSums(x)
+
+    def slack(self, x):
+        """``rhs - A x`` for each row, as :attr:`LpConstraint.slack`"""
+        return self.rhs - self.activity(x)
+
+    def rowViolation(self, x):
+        """How much each row is outside ``[row_lower, row_upper]``"""
+        activity = self.activity(x)
+        return np.maximum(
+            np.maximum(self.row_lower - activity, activity - self.row_upper), 0
+        )
+
+    def boundViolation(self, x):
+        """How much each value is outside the bounds of its variable"""
+        x = self._candidates(x)
+        return np.maximum(np.maximum(self.col_lower - x, x - self.col_upper), 0)
+
+    def integralityViolation(self, x):
+        """The distance of each integer variable to the nearest integer"""
+        x = self._candidates(x)
+        return np.where(self._integer, np.abs(x - np.round(x)), 0.0)
+
+    def maxInfeasibility(self, x, mip: bool = True):
+        """
+        The largest row, bound or integrality violation of each candidate
+
+        :param mip: if False, the integrality of the variables is not checked
+        """
+        violations = [self.rowViolation(x), self.boundViolation(x)]
+        if mip:
+            violations.append(self.integralityViolation(x))
+        return np.max([np.max(v, axis=-1, initial=0) for v in violations], axis=0)
+
+    def feasible(self, x, eps: float = 0, mip: bool = True):
+        """Whether each candidate is feasible within ``eps``"""
+        return self.maxInfeasibility(x, mip) <= eps
+
+    def objective(self, x):
+        """The value of the objective for each candidate"""
+        return self._candidates(x) @ self.c + self.objective_constant
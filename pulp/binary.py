@@ -0,0 +1,178 @@
+"""
+Binary format of a problem, to send models to other processes.
+
+The format holds the matrix form of the problem (:class:`~pulp.arrays.LpArrays`)
+as flat little-endian arrays after a short header: no Python object is
+pickled per variable or per coefficient, and :func:`loads` reads the arrays
+from the buffer without copying them. :func:`write` and :func:`read` do the
+same with a file, which :func:`read` can memory map so that the processes of
+one host share the pages of a single copy of the model.
+
+The constraint matrix is stored by rows; its columns (the CSC arrays) are
+rebuilt on reading, unless they were stored too with ``csc=True``. The SOS
+constraints and the solution of the problem are not stored.
+
+Layout: the magic bytes, the length of the header as an unsigned 64 bits
+integer, the header in JSON (the scalars and the type, offset and length of
+each array) and the arrays, each aligned on 8 bytes. The names of the rows
+and of the columns are stored as UTF-8, separated by NUL characters.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from typing import Any
+
+from . import constants as const
+from .arrays import LpArrays, _transpose
+
+try:
+    import numpy as np  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+MAGIC = b"PULPLPA1"
+
+_CSR = ("c", "csr_indptr", "csr_indices", "csr_data")
+_CSC = ("csc_indptr", "csc_indices", "csc_data")
+_BOUNDS = ("row_lower", "row_upper", "col_lower", "col_upper", "integrality")
+# array typecode -> numpy dtype, in little-endian order
+_DTYPES = {"d": "<f8", "q": "<i8", "b": "i1", "B": "u1"}
+
+
+def _typecode(field: str) -> str:
+    if field == "integrality":
+        return "b"
+    if field.endswith(("indptr", "indices")):
+        return "q"
+    return "d"
+
+
+def _bytes(values, typecode: str) -> bytes:
+    if np is not None:
+        return np.ascontiguousarray(values, dtype=_DTYPES[typecode]).tobytes()
+    values = array(typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _names(names: list[str]) -> bytes:
+    text = "\0".join(names)
+    if text.count("\0") != max(len(names) - 1, 0):
+        raise const.PulpError("Names cannot contain NUL characters")
+    return text.encode()
+
+
+def _unnames(data, count: int) -> list[str]:
+    if not count:
+        return []
+    return bytes(data).decode().split("\0")
+
+
+def dumps(arrays: LpArrays, csc: bool = False) -> bytes:
+    """
+    Returns ``arrays`` in the binary format
+
+    :param csc: store the CSC form of the matrix too, so that :func:`loads`
+        does not rebuild it
+    """
+    fields = _CSR + (_CSC if csc else ()) + _BOUNDS
+    blobs = []
+    for field in fields:
+        typecode = _typecode(field)
+        blobs.append((field, typecode, _bytes(getattr(arrays, field), typecode)))
+    blobs.append(("row_names", "B", _names(arrays.row_names)))
+    blobs.append(("col_names", "B", _names(arrays.col_names)))
+    header: dict[str, Any] = dict(
+        name=arrays.name,
+        sense=arrays.sense,
+        objective_constant=arrays.objective_constant,
+        shape=arrays.shape,
+        arrays={},
+    )
+    offset = 0
+    for field, typecode, blob in blobs:
+        header["arrays"][field] = [typecode, offset, len(blob)]
+        offset += -len(blob) % 8 + len(blob)
+    text = json.dumps(header).encode()
+    text += b" " * (-len(text) % 8)
+    parts = [MAGIC, len(text).to_bytes(8, "little"), text]
+    for _, _, blob in blobs:
+        parts += [blob, bytes(-len(blob) % 8)]
+    return b"".join(parts)
+
+
+def _header(data) -> tuple[dict[str, Any], int]:
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise const.PulpError("Not a problem in the binary format of pulp")
+    length = int.from_bytes(bytes(data[len(MAGIC) : len(MAGIC) + 8]), "little")
+    start = len(MAGIC) + 8
+    return json.loads(bytes(data[start : start + length])), start + length
+
+
+def loads(data) -> LpArrays:
+    """
+    Reads :class:`~pulp.arrays.LpArrays` from the binary format. With numpy
+    the arrays are read-only views of ``data`` (bytes or any object with the
+    buffer protocol, such as a memory map), which must not change afterwards.
+    """
+    header, start = _header(data)
+    view = memoryview(data).cast("B")
+    buffers = {}
+    for field, (typecode, offset, length) in header["arrays"].items():
+        chunk = view[start + offset : start + offset + length]
+        if field.endswith("_names"):
+            buffers[field] = chunk
+        elif np is not None:
+            buffers[field] = np.frombuffer(chunk, _DTYPES[typecode])
+        else:
+            values = array(typecode, bytes(chunk))
+            if sys.byteorder == "big":
+                values.byteswap()
+            buffers[field] = values
+    rows, columns = header["shape"]
+    row_names = _unnames(buffers.pop("row_names"), rows)
+    col_names = _unnames(buffers.pop("col_names"), columns)
+    if "csc_indptr" not in buffers:
+        indptr, indices, values = (buffers[field] for field in _CSR[1:])
+        csc = _transpose(indptr, indices, values, columns)
+        if np is not None:
+            csc = tuple(np.frombuffer(a, a.typecode) for a in csc)
+        buffers.update(zip(_CSC, csc))
+    return LpArrays(
+        name=header["name"],
+        sense=header["sense"],
+        objective_constant=header["objective_constant"],
+        row_names=row_names,
+        col_names=col_names,
+        **buffers,
+    )
+
+
+def write(arrays: LpArrays, filename: str, csc: bool = False):
+    """
+    Writes ``arrays`` in the binary format to ``filename``
+
+    :param csc: see :func:`dumps`
+    """
+    with open(filename, "wb") as f:
+        f.write(dumps(arrays, csc))
+
+
+def read(filename: str, mmap: bool = False) -> LpArrays:
+    """
+    Reads :class:`~pulp.arrays.LpArrays` from a file in the binary format
+
+    :param mmap: map the file in memory instead of reading it: the arrays
+        are read-only views of the file, shared by the processes that map it.
+        Requires numpy
+    """
+    if not mmap:
+        with open(filename, "rb") as f:
+            return loads(f.read())
+    if np is None:
+        raise const.PulpError("Memory mapping a problem requires numpy")
+    return loads(np.memmap(filename, dtype=np.uint8, mode="r"))
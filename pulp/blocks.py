@@ -0,0 +1,438 @@
+"""
+Blocks of variables indexed like numpy arrays.
+
+:class:`LpVariableBlock` describes an n-dimensional family of variables by its
+shape, bounds and category. The :class:`~pulp.LpVariable` objects are only
+created when an element is first used, so declaring a block costs the same
+whatever its size::
+
+    >>> x = LpVariableBlock("x", (1000, 6, 4), lowBound=0, cat=LpBinary)
+    >>> x[3, 1, 2]
+    x_3_1_2
+    >>> cost = np.arange(6.0)
+    >>> cost @ x[3, :, 2]
+    1.0*x_3_1_2 + 2.0*x_3_2_2 + 3.0*x_3_3_2 + 4.0*x_3_4_2 + 5.0*x_3_5_2 + 0.0
+
+:class:`LpConstraintBlock` holds rows added in bulk with
+:meth:`LpProblem.add_constraints_from_arrays` in CSR form.
+
+Requires numpy.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from typing import Any
+
+from . import constants as const
+from .pulp import LpAffineExpression, LpConstraint, LpElement, LpVariable
+
+try:
+    import numpy as np  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+def _linear(variables, coefficients) -> LpAffineExpression:
+    # sum of coefficient * variable, zeros skipped and repeated variables merged
+    e = LpAffineExpression()
+    get = e.get
+    for v, c in zip(variables, coefficients):
+        if c:
+            old = get(v)
+            dict.__setitem__(e, v, c if old is None else old + c)
+    return e
+
+
+class LpVariableBlock:
+    """
+    An n-dimensional array of :class:`~pulp.LpVariable` created on demand
+
+    :param name: The prefix of the variable names: element ``(i, j)`` is
+        named ``name_i_j``
+    :param shape: The number of variables along each dimension
+    :param lowBound: The lower bound of all variables, or an array that
+        broadcasts to ``shape``. Infinite or NaN values mean no bound
+    :param upBound: The upper bound, as ``lowBound``
+    :param cat: The category of all variables
+
+    Indexing with integers returns the variable at that position. Any other
+    index (slices, ``...``, integer or boolean arrays) returns a block that
+    refers to the same variables. Blocks of one or two dimensions can be
+    multiplied by numeric arrays with ``@``.
+    """
+
+    # numpy defers to __rmatmul__ instead of building an object array
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        name: str,
+        shape: int | tuple[int, ...],
+        lowBound: Any = None,
+        upBound: Any = None,
+        cat: str = const.LpContinuous,
+    ):
+        if np is None:
+            raise const.PulpError("LpVariableBlock requires numpy")
+        if LpElement.expression.match(name):
+            warnings.warn(
+                "The name {} has illegal characters that will be replaced by _".format(
+                    name
+                )
+            )
+        self.name = str(name).translate(LpElement.trans)
+        self._shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        self.cat = cat
+        self.lowBound = self._bounds(lowBound)
+        self.upBound = self._bounds(upBound)
+        # flat index -> LpVariable, shared by every block sliced from this one
+        self._created: dict[int, LpVariable] = {}
+        self._base = self
+        # flat indices of this block's elements; None for the whole block
+        self._flat = None
+
+    def _bounds(self, bound):
+        if bound is None:
+            return None
+        if np.ndim(bound) == 0:
+            return bound if math.isfinite(bound) else None
+        return np.broadcast_to(np.asarray(bound, dtype=float), self._shape)
+
+    def _view(self, flat) -> LpVariableBlock:
+        view = object.__new__(LpVariableBlock)
+        view.__dict__.update(self._base.__dict__)
+        view._flat = flat
+        return view
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._shape if self._flat is None else self._flat.shape
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"LpVariableBlock({self.name!r}, shape={self.shape}, cat={self.cat!r})"
+
+    def flatIndices(self):
+        """Returns the flat positions, in the base block, of this block's elements"""
+        if self._flat is not None:
+            return self._flat
+        return np.arange(self.size).reshape(self._shape)
+
+    def __getitem__(self, key) -> LpVariable | LpVariableBlock:
+        if self._flat is not None:
+            flat = self._flat[key]
+        else:
+            # index each axis' contribution to the flat position, broadcast
+            # (without copying) to the full shape, so that only the selection
+            # is ever materialised
+            shape = self._shape
+            flat = 0
+            stride = 1
+            for axis in range(len(shape) - 1, -1, -1):
+                along = np.arange(shape[axis]) * stride
+                along = along.reshape((-1,) + (1,) * (len(shape) - axis - 1))
+                flat = flat + np.broadcast_to(along, shape)[key]
+                stride *= shape[axis]
+        if np.ndim(flat) == 0:
+            return self._element(int(flat))
+        return self._view(flat)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _element(self, flat: int) -> LpVariable:
+        created = self._base._created
+        var = created.get(flat)
+        if var is None:
+            index = []
+            rest = flat
+            for n in reversed(self._base._shape):
+                rest, i = divmod(rest, n)
+                index.append(i)
+            index.reverse()
+            # the name is only formatted if it is read
+            template = self.name.replace("%", "%%") + "_%d" * len(index)
+            var = LpVariable(
+                (template, tuple(index)),
+                self._bound(self.lowBound, flat),
+                self._bound(self.upBound, flat),
+                self.cat,
+            )
+            created[flat] = var
+        return var
+
+    @staticmethod
+    def _bound(bound, flat):
+        if not isinstance(bound, np.ndarray):
+            return bound
+        value = bound.item(flat)
+        return value if math.isfinite(value) else None
+
+    def _elements(self, flats) -> list[LpVariable]:
+        """Same as ``[self._element(f) for f in flats]``"""
+        created = self._base._created
+        missing = [f for f in flats if f not in created]
+        if missing:
+            # create the missing variables with their bounds read in bulk
+            shape = self._base._shape
+            index = np.unravel_index(missing, shape)
+            template = self.name.replace("%", "%%") + "_%d" * len(shape)
+            bounds = []
+            for bound in (self.lowBound, self.upBound):
+                if isinstance(bound, np.ndarray):
+                    values = bound[index]
+                    bounds.append(
+                        np.where(np.isfinite(values), values, None).tolist()
+                    )
+                else:
+                    bounds.append([bound] * len(missing))
+            cat = self.cat
+            for f, i, low, up in zip(
+                missing, zip(*[axis.tolist() for axis in index]), *bounds
+            ):
+                created[f] = LpVariable((template, i), low, up, cat)
+        return [created[f] for f in flats]
+
+    def variables(self) -> list[LpVariable]:
+        """Returns the variables of this block in row-major order, creating them"""
+        return self._elements(self.flatIndices().ravel().tolist())
+
+    def tolist(self):
+        """Returns the variables as nested lists, like :meth:`numpy.ndarray.tolist`"""
+        if self.ndim == 1:
+            return self.variables()
+        return [row.tolist() for row in self]
+
+    def sum(self) -> LpAffineExpression:
+        """Returns the sum of the variables of this block"""
+        return _linear(self.variables(), [1] * self.size)
+
+    def values(self):
+        """Returns the values of the variables as an array, NaN where unset"""
+        values = np.full(self.shape, np.nan)
+        for position, flat in np.ndenumerate(self.flatIndices()):
+            var = self._base._created.get(int(flat))
+            if var is not None and var.varValue is not None:
+                values[position] = var.varValue
+        return values
+
+    def _matrix(self, as_column: bool) -> list[list[LpVariable]]:
+        if self.ndim == 1:
+            column = self.variables()
+            return [[v] for v in column] if as_column else [column]
+        if self.ndim == 2:
+            return self.tolist()
+        raise ValueError("Only blocks of one or two dimensions can be multiplied")
+
+    def __matmul__(self, other):
+        # (m, n) @ (n, p), with 1-d operands taken as a row (left) or column (right)
+        coefficients = np.asarray(other)
+        if coefficients.ndim not in (1, 2):
+            raise ValueError("Only arrays of one or two dimensions can be multiplied")
+        rows = self._matrix(as_column=False)
+        columns = coefficients.reshape(len(coefficients), -1).T.tolist()
+        if len(rows[0]) != len(coefficients):
+            raise ValueError(
+                f"matmul: shapes {self.shape} and {coefficients.shape} not aligned"
+            )
+        result = [[_linear(row, column) for column in columns] for row in rows]
+        return self._result(result, self.ndim == 1, coefficients.ndim == 1)
+
+    def __rmatmul__(self, other):
+        coefficients = np.asarray(other)
+        if coefficients.ndim not in (1, 2):
+            raise ValueError("Only arrays of one or two dimensions can be multiplied")
+        columns = list(zip(*self._matrix(as_column=True)))
+        rows = np.atleast_2d(coefficients).tolist()
+        if len(rows[0]) != len(columns[0]):
+            raise ValueError(
+                f"matmul: shapes {coefficients.shape} and {self.shape} not aligned"
+            )
+        result = [[_linear(column, row) for column in columns] for row in rows]
+        return self._result(result, coefficients.ndim == 1, self.ndim == 1)
+
+    @staticmethod
+    def _result(result, drop_rows: bool, drop_columns: bool):
+        out = np.empty((len(result), len(result[0])), dtype=object)
+        for r, row in enumerate(result):
+            for c, e in enumerate(row):
+                out[r, c] = e
+        if drop_rows:
+            out = out[0]
+        if drop_columns:
+            out = out[..., 0]
+        return out if out.ndim else out.item()
+
+
+class LpConstraintBlock:
+    """
+    Rows ``A x (sense) rhs`` of a problem kept in CSR form
+
+    Created by :meth:`~pulp.LpProblem.add_constraints_from_arrays`. The
+    :class:`~pulp.LpConstraint` objects are only built when the problem's
+    constraints are read; until then the duals and slacks found by a solver
+    are kept in :attr:`pi` and :attr:`slack`.
+
+    :param variables: the variables of the columns of the matrix
+    :param indptr: CSR row pointers (length rows + 1)
+    :param indices: CSR column of each coefficient
+    :param data: CSR coefficients
+    :param senses: the sense of each row
+    :param rhs: the right hand side of each row
+    :param names: the names of the rows, or None to generate them
+    """
+
+    def __init__(self, variables, indptr, indices, data, senses, rhs, names=None):
+        if np is None:
+            raise const.PulpError("LpConstraintBlock requires numpy")
+        self.variables: list[LpVariable] = list(variables)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.senses = np.asarray(senses, dtype=np.int8)
+        self.rhs = np.asarray(rhs, dtype=float)
+        self._names = None if names is None else list(names)
+        self._namesSanitized = False
+        self.pi = None
+        self.slack = None
+
+    @classmethod
+    def fromArrays(cls, var_block, A_csr, senses, rhs, names=None):
+        """
+        Checks and normalises the arguments of
+        :meth:`~pulp.LpProblem.add_constraints_from_arrays`: explicit zeros
+        are dropped and only the columns with coefficients are kept
+        """
+        if np is None:
+            raise const.PulpError("add_constraints_from_arrays requires numpy")
+        if not hasattr(A_csr, "indptr") and hasattr(A_csr, "tocsr"):
+            A_csr = A_csr.tocsr()
+        if hasattr(A_csr, "indptr"):
+            rows, columns = A_csr.shape
+            indptr = np.asarray(A_csr.indptr, dtype=np.int64)
+            indices = np.asarray(A_csr.indices, dtype=np.int64)
+            data = np.asarray(A_csr.data, dtype=float)
+        else:
+            dense = np.asarray(A_csr, dtype=float)
+            if dense.ndim != 2:
+                raise ValueError("A_csr must be a matrix")
+            rows, columns = dense.shape
+            row, indices = np.nonzero(dense)
+            data = dense[row, indices]
+            indptr = np.zeros(rows + 1, dtype=np.int64)
+            np.cumsum(np.bincount(row, minlength=rows), out=indptr[1:])
+        if isinstance(var_block, LpVariableBlock):
+            flat = var_block.flatIndices().ravel()
+            if len(flat) != columns:
+                raise ValueError(
+                    f"A_csr has {columns} columns for {len(flat)} variables"
+                )
+        else:
+            var_block = list(var_block)
+            if len(var_block) != columns:
+                raise ValueError(
+                    f"A_csr has {columns} columns for {len(var_block)} variables"
+                )
+        if len(indptr) != rows + 1 or len(indices) != len(data):
+            raise ValueError("A_csr is not a valid CSR matrix")
+        if not np.isfinite(data).all():
+            raise const.PulpError("Cannot add NaN/inf coefficients")
+
+        keep = data != 0
+        if not keep.all():
+            indptr = np.concatenate(([0], np.cumsum(keep)))[indptr]
+            indices = indices[keep]
+            data = data[keep]
+        used, indices = np.unique(indices, return_inverse=True)
+        if isinstance(var_block, LpVariableBlock):
+            variables = var_block._elements(flat[used].tolist())
+        else:
+            variables = [var_block[c] for c in used.tolist()]
+
+        senses = np.broadcast_to(np.asarray(senses, dtype=np.int8), (rows,))
+        if not np.isin(senses, list(const.LpConstraintSenses)).all():
+            raise const.PulpError(f"Invalid constraint senses: {np.unique(senses)}")
+        rhs = np.broadcast_to(np.asarray(rhs, dtype=float), (rows,))
+        if not np.isfinite(rhs).all():
+            raise const.PulpError("Cannot set constraint RHS to NaN/inf values")
+        if names is not None:
+            names = list(names)
+            if len(names) != rows:
+                raise ValueError(f"{len(names)} names for {rows} rows")
+        return cls(variables, indptr, indices, data, senses, rhs, names)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __repr__(self):
+        return f"LpConstraintBlock(rows={len(self)}, nonzeros={len(self.data)})"
+
+    def names(self, problem) -> list[str]:
+        """
+        Returns the names of the rows, generating the missing ones with
+        ``problem.unusedConstraintName()`` the first time
+        """
+        if self._names is None:
+            self._names = [problem.unusedConstraintName() for _ in range(len(self))]
+        elif not self._namesSanitized:
+            trans = LpAffineExpression.trans
+            self._names = [str(name).translate(trans) for name in self._names]
+        self._namesSanitized = True
+        return self._names
+
+    def rows(self):
+        """
+        Yields, for each row, its ``(variable, coefficient)`` pairs, sense and
+        right hand side
+        """
+        variables = self.variables
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        data = self.data.tolist()
+        senses = self.senses.tolist()
+        rhs = self.rhs.tolist()
+        for r in range(len(self)):
+            start, end = indptr[r], indptr[r + 1]
+            terms = [(variables[c], a) for c, a in zip(indices[start:end], data[start:end])]
+            yield terms, senses[r], rhs[r]
+
+    def constraints(self, problem):
+        """Yields the rows as ``(name, LpConstraint)``"""
+        pi = None if self.pi is None else self.pi.tolist()
+        slack = None if self.slack is None else self.slack.tolist()
+        for r, (name, (terms, sense, rhs)) in enumerate(
+            zip(self.names(problem), self.rows())
+        ):
+            expr = _linear([v for v, _ in terms], [a for _, a in terms])
+            constraint = LpConstraint(expr, sense, name, rhs)
+            if pi is not None and not math.isnan(pi[r]):
+                constraint.pi = pi[r]
+            if slack is not None and not math.isnan(slack[r]):
+                constraint.slack = slack[r]
+            yield name, constraint
+
+    def setPi(self, row: int, value):
+        if value is None:
+            return
+        if self.pi is None:
+            self.pi = np.full(len(self), np.nan)
+        self.pi[row] = value
+
+    def setSlack(self, row: int, value: float, activity: bool = False):
+        if self.slack is None:
+            self.slack = np.full(len(self), np.nan)
+        # the activity is reported as for LpConstraint, with constant -rhs
+        self.slack[row] = self.rhs[row] - value if activity else value
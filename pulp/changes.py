@@ -0,0 +1,249 @@
+"""
+Changes of a problem between solves.
+
+:attr:`LpProblem.changeLog <pulp.LpProblem.changeLog>` compares the problem
+with the state it had at the last :meth:`LpChangeLog.commit` and returns the
+difference as :class:`LpChanges`: the rows and columns added and removed, the
+bounds, categories, right hand sides and coefficients that changed and the
+edits of the objective. A solver adapter that keeps its model between solves
+applies these deltas instead of building the model again, and commits them
+once the solver has them.
+
+The comparison is done on the matrix form of the problem
+(:func:`~pulp.arrays.toArrays`), so it sees every edit, whether made through a
+method, an attribute or the constraints dictionary, at the cost of one pass
+over the nonzeros. A commit keeps the bounds, categories and objective of each
+column and the bounds and a hash of the coefficients of each row, not the
+matrix itself. Nothing is recorded until the first commit.
+
+The solver's rows and columns are assumed to keep their order between solves:
+removed ones are deleted and added ones appended. :attr:`LpChanges.rows` and
+:attr:`LpChanges.columns` give that order.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .arrays import LpArrays, toArrays
+from .pulp import LpProblem, LpVariable
+
+
+@dataclass
+class LpChanges:
+    """
+    The changes of a problem since the last commit of its change log
+
+    ``arrays`` and ``variables`` describe the problem after the changes, with
+    the columns in the order of :meth:`~pulp.LpProblem.variables`. ``oldRows``
+    and ``oldColumns`` are the rows (by name) and columns of the solver before
+    the changes, ``rows`` and ``columns`` after them. Rows and columns that are
+    added are not reported in the other fields; their data is in ``arrays``.
+    """
+
+    arrays: LpArrays
+    variables: list[LpVariable]
+    oldRows: list[str]
+    oldColumns: list[LpVariable]
+    rows: list[str]
+    columns: list[LpVariable]
+    addedVariables: list[LpVariable] = field(default_factory=list)
+    removedVariables: list[LpVariable] = field(default_factory=list)
+    #: variables with a new lower or upper bound
+    boundChanges: list[LpVariable] = field(default_factory=list)
+    #: variables that changed between continuous and integer
+    categoryChanges: list[LpVariable] = field(default_factory=list)
+    #: the new objective coefficients
+    objectiveChanges: dict[LpVariable, float] = field(default_factory=dict)
+    senseChanged: bool = False
+    addedConstraints: list[str] = field(default_factory=list)
+    removedConstraints: list[str] = field(default_factory=list)
+    #: constraints with a new sense or right hand side
+    rhsChanges: list[str] = field(default_factory=list)
+    #: all the coefficients of each constraint whose coefficients changed; the
+    #: variables it had and that are not listed now have a coefficient of 0
+    coefficientChanges: dict[str, dict[LpVariable, float]] = field(
+        default_factory=dict
+    )
+    # the hashes of the rows of arrays, kept for the commit once computed
+    _rowHashes: list[int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __bool__(self):
+        return bool(
+            self.addedVariables
+            or self.removedVariables
+            or self.boundChanges
+            or self.categoryChanges
+            or self.objectiveChanges
+            or self.senseChanged
+            or self.addedConstraints
+            or self.removedConstraints
+            or self.rhsChanges
+            or self.coefficientChanges
+        )
+
+
+@dataclass
+class _Commit:
+    # what a commit keeps of the problem: enough to compare with it, not A
+    sense: int
+    variables: list[LpVariable]
+    rows: list[str]
+    columns: list[LpVariable]
+    rowNames: list[str]
+    rowLower: list[float]
+    rowUpper: list[float]
+    rowHashes: list[int]
+    colLower: list[float]
+    colUpper: list[float]
+    integrality: list[int]
+    c: list[float]
+
+
+def _hashRows(arrays: LpArrays, variables: list[LpVariable]) -> list[int]:
+    # a hash of the variables and coefficients of each row; the variables are
+    # hashed by identity so that a row keeps its hash when columns move
+    ids = [id(v) for v in variables]
+    indptr, indices, data = (
+        a.tolist() for a in (arrays.csr_indptr, arrays.csr_indices, arrays.csr_data)
+    )
+    return [
+        hash((tuple(map(ids.__getitem__, indices[start:end])), tuple(data[start:end])))
+        for start, end in zip(indptr, indptr[1:])
+    ]
+
+
+class LpChangeLog:
+    """
+    Records the state of a problem at each :meth:`commit`, to report the
+    changes made since then
+
+    :param problem: the :class:`~pulp.LpProblem` to follow
+    """
+
+    def __init__(self, problem: LpProblem):
+        self.problem = problem
+        self._committed: _Commit | None = None
+
+    @property
+    def committed(self) -> bool:
+        """Whether there was a commit: changes are only recorded after one"""
+        return self._committed is not None
+
+    def changes(self, full: bool = False) -> LpChanges:
+        """
+        Returns the changes since the last commit
+
+        :param full: report the whole problem as added, as for a solver that
+            builds its model from scratch. It is also the case before the
+            first commit
+        """
+        variables = list(self.problem.variables())
+        arrays = toArrays(self.problem, csc=False)
+        old = None if full else self._committed
+        if old is None:
+            return LpChanges(
+                arrays=arrays,
+                variables=variables,
+                oldRows=[],
+                oldColumns=[],
+                rows=list(arrays.row_names),
+                columns=list(variables),
+                addedVariables=list(variables),
+                addedConstraints=list(arrays.row_names),
+            )
+        changes = LpChanges(
+            arrays=arrays,
+            variables=variables,
+            oldRows=old.rows,
+            oldColumns=old.columns,
+            rows=[],
+            columns=[],
+            senseChanged=arrays.sense != old.sense,
+        )
+        self._compareColumns(changes, old)
+        self._compareRows(changes, old)
+        return changes
+
+    @staticmethod
+    def _compareColumns(changes: LpChanges, old: _Commit):
+        variables, arrays = changes.variables, changes.arrays
+        column = {v: j for j, v in enumerate(variables)}
+        oldColumn = {v: j for j, v in enumerate(old.variables)}
+        changes.addedVariables = [v for v in variables if v not in oldColumn]
+        changes.removedVariables = [v for v in old.columns if v not in column]
+        kept = [v for v in old.columns if v in column]
+        changes.columns = kept + changes.addedVariables
+
+        lower, upper, integrality, c = (
+            a.tolist()
+            for a in (arrays.col_lower, arrays.col_upper, arrays.integrality, arrays.c)
+        )
+        for j, v in enumerate(variables):
+            i = oldColumn.get(v)
+            if i is None:
+                continue
+            if lower[j] != old.colLower[i] or upper[j] != old.colUpper[i]:
+                changes.boundChanges.append(v)
+            if integrality[j] != old.integrality[i]:
+                changes.categoryChanges.append(v)
+            if c[j] != old.c[i]:
+                changes.objectiveChanges[v] = c[j]
+
+    @staticmethod
+    def _compareRows(changes: LpChanges, old: _Commit):
+        arrays, variables = changes.arrays, changes.variables
+        names = arrays.row_names
+        row = {name: r for r, name in enumerate(names)}
+        oldRow = {name: r for r, name in enumerate(old.rowNames)}
+        changes.addedConstraints = [name for name in names if name not in oldRow]
+        changes.removedConstraints = [name for name in old.rows if name not in row]
+        kept = [name for name in old.rows if name in row]
+        changes.rows = kept + changes.addedConstraints
+
+        lower, upper = arrays.row_lower.tolist(), arrays.row_upper.tolist()
+        hashes = changes._rowHashes = _hashRows(arrays, variables)
+        indptr, indices, data = (
+            a.tolist() for a in (arrays.csr_indptr, arrays.csr_indices, arrays.csr_data)
+        )
+        for r, name in enumerate(names):
+            o = oldRow.get(name)
+            if o is None:
+                continue
+            if lower[r] != old.rowLower[o] or upper[r] != old.rowUpper[o]:
+                changes.rhsChanges.append(name)
+            if hashes[r] != old.rowHashes[o]:
+                start, end = indptr[r], indptr[r + 1]
+                changes.coefficientChanges[name] = dict(
+                    zip(map(variables.__getitem__, indices[start:end]), data[start:end])
+                )
+
+    def commit(self, changes: LpChanges | None = None):
+        """
+        Marks the changes as applied: the next changes are relative to them
+
+        :param changes: the changes given to the solver, as returned by
+            :meth:`changes`. By default the current state of the problem, as
+            if the solver had built its model from scratch
+        """
+        if changes is None:
+            changes = self.changes(full=True)
+        arrays = changes.arrays
+        self._committed = _Commit(
+            sense=arrays.sense,
+            variables=changes.variables,
+            rows=changes.rows,
+            columns=changes.columns,
+            rowNames=list(arrays.row_names),
+            rowLower=arrays.row_lower.tolist(),
+            rowUpper=arrays.row_upper.tolist(),
+            rowHashes=changes._rowHashes or _hashRows(arrays, changes.variables),
+            colLower=arrays.col_lower.tolist(),
+            colUpper=arrays.col_upper.tolist(),
+            integrality=arrays.integrality.tolist(),
+            c=arrays.c.tolist(),
+        )
+        self.problem.modifiedVariables.clear()
+        self.problem.modifiedConstraints.clear()
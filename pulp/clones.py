@@ -0,0 +1,228 @@
+"""
+Copy-on-write storage of the constraints of cloned problems.
+
+:meth:`LpProblem.clone <pulp.LpProblem.clone>` leaves the problem it clones
+untouched: the clone gets an :class:`LpSharedConstraints` over a frozen copy of
+its rows (the *base*), which the problem keeps and gives to its next clones
+for as long as its rows do not change, plus the rows that the clone replaces,
+adds or deletes. A row of the base is only copied when it is read by name
+through the clone (``clone.constraints[name]``), which is how rows are edited;
+iterating over the constraints shares them. A clone of a clone shares the same
+base and copies the rows its original changed, so each clone costs the rows it
+changed.
+"""
+
+from __future__ import annotations
+
+import copy
+import operator
+from collections.abc import Iterator, MutableMapping
+
+from .pulp import LpAffineExpression, LpConstraint, LpProblem
+
+
+_sense = operator.attrgetter("sense")
+_constant = operator.attrgetter("constant")
+_expression = operator.attrgetter("expr")
+
+
+def _sameExpression(frozen: LpAffineExpression, expr: LpAffineExpression) -> bool:
+    return (
+        frozen.constant == expr.constant
+        and frozen.name == expr.name
+        and dict.__eq__(frozen, expr)
+    )
+
+
+def _sameRows(frozen: dict[str, LpConstraint], rows: dict[str, LpConstraint]):
+    # compares the rows with map, in C: a fraction of the cost of copying them
+    if list(frozen) != list(rows):
+        return False
+    old, new = list(frozen.values()), list(rows.values())
+    for field in (_sense, _constant):
+        if list(map(field, old)) != list(map(field, new)):
+            return False
+    old, new = list(map(_expression, old)), list(map(_expression, new))
+    return list(map(_constant, old)) == list(map(_constant, new)) and all(
+        map(dict.__eq__, old, new)
+    )
+
+
+def _freeze(row: LpConstraint) -> LpConstraint:
+    row = copy.copy(row)
+    row.expr = row.expr.copy()
+    row.pi = row.slack = None
+    return row
+
+
+def freezeObjective(
+    objective: LpAffineExpression, frozen: LpAffineExpression | None
+) -> LpAffineExpression:
+    """
+    Returns a copy of ``objective`` for the clones of a problem: ``frozen``,
+    the copy made for its previous clones, if the objective has not changed
+    since
+    """
+    if frozen is None or not _sameExpression(frozen, objective):
+        frozen = objective.copy()
+        frozen.name = objective.name
+    return frozen
+
+
+def freezeRows(
+    rows: dict[str, LpConstraint], frozen: dict[str, LpConstraint]
+) -> dict[str, LpConstraint]:
+    """
+    Returns a copy of the constraints ``rows`` for the clones of a problem,
+    which reuses the copies of ``frozen``, made for its previous clones, of
+    the rows that have not changed since. It is ``frozen`` itself if no row
+    changed.
+    """
+    if _sameRows(frozen, rows):
+        return frozen
+    base = {}
+    for name, row in rows.items():
+        old = frozen.get(name)
+        if (
+            old is None
+            or old.sense != row.sense
+            or old.constant != row.constant
+            or old.expr.constant != row.expr.constant
+            or not dict.__eq__(old.expr, row.expr)
+        ):
+            old = _freeze(row)
+        base[name] = old
+    return base
+
+
+class LpSharedConstraints(MutableMapping):
+    """
+    The constraints of a clone by name, sharing the rows of ``base`` with the
+    other clones of the problem until they are read by name
+
+    :param base: the constraints in common, by name, see :func:`freezeRows`.
+        It must not be modified afterwards
+    """
+
+    def __init__(self, base: dict[str, LpConstraint]):
+        self._base = base
+        # the rows of the base that were replaced, in the order of the base
+        self._rows: dict[str, LpConstraint] = {}
+        # the names of the base that were deleted
+        self._removed: set[str] = set()
+        # the rows added after the base, including the names deleted from it
+        # and added again
+        self._added: dict[str, LpConstraint] = {}
+        # the rows of _rows and _added that belong to this problem alone, and
+        # those that do but still share their expression with the base
+        self._owned: set[str] = set()
+        self._shells: set[str] = set()
+
+    def share(self) -> LpSharedConstraints:
+        """
+        Returns the constraints of a clone: the same base, and copies of the
+        rows that this mapping changed, so that neither of them sees the
+        changes made in place to the rows of the other
+        """
+        clone = LpSharedConstraints(self._base)
+        clone._removed = self._removed.copy()
+        # the rows that are not owned are shells over the base, and the rows
+        # added after it are all owned
+        clone._rows = {
+            name: _freeze(row)
+            for name, row in self._rows.items()
+            if name in self._owned
+        }
+        clone._added = {name: _freeze(row) for name, row in self._added.items()}
+        clone._owned = set(clone._rows).union(clone._added)
+        return clone
+
+    def _row(self, name: str) -> LpConstraint:
+        row = self._added.get(name)
+        if row is not None:
+            return row
+        if name in self._removed:
+            raise KeyError(name)
+        row = self._rows.get(name)
+        if row is not None:
+            return row
+        return self._base[name]
+
+    def _store(self, name: str, row: LpConstraint):
+        if name in self._added or name not in self._base or name in self._removed:
+            self._added[name] = row
+        else:
+            self._rows[name] = row
+
+    def __getitem__(self, name: str) -> LpConstraint:
+        row = self._row(name)
+        if name in self._owned:
+            return row
+        if name not in self._shells:
+            row = copy.copy(row)
+            self._store(name, row)
+        self._shells.discard(name)
+        row.expr = row.expr.copy()
+        # the copy may get new variables, see LpProblem.variables
+        LpProblem._watch(row)
+        self._owned.add(name)
+        return row
+
+    def solutionRow(self, name: str) -> LpConstraint:
+        """
+        Returns the row ``name`` to receive the dual value and slack of a
+        solution: an object of this problem, which may still share its
+        expression
+        """
+        row = self._row(name)
+        if name in self._owned or name in self._shells:
+            return row
+        row = copy.copy(row)
+        self._store(name, row)
+        self._shells.add(name)
+        return row
+
+    def __setitem__(self, name: str, row: LpConstraint):
+        self._store(name, row)
+        self._shells.discard(name)
+        self._owned.add(name)
+
+    def __delitem__(self, name: str):
+        if name in self._added:
+            del self._added[name]
+        elif name in self._base and name not in self._removed:
+            self._rows.pop(name, None)
+            self._removed.add(name)
+        else:
+            raise KeyError(name)
+        self._owned.discard(name)
+        self._shells.discard(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self._added or (
+            name in self._base and name not in self._removed
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        removed = self._removed
+        if removed:
+            yield from (name for name in self._base if name not in removed)
+        else:
+            yield from self._base
+        yield from self._added
+
+    def __len__(self) -> int:
+        return len(self._base) - len(self._removed) + len(self._added)
+
+    def values(self):
+        return [self._row(name) for name in self]
+
+    def items(self):
+        return [(name, self._row(name)) for name in self]
+
+    def copy(self) -> dict[str, LpConstraint]:
+        """Returns the rows in a new dictionary, which shares them"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
@@ -320,7 +320,7 @@ def writeMPS(
     else:
         vs = lp.variables()
         varNames = {v.name: v.name for v in vs}
-        constrNames = {c: c for c in lp.constraints}
+        constrNames = {c: c for c in lp._constraintNames()}
     model_name = lp.name
     if rename:
         model_name = "MODEL"
@@ -331,15 +331,25 @@ def writeMPS(
     # constraints
     row_lines = [
         " " + const.LpConstraintTypeToMps[c.sense] + "  " + constrNames[k] + "\n"
-        for k, c in lp.constraints.items()
+        for k, c in lp._constraints.items()
     ]
     # Creation of a dict of dict:
     # coefs[variable_name][constraint_name] = coefficient
     coefs: dict[str, dict[str, Union[int, float]]] = {varNames[v.name]: {} for v in vs}
-    for k, c in lp.constraints.items():
+    for k, c in lp._constraints.items():
         k = constrNames[k]
         for v, value in c.items():
             coefs[varNames[v.name]][k] = value
+    # rows added in bulk are written from their arrays, without materializing them
+    rhs_blocks: list[str] = []
+    for block in lp._constraintBlocks:
+        names = [constrNames[k] for k in block.names(lp)]
+        for k, (terms, sense, rhs) in zip(names, block.rows()):
+            row_lines.append(" " + const.LpConstraintTypeToMps[sense] + "  " + k + "\n")
+            for v, value in terms:
+                column = coefs[varNames[v.name]]
+                column[k] = column.get(k, 0) + value
+            rhs_blocks.append("    RHS       %-8s  % .12e\n" % (k, rhs if rhs != 0 else 0))
 
     # matrix
     columns_lines: list[str] = []
@@ -353,8 +363,8 @@ def writeMPS(
     rhs_lines = [
         "    RHS       %-8s  % .12e\n"
         % (constrNames[k], -c.constant if c.constant != 0 else 0)
-        for k, c in lp.constraints.items()
-    ]
+        for k, c in lp._constraints.items()
+    ] + rhs_blocks
     # bounds
     bound_lines: list[str] = []
     for v in vs:
@@ -461,11 +471,8 @@ def writeLP(
         objName = "OBJ"
     f.write(lp.objective.asCplexLpAffineExpression(objName, include_constant=False))
     f.write("Subject To\n")
-    ks = list(lp.constraints.keys())
-    ks.sort()
     dummyWritten = False
-    for k in ks:
-        constraint = lp.constraints[k]
+    for k, constraint in sorted(lp.constraints.items(), key=lambda item: item[0]):
         if not list(constraint.keys()):
             # empty constraint add the dummyVar
             dummyVar = lp.get_dummyVar()
@@ -100,6 +100,7 @@ Exported functions:
 
 * ``value()`` -- Finds the value of a variable or expression
 * ``lpSum()`` -- Given a list of the form [a1*x1, a2*x2, ..., an*xn] will construct a linear expression to be used as a constraint or variable
+* ``expressionBuilder()`` -- Context manager in which chained ``+``/``-`` and ``sum()`` reuse temporary expressions instead of copying them
 * ``lpDot()`` -- Given two lists of the form [a1, a2, ..., an] and [x1, x2, ..., xn] will construct a linear expression to be used as a constraint or variable
 
 Contributing to PuLP
@@ -126,6 +127,8 @@ References
 from __future__ import annotations
 
 from collections import Counter
+import contextlib
+import copy
 import sys
 import warnings
 import math
@@ -151,34 +154,142 @@ except ImportError:
 
 import re
 
+# Incremented whenever a variable is renamed or a new variable enters an
+# expression that already belongs to a problem. LpProblem.variables() only
+# rescans the model when this (or its objective / constraints) has changed.
+_structure_version = 0
+
+
+def _structure_changed():
+    global _structure_version
+    _structure_version += 1
+
+
+def _calibrate_temporary_refcount():
+    """
+    Returns the reference count a binary operator sees on an operand that
+    nothing else refers to (e.g. the ``x + y`` in ``x + y + z``, or the running
+    total of ``sum()``), or None when this interpreter cannot tell such a
+    temporary apart from an operand bound to a name.
+    """
+    getrefcount = getattr(sys, "getrefcount", None)
+    if getrefcount is None:
+        return None
+    seen = []
+
+    class Probe(dict):
+        def __add__(self, other):
+            seen.append(getrefcount(self))
+            return Probe()
+
+    Probe() + 0
+    bound = Probe()
+    bound + 0
+    sum([0, 0], Probe())
+    temporary, named, _, accumulated = seen
+    if temporary == accumulated and temporary < named:
+        return temporary
+    return None
+
+
+_TEMPORARY_REFCOUNT = _calibrate_temporary_refcount()
+# > 0 while inside expressionBuilder() (and the interpreter was calibrated)
+_building = 0
+
+
+@contextlib.contextmanager
+def expressionBuilder():
+    """
+    Context manager in which ``+``, ``-`` and ``sum()`` on expressions reuse
+    temporaries instead of copying them, so that ``x1 + x2 + ... + xn`` or
+    ``sum(a[i] * x[i] for i in I)`` build a single dictionary in linear time.
+
+    An expression is only modified in place when an operator or
+    :func:`lpSum` made it inside the block and its reference count shows that
+    no name, container or other object refers to it. Other expressions, such
+    as those of a constraint, of a problem, made before the block or returned
+    by ``@`` on a :class:`~pulp.LpVariableBlock`, are always copied. The
+    reference count alone cannot see the references held by C code: an
+    expression made in the block and then stored in a numpy object array
+    looks like a temporary, which is why this is opt-in. Outside the block,
+    and on interpreters without ``sys.getrefcount``, arithmetic always copies.
+
+        >>> x = [LpVariable(f"x{i}") for i in range(3)]
+        >>> with expressionBuilder():
+        ...     e = sum(x) + 1
+        >>> e
+        1*x0 + 1*x1 + 1*x2 + 1
+    """
+    global _building
+    if _TEMPORARY_REFCOUNT is None:
+        yield
+        return
+    _building += 1
+    try:
+        yield
+    finally:
+        _building -= 1
+
 
 class LpElement:
     """Base class for LpVariable and LpConstraintVar"""
 
+    # The attributes every element has live in slots. The __dict__ is only
+    # created for the extra attributes some solvers set (solverVar, index...)
+    __slots__ = (
+        "__name",
+        "_pendingName",
+        "hash",
+        "modified",
+        "__dict__",
+        "__weakref__",
+    )
+
     # To remove illegal characters from the names
     illegal_chars = "-+[] ->/"
     expression = re.compile(f"[{re.escape(illegal_chars)}]")
     trans = str.maketrans(illegal_chars, "________")
 
+    # Names are only formatted and sanitized the first time they are read (by
+    # a writer, a solver or the user): elements are identified by their hash,
+    # so a model can be built without any string work. Until then the name
+    # waits in _pendingName, either as given or, for generated names, as a
+    # (template, args) pair formatted with %.
+
     def setName(self, name):
-        if name:
-            if self.expression.match(name):
-                warnings.warn(
-                    "The name {} has illegal characters that will be replaced by _".format(
-                        name
-                    )
-                )
-            self.__name = str(name).translate(self.trans)
+        self.__name = None
+        self._pendingName = name if name else None
+        # names define the order of LpProblem.variables()
+        _structure_changed()
+
+    def _formatName(self):
+        name = self._pendingName
+        self._pendingName = None
+        if isinstance(name, tuple):
+            template, args = name
+            name = template % args
         else:
-            self.__name = None
+            name = str(name)
+        # not self.expression: add_expression() shadows it on variables
+        if LpElement.expression.match(name):
+            warnings.warn(
+                "The name {} has illegal characters that will be replaced by _".format(
+                    name
+                )
+            )
+        self.__name = name.translate(self.trans)
 
     def getName(self):
+        if self._pendingName is not None:
+            self._formatName()
         return self.__name
 
     name = property(fget=getName, fset=setName)
 
     def __init__(self, name):
-        self.name = name
+        # a new element is in no problem yet: no need to call setName
+        self.__name = None
+        self._pendingName = name if name else None
         # self.hash MUST be different for each variable
         # else dict() will call the comparison operators that are overloaded
         self.hash = id(self)
@@ -194,7 +305,7 @@ class LpElement:
         return self.name
 
     def __neg__(self):
-        return -LpAffineExpression(self)
+        return LpAffineExpression([(self, -1)], constant=0)._madeByOperator()
 
     def __pos__(self):
         return self
@@ -202,22 +313,28 @@ class LpElement:
     def __bool__(self) -> bool:
         return True
 
+    # the new expression is a temporary: add to it without copying it again
     def __add__(self, other):
-        return LpAffineExpression(self) + other
+        return LpAffineExpression(self)._madeByOperator().addInPlace(other)
 
     def __radd__(self, other):
-        return LpAffineExpression(self) + other
+        return LpAffineExpression(self)._madeByOperator().addInPlace(other)
 
     def __sub__(self, other):
-        return LpAffineExpression(self) - other
+        return LpAffineExpression(self)._madeByOperator().subInPlace(other)
 
     def __rsub__(self, other):
-        return other - LpAffineExpression(self)
+        e = LpAffineExpression([(self, -1)], constant=0)
+        return e._madeByOperator().addInPlace(other)
 
     def __mul__(self, other):
+        if type(other) is int or type(other) is float:
+            return LpAffineExpression._term(self, other)
         return LpAffineExpression(self) * other
 
     def __rmul__(self, other):
+        if type(other) is int or type(other) is float:
+            return LpAffineExpression._term(self, other)
         return LpAffineExpression(self) * other
 
     def __truediv__(self, other):
@@ -268,6 +385,16 @@ class LpVariable(LpElement):
     _lowbound_original: Optional[float]
     _upbound_original: Optional[float]
 
+    __slots__ = (
+        "varValue",
+        "dj",
+        "lowBound",
+        "upBound",
+        "cat",
+        "_lowbound_original",
+        "_upbound_original",
+    )
+
     def __init__(
         self,
         name: str,
@@ -743,6 +870,13 @@ class LpAffineExpression(dict):
     # to remove illegal characters from the names
     trans = str.maketrans("-+[] ", "_____")
 
+    # _in_problem is set once the expression is the objective or a constraint
+    # of a problem: from then on, adding a new variable to it invalidates
+    # LpProblem.variables()
+    # _temporary marks the results of the operators and of lpSum inside
+    # expressionBuilder(), the only expressions it may modify in place
+    __slots__ = ("__name", "constant", "_in_problem", "_temporary", "__weakref__")
+
     @property
     def name(self) -> str | None:
         return self.__name
@@ -755,16 +889,22 @@ class LpAffineExpression(dict):
             self.__name = None  # type: ignore[assignment]
 
     def __init__(self, e=None, constant: float = 0.0, name: str | None = None):
-        self.name = name
-        # TODO remove isinstance usage
-        if e is None:
-            e = {}
+        if name:
+            self.name = name
+        else:
+            self.__name = None
+        self._in_problem = False
+        self._temporary = False
         # maybe check for constant
         if not math.isfinite(constant):
             raise const.PulpError(
                 f"Invalid constant value: {constant}. It must be a finite number."
             )
-        if isinstance(e, (LpAffineExpression, LpConstraint)):
+        # TODO remove isinstance usage
+        if e is None:
+            # dict.__new__ already made the empty dict
+            self.constant = constant
+        elif isinstance(e, (LpAffineExpression, LpConstraint)):
             # Will not copy the name
             self.constant = e.constant
             super().__init__(e.items())
@@ -811,11 +951,46 @@ class LpAffineExpression(dict):
             s += v.valueOrDefault() * x
         return s
 
+    def __setitem__(self, key: LpElement, value: float | int):
+        if self._in_problem and key not in self:
+            _structure_changed()
+        dict.__setitem__(self, key, value)
+
     def addterm(self, key: LpElement, value: float | int):
         if key in self:
-            self[key] += value
+            dict.__setitem__(self, key, self[key] + value)
         else:
-            self[key] = value
+            if self._in_problem:
+                _structure_changed()
+            dict.__setitem__(self, key, value)
+
+    @classmethod
+    def _term(cls, var: LpElement, coef: int | float):
+        """
+        Builds ``coef * var`` directly, as ``LpAffineExpression(var) * coef``
+        would, without the intermediate one-term expression
+        """
+        if not math.isfinite(coef):
+            raise const.PulpError("Cannot multiply variables with NaN/inf values")
+        e = dict.__new__(cls)
+        e.__name = None
+        e._in_problem = False
+        e._temporary = _building > 0
+        if coef != 0:
+            e.constant = 0 * coef
+            dict.__setitem__(e, var, coef)
+        else:
+            e.constant = 0.0
+        return e
+
+    def __reduce__(self):
+        # the default reduction restores the items before the slots, and
+        # __setitem__ needs _in_problem
+        return (
+            self.__class__,
+            (list(self.items()), self.constant, self.name),
+            (None, {"_in_problem": self._in_problem}),
+        )
 
     def emptyCopy(self):
         return LpAffineExpression()
@@ -978,8 +1153,43 @@ class LpAffineExpression(dict):
     def subInPlace(self, other):
         return self.addInPlace(other, sign=-1)
 
+    def _madeByOperator(self):
+        """
+        Marks self, a new expression made by an operator or by lpSum, as a
+        temporary that :func:`expressionBuilder` may modify in place
+        """
+        if _building:
+            self._temporary = True
+        return self
+
+    def _reuse(self):
+        """
+        Returns self, stripped like :meth:`copy` would, to stand in for the
+        copy of a temporary (see :func:`expressionBuilder`)
+        """
+        if self.name is not None:
+            self.name = None
+        return self
+
+    def _negateInPlace(self):
+        self.constant = -self.constant
+        for v, x in self.items():
+            dict.__setitem__(self, v, -x)
+        return self
+
+    # Inside expressionBuilder(), an operand made by an operator in the block
+    # whose reference count is that of a temporary is modified in place
+    # instead of copied. The count must be read directly in the operator so
+    # the frame adds the same references as in _calibrate_temporary_refcount.
+
     def __neg__(self):
-        e = self.emptyCopy()
+        if (
+            _building
+            and self._temporary
+            and sys.getrefcount(self) <= _TEMPORARY_REFCOUNT
+        ):
+            return self._reuse()._negateInPlace()
+        e = self.emptyCopy()._madeByOperator()
         e.constant = -self.constant
         for v, x in self.items():
             e[v] = -x
@@ -989,25 +1199,49 @@ class LpAffineExpression(dict):
         return self
 
     def __add__(self, other):
-        return self.copy().addInPlace(other)
+        if (
+            _building
+            and self._temporary
+            and sys.getrefcount(self) <= _TEMPORARY_REFCOUNT
+        ):
+            return self._reuse().addInPlace(other)
+        return self.copy()._madeByOperator().addInPlace(other)
 
     def __radd__(self, other):
-        return self.copy().addInPlace(other)
+        if (
+            _building
+            and self._temporary
+            and sys.getrefcount(self) <= _TEMPORARY_REFCOUNT
+        ):
+            return self._reuse().addInPlace(other)
+        return self.copy()._madeByOperator().addInPlace(other)
 
     def __iadd__(self, other):
         return self.addInPlace(other)
 
     def __sub__(self, other):
-        return self.copy().subInPlace(other)
+        if (
+            _building
+            and self._temporary
+            and sys.getrefcount(self) <= _TEMPORARY_REFCOUNT
+        ):
+            return self._reuse().subInPlace(other)
+        return self.copy()._madeByOperator().subInPlace(other)
 
     def __rsub__(self, other):
+        if (
+            _building
+            and self._temporary
+            and sys.getrefcount(self) <= _TEMPORARY_REFCOUNT
+        ):
+            return self._reuse()._negateInPlace().addInPlace(other)
         return (-self).addInPlace(other)
 
     def __isub__(self, other):
         return (self).subInPlace(other)
 
     def __mul__(self, other):
-        e = self.emptyCopy()
+        e = self.emptyCopy()._madeByOperator()
         if isinstance(other, (LpAffineExpression, LpConstraint)):
             e.constant = self.constant * other.constant
             if len(other):
@@ -1048,7 +1282,7 @@ class LpAffineExpression(dict):
             other = other.constant
         if not math.isfinite(other):
             raise const.PulpError("Cannot divide variables with NaN/inf values")
-        e = self.emptyCopy()
+        e = self.emptyCopy()._madeByOperator()
         e.constant = self.constant / other
         for v, x in self.items():
             e[v] = x / other
@@ -1118,6 +1352,18 @@ class LpConstraint:
     pi: float | None
     slack: float | None
 
+    __slots__ = (
+        "expr",
+        "constant",
+        "__name",
+        "sense",
+        "modified",
+        "pi",
+        "slack",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         e=None,
@@ -1131,8 +1377,16 @@ class LpConstraint:
         :param name: identifying string
         :param rhs: numerical value of constraint target
         """
-        self.expr = e if isinstance(e, LpAffineExpression) else LpAffineExpression(e)
-        self.name = name
+        if isinstance(e, LpAffineExpression):
+            # the constraint refers to it from now on
+            e._temporary = False
+        else:
+            e = LpAffineExpression(e)
+        self.expr = e
+        if name is not None:
+            self.name = name
+        else:
+            self.__name = None
         # we multiply by one
         self.constant: float = float(self.expr.constant)
         if rhs is not None:
@@ -1471,6 +1725,8 @@ class LpConstraintVar(LpElement):
     a LpProblem by columns
     """
 
+    __slots__ = ("constraint",)
+
     def __init__(self, name=None, sense=None, rhs=None, e=None):
         LpElement.__init__(self, name)
         self.constraint = LpConstraint(name=self.name, sense=sense, rhs=rhs, e=e)
@@ -1504,8 +1760,8 @@ class LpProblem:
         if " " in name:
             warnings.warn("Spaces are not permitted in the name. Converted to '_'")
             name = name.replace(" ", "_")
-        self.objective: None | LpAffineExpression = None  # type: ignore[annotation-unchecked]
-        self.constraints: dict[str, LpConstraint] = {}  # type: ignore[annotation-unchecked]
+        self.objective = None
+        self.constraints = {}
         self.name = name
         self.sense = sense
         self.sos1 = {}
@@ -1518,10 +1774,17 @@ class LpProblem:
         self.modifiedVariables = []
         self.modifiedConstraints = []
         self.resolveOK = False
+        self._changeLog = None
+        # variable -> (lowBound, upBound) of this problem only, see setBounds
+        self._bounds: dict[LpVariable, tuple[float | None, float | None]] = {}  # type: ignore[annotation-unchecked]
+        # the copies of the rows and of the objective shared by the clones
+        self._cloneRows: dict[str, LpConstraint] = {}  # type: ignore[annotation-unchecked]
+        self._cloneObjective: LpAffineExpression | None = None  # type: ignore[annotation-unchecked]
         self._variables: list[LpVariable] = []  # type: ignore[annotation-unchecked]
         self._variable_ids: dict[int, LpVariable] = (  # type: ignore[annotation-unchecked]
             {}
         )  # old school using dict.keys() for a set
+        self._resetVariablesCache()
         self.dummyVar = None
         self.solutionTime = 0
         self.solutionCpuTime = 0
@@ -1546,6 +1809,120 @@ class LpProblem:
             s += v.asCplexLpVariable() + " " + const.LpCategories[v.cat] + "\n"
         return s
 
+    @property
+    def constraints(self) -> dict[str, LpConstraint]:
+        """
+        The constraints of the problem by name. Reading it turns the rows
+        added with :meth:`add_constraints_from_arrays` into
+        :class:`LpConstraint` objects.
+        """
+        if self._constraintBlocks:
+            self._materializeConstraintBlocks()
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: dict[str, LpConstraint]):
+        self._constraints = constraints
+        # rows still in array form: see add_constraints_from_arrays
+        self._constraintBlocks = []
+
+    @property
+    def objective(self) -> LpAffineExpression | None:
+        """
+        The objective of the problem. A problem made by :meth:`clone` shares
+        it with the other clones until it reads it.
+        """
+        if self._objectiveShared:
+            objective = self._objective.copy()
+            objective.name = self._objective.name
+            self._watch(objective)
+            self._objective = objective
+            self._objectiveShared = False
+        return self._objective
+
+    @objective.setter
+    def objective(self, objective: LpAffineExpression | None):
+        self._objective = objective
+        self._objectiveShared = False
+
+    @property
+    def changeLog(self):
+        """
+        The :class:`~pulp.changes.LpChangeLog` of the problem: the changes
+        made since its last commit, for solvers that update their model
+        between solves
+        """
+        if self._changeLog is None:
+            from .changes import LpChangeLog
+
+            self._changeLog = LpChangeLog(self)
+        return self._changeLog
+
+    def _materializeConstraintBlocks(self):
+        blocks, self._constraintBlocks = self._constraintBlocks, []
+        constraints = self._constraints
+        for block in blocks:
+            # their variables were registered by add_constraints_from_arrays
+            for name, constraint in block.constraints(self):
+                if name in constraints:
+                    if self.noOverlap:
+                        raise const.PulpError("overlapping constraint names: " + name)
+                    else:
+                        print("Warning: overlapping constraint names:", name)
+                constraints[name] = constraint
+                self.modifiedConstraints.append(constraint)
+                self._watch(constraint)
+
+    def _constraintNames(self):
+        """Names of all the constraints in order, without materializing any"""
+        yield from self._constraints
+        for block in self._constraintBlocks:
+            yield from block.names(self)
+
+    def _constraintBlockRows(self):
+        """name -> (block, row) for the rows not materialized yet"""
+        return {
+            name: (block, row)
+            for block in self._constraintBlocks
+            for row, name in enumerate(block.names(self))
+        }
+
+    def add_constraints_from_arrays(self, var_block, A_csr, senses, rhs, names=None):
+        """
+        Adds the rows ``A_csr @ var_block (senses) rhs`` in bulk.
+
+        The rows are kept in CSR form, with their variables registered, and only
+        become :class:`LpConstraint` objects when :attr:`constraints` is read;
+        :meth:`numConstraints`, :meth:`variables`, :meth:`writeMPS` and the
+        assignment of duals and slacks work on the arrays directly. Adding a
+        single constraint afterwards materializes them, to keep the order of
+        the rows, so add the blocks last.
+
+        :param var_block: a :class:`~pulp.LpVariableBlock` or a list of
+            variables, one per column of ``A_csr`` (in row-major order for
+            blocks of more than one dimension). Only the variables of non-empty
+            columns are created.
+        :param A_csr: the coefficient matrix: an object with ``indptr``,
+            ``indices``, ``data`` and ``shape`` (e.g. a scipy CSR matrix), a
+            scipy sparse matrix of another format or a dense 2d array
+        :param senses: :data:`~pulp.const.LpConstraintLE`,
+            :data:`~pulp.const.LpConstraintEQ` or
+            :data:`~pulp.const.LpConstraintGE`, for all rows or per row
+        :param rhs: the right hand side, for all rows or per row
+        :param names: the names of the rows; by default they are generated as
+            for unnamed constraints
+        :return: the :class:`~pulp.blocks.LpConstraintBlock` of the rows
+        """
+        from .blocks import LpConstraintBlock
+
+        block = LpConstraintBlock.fromArrays(var_block, A_csr, senses, rhs, names)
+        cacheValid = self._variablesCacheValid()
+        self._constraintBlocks.append(block)
+        self.addVariables(block.variables)
+        if cacheValid:
+            self._scanNumConstraints = self.numConstraints()
+        return block
+
     def __getstate__(self):
         # Remove transient data prior to pickling.
         state = self.__dict__.copy()
@@ -1558,12 +1935,17 @@ class LpProblem:
         self._variable_ids = {}
         for v in self._variables:
             self._variable_ids[v.hash] = v
+        self._resetVariablesCache()
 
     def copy(self):
-        """Make a copy of self. Expressions are copied by reference"""
+        """
+        Make a copy of self. Expressions are copied by reference, so changing
+        them in place changes both problems: see :meth:`clone`
+        """
         lpcopy = LpProblem(name=self.name, sense=self.sense)
         lpcopy.objective = self.objective
         lpcopy.constraints = self.constraints.copy()
+        lpcopy._bounds = self._bounds.copy()
         lpcopy.sos1 = self.sos1.copy()
         lpcopy.sos2 = self.sos2.copy()
         return lpcopy
@@ -1576,10 +1958,113 @@ class LpProblem:
         lpcopy.constraints = {}
         for k, v in self.constraints.items():
             lpcopy.constraints[k] = v.copy()
+        lpcopy._bounds = self._bounds.copy()
         lpcopy.sos1 = self.sos1.copy()
         lpcopy.sos2 = self.sos2.copy()
         return lpcopy
 
+    def clone(self):
+        """
+        Make a copy of self that shares the constraints and the objective with
+        the other clones of self until it changes them, for scenarios that
+        each change a few rows of a large model. The problem itself is left
+        as it is: the clones share a copy of its rows and of its objective,
+        made again only when they change. Finding those changes reads all
+        the rows, while a clone of a clone only copies the rows its original
+        changed, so make many scenarios from one clone of the problem.
+
+        A row is copied by the clone that reads it by name, as in
+        ``clone.constraints[name].changeRHS(rhs)``, and the objective by the
+        clone that reads :attr:`objective`, so that changes made in place
+        stay in that clone; iterating over the constraints, solving and
+        writing files share the rows.
+
+        The variables are not copied: their categories and values belong to
+        every copy of the problem, as with :meth:`copy` and :meth:`deepcopy`,
+        and so do the bounds set on them. Set the bounds of a scenario with
+        :meth:`setBounds`, which only changes the clone; the clone starts with
+        those set on self.
+
+        :return: the clone, an :class:`LpProblem`
+        """
+        from .clones import LpSharedConstraints, freezeObjective, freezeRows
+
+        lpcopy = LpProblem(name=self.name, sense=self.sense)
+        constraints = self._constraints
+        if isinstance(constraints, LpSharedConstraints):
+            lpcopy.constraints = constraints.share()
+        else:
+            self._cloneRows = freezeRows(constraints, self._cloneRows)
+            lpcopy.constraints = LpSharedConstraints(self._cloneRows)
+        # the rows still in array form are read only, apart from their
+        # solution
+        for block in self._constraintBlocks:
+            block.names(self)
+            block = copy.copy(block)
+            block.pi = block.slack = None
+            lpcopy._constraintBlocks.append(block)
+        objective = self._objective
+        if objective is not None:
+            if not self._objectiveShared:
+                objective = freezeObjective(objective, self._cloneObjective)
+                self._cloneObjective = objective
+            lpcopy._objective = objective
+            lpcopy._objectiveShared = True
+        lpcopy._bounds = self._bounds.copy()
+        lpcopy.sos1 = self.sos1.copy()
+        lpcopy.sos2 = self.sos2.copy()
+        return lpcopy
+
+    def setBounds(
+        self,
+        variable: LpVariable,
+        lowBound: float | None = None,
+        upBound: float | None = None,
+    ):
+        """
+        Sets the bounds of ``variable`` in this problem only, e.g. in one of
+        the scenarios made by :meth:`clone`: the bounds of the variable itself
+        belong to every problem that has it.
+
+        The problem gives these bounds to the variables while it is solved,
+        written to a file or exported, and then restores theirs, so do not
+        solve problems that share variables and have bounds of their own from
+        several threads at once.
+
+        :param variable: an :class:`LpVariable` of the problem
+        :param lowBound: the lower bound, None for no bound
+        :param upBound: the upper bound, None for no bound
+        """
+        self._bounds[variable] = (lowBound, upBound)
+
+    def getBounds(self, variable: LpVariable) -> tuple[float | None, float | None]:
+        """
+        Returns the bounds of ``variable`` in this problem: those set with
+        :meth:`setBounds`, or else those of the variable
+
+        :return: a tuple (lowBound, upBound)
+        """
+        bounds = self._bounds.get(variable)
+        if bounds is None:
+            return variable.lowBound, variable.upBound
+        return bounds
+
+    @contextlib.contextmanager
+    def _boundsApplied(self):
+        """Gives the variables the bounds of :meth:`setBounds` for a while"""
+        if not self._bounds:
+            yield
+            return
+        # restores what the variables had on entry, so nesting is harmless
+        saved = [(v, v.lowBound, v.upBound) for v in self._bounds]
+        try:
+            for v, (lowBound, upBound) in self._bounds.items():
+                v.lowBound, v.upBound = lowBound, upBound
+            yield
+        finally:
+            for v, lowBound, upBound in saved:
+                v.lowBound, v.upBound = lowBound, upBound
+
     def toDataclass(self) -> mpslp.MPS:
         """
         Creates a :py:class:`mpslp.MPS` from the model with as much data as possible.
@@ -1597,13 +2082,14 @@ class LpProblem:
             )
         self.fixObjective()
         assert self.objective is not None
-        variables = self.variables()
+        with self._boundsApplied():
+            variables = [v.toDataclass() for v in self.variables()]
         return mpslp.MPS(
             objective=mpslp.MPSObjective(
                 name=self.objective.name, coefficients=self.objective.toDataclass()
             ),
             constraints=[v.toDataclass() for v in self.constraints.values()],
-            variables=[v.toDataclass() for v in variables],
+            variables=variables,
             parameters=mpslp.MPSParameters(
                 name=self.name,
                 sense=self.sense,
@@ -1711,6 +2197,100 @@ class LpProblem:
         )
         return cls.fromJson(filename)
 
+    def to_arrays(self):
+        """
+        Returns the problem in matrix form: the objective vector, the
+        constraint matrix in CSR and CSC form, the row and column bounds, the
+        integrality of the columns and the names, as numpy arrays (or
+        :mod:`array` buffers without numpy)
+
+        :return: a :class:`~pulp.arrays.LpArrays`
+        """
+        from .arrays import toArrays
+
+        return toArrays(self)
+
+    @classmethod
+    def from_arrays(cls, arrays) -> tuple[dict[str, LpVariable], LpProblem]:
+        """
+        Creates a new LpProblem from its matrix form, as returned by
+        :meth:`to_arrays`
+
+        :param arrays: a :class:`~pulp.arrays.LpArrays`
+        :return: a tuple with a dictionary of variables and an LpProblem
+        """
+        from .arrays import fromArrays
+
+        return fromArrays(arrays)
+
+    def dumps(self, csc: bool = False) -> bytes:
+        """
+        Returns the problem in the binary format of :mod:`pulp.binary`: its
+        matrix form in flat arrays, compact and fast to send to another
+        process, where :meth:`loads` reads it. The SOS constraints and the
+        solution are not kept.
+
+        :param bool csc: store the constraint matrix by columns too, see
+            :func:`pulp.binary.dumps`
+        :return: bytes
+        """
+        from . import binary
+
+        return binary.dumps(self.to_arrays(), csc)
+
+    @classmethod
+    def loads(cls, data) -> tuple[dict[str, LpVariable], LpProblem]:
+        """
+        Creates a new LpProblem from the output of :meth:`dumps`. With numpy
+        the rows stay in the arrays of ``data``, as with
+        :meth:`add_constraints_from_arrays`, without being copied.
+
+        :param data: bytes or another buffer, which must not change afterwards
+        :return: a tuple with a dictionary of variables and an LpProblem
+        """
+        from . import binary
+
+        return cls.from_arrays(binary.loads(data))
+
+    def toBinary(self, filename: str, csc: bool = False):
+        """
+        Writes the problem to a file in the binary format of :meth:`dumps`
+
+        :param str filename: name of the file to write
+        :param bool csc: see :meth:`dumps`
+        """
+        from . import binary
+
+        binary.write(self.to_arrays(), filename, csc)
+
+    @classmethod
+    def fromBinary(
+        cls, filename: str, mmap: bool = False
+    ) -> tuple[dict[str, LpVariable], LpProblem]:
+        """
+        Creates a new LpProblem from a file written by :meth:`toBinary`
+
+        :param str filename: name of the file to read
+        :param bool mmap: map the file in memory instead of reading it, so
+            that the processes of a host that read the same file share its
+            arrays. Requires numpy
+        :return: a tuple with a dictionary of variables and an LpProblem
+        """
+        from . import binary
+
+        return cls.from_arrays(binary.read(filename, mmap))
+
+    def evaluator(self):
+        """
+        Returns an :class:`~pulp.arrays.LpEvaluator` of the current model, to
+        check many candidate solutions at once. The candidates give a value
+        per variable in the order of :meth:`variables`; the model is not
+        tracked, so build a new evaluator after changing it.
+        """
+        from .arrays import LpEvaluator
+
+        return LpEvaluator(self.to_arrays())
+
     @classmethod
     def fromMPS(
         cls, filename: str, sense: int = const.LpMinimize, dropConsNames: bool = False
@@ -1719,7 +2299,9 @@ class LpProblem:
         return cls.fromDataclass(data)
 
     def normalisedNames(self):
-        constraintsNames = {k: "C%07d" % i for i, k in enumerate(self.constraints)}
+        constraintsNames = {
+            k: "C%07d" % i for i, k in enumerate(self._constraintNames())
+        }
         _variables = self.variables()
         variablesNames = {k.name: "X%07d" % i for i, k in enumerate(_variables)}
         return constraintsNames, variablesNames, "OBJ"
@@ -1744,10 +2326,18 @@ class LpProblem:
             v.round(epsInt, eps)
 
     def unusedConstraintName(self):
+        """
+        Returns the name ``_C<n>`` of an unnamed row
+
+        Unlike the names of variables, this one is made when the row is added:
+        it is the key of the row in :attr:`constraints`, which addConstraint
+        and every solver and writer read. Only the rows added in bulk (see
+        :meth:`add_constraints_from_arrays`) get theirs when first read.
+        """
         self.lastUnused += 1
         while True:
             s = "_C%d" % self.lastUnused
-            if s not in self.constraints:
+            if s not in self._constraints:
                 break
             self.lastUnused += 1
         return s
@@ -1780,6 +2370,9 @@ class LpProblem:
         if variable.hash not in self._variable_ids:
             self._variables.append(variable)
             self._variable_ids[variable.hash] = variable
+            self._variablesSorted = False
+            # rebuilt on the next lookup, so that adding reads no names
+            self._variablesByName = None
 
     def addVariables(self, variables: Iterable[LpVariable]):
         """
@@ -1790,29 +2383,78 @@ class LpProblem:
         for v in variables:
             self.addVariable(v)
 
+    def _resetVariablesCache(self):
+        # state of the model at the last full scan in variables()
+        self._scanVersion = -1
+        self._scanObjective = None
+        self._scanConstraints = None
+        self._scanNumConstraints = -1
+        self._variablesSorted = False
+        # name -> variable for the variables in self._variables, built lazily
+        self._variablesByName: dict[str, LpVariable] | None = None
+
+    def _variablesCacheValid(self) -> bool:
+        return (
+            self._scanVersion == _structure_version
+            and self._scanObjective is self._objective
+            and self._scanConstraints is self._constraints
+            and self._scanNumConstraints == self.numConstraints()
+        )
+
+    @staticmethod
+    def _watch(e):
+        expr = e.expr if isinstance(e, LpConstraint) else e
+        if isinstance(expr, LpAffineExpression):
+            expr._in_problem = True
+            expr._temporary = False
+
     def variables(self) -> list[LpVariable]:
         """
         Returns the problem variables
 
+        The model is only rescanned if it changed since the last call, and
+        the list is only re-sorted when variables were added or renamed.
+
         :return: A list containing the problem variables
         :rtype: (list, :py:class:`LpVariable`)
         """
-        if self.objective:
-            self.addVariables(self.objective.keys())
-        for c in self.constraints.values():
-            self.addVariables(c.keys())
-        self._variables.sort(key=lambda v: v.name)
+        if not self._variablesCacheValid():
+            # the objective is only read here, even when shared with a clone
+            objective = self._objective
+            if objective:
+                self.addVariables(objective.keys())
+            if objective is not None:
+                self._watch(objective)
+            for c in self._constraints.values():
+                self.addVariables(c.keys())
+                self._watch(c)
+            for block in self._constraintBlocks:
+                self.addVariables(block.variables)
+            # a rescan may come from a renamed variable
+            self._variablesSorted = False
+            self._variablesByName = None
+            self._scanVersion = _structure_version
+            self._scanObjective = self._objective
+            self._scanConstraints = self._constraints
+            self._scanNumConstraints = self.numConstraints()
+        if not self._variablesSorted:
+            self._variables.sort(key=lambda v: v.name)
+            self._variablesSorted = True
         return self._variables
 
+    def _variableNameIndex(self) -> dict[str, LpVariable]:
+        """
+        name -> variable index of the problem variables, built (in O(n)) on
+        the first lookup after variables were added or the model rescanned.
+        Do not modify the returned dictionary.
+        """
+        self.variables()
+        if self._variablesByName is None:
+            self._variablesByName = {v.name: v for v in self._variables}
+        return self._variablesByName
+
     def variablesDict(self):
-        variables = {}
-        if self.objective:
-            for v in self.objective:
-                variables[v.name] = v
-        for c in self.constraints.values():
-            for v in c:
-                variables[v.name] = v
-        return variables
+        return dict(self._variableNameIndex())
 
     def add(self, constraint, name=None):
         self.addConstraint(constraint, name)
@@ -1820,6 +2462,9 @@ class LpProblem:
     def addConstraint(self, constraint: LpConstraint, name=None):
         if not isinstance(constraint, LpConstraint):
             raise TypeError("Can only add LpConstraint objects")
+        if self._constraintBlocks:
+            # rows added in bulk come first
+            self._materializeConstraintBlocks()
         if name:
             constraint.name = name
         try:
@@ -1838,9 +2483,14 @@ class LpProblem:
                 raise const.PulpError("overlapping constraint names: " + name)
             else:
                 print("Warning: overlapping constraint names:", name)
+        cacheValid = self._variablesCacheValid()
         self.constraints[name] = constraint
         self.modifiedConstraints.append(constraint)
         self.addVariables(constraint.keys())
+        self._watch(constraint)
+        if cacheValid:
+            # the variable index is already up to date with this constraint
+            self._scanNumConstraints = len(self.constraints)
 
     def setObjective(self, obj):
         """
@@ -1918,6 +2568,7 @@ class LpProblem:
         if isinstance(other, dict):
             for name, constraint in other.items():
                 self.constraints[name] = constraint
+                self.addVariables(constraint.keys())
         elif isinstance(other, LpProblem):
             for v in set(other.variables()).difference(self.variables()):
                 v.name = other.name + v.name
@@ -1940,17 +2591,16 @@ class LpProblem:
                 if not name:
                     name = self.unusedConstraintName()
                 self.constraints[name] = c
+                self.addVariables(c.keys())
 
     def coefficients(self, translation=None):
         coefs = []
         if translation is None:
-            for c in self.constraints:
-                cst = self.constraints[c]
+            for c, cst in self.constraints.items():
                 coefs.extend([(v.name, c, cst[v]) for v in cst])
         else:
-            for c in self.constraints:
+            for c, cst in self.constraints.items():
                 ctr = translation[c]
-                cst = self.constraints[c]
                 coefs.extend([(translation[v.name], ctr, cst[v]) for v in cst])
         return coefs
 
@@ -1969,14 +2619,15 @@ class LpProblem:
         Side Effects:
             - The file is created
         """
-        return mpslp.writeMPS(
-            self,
-            filename,
-            mpsSense=mpsSense,
-            rename=rename,
-            mip=mip,
-            with_objsense=with_objsense,
-        )
+        with self._boundsApplied():
+            return mpslp.writeMPS(
+                self,
+                filename,
+                mpsSense=mpsSense,
+                rename=rename,
+                mip=mip,
+                with_objsense=with_objsense,
+            )
 
     def writeLP(self, filename, writeSOS=1, mip=1, max_length=100):
         """
@@ -1991,9 +2642,14 @@ class LpProblem:
         Side Effects:
             - The file is created
         """
-        return mpslp.writeLP(
-            self, filename=filename, writeSOS=writeSOS, mip=mip, max_length=max_length
-        )
+        with self._boundsApplied():
+            return mpslp.writeLP(
+                self,
+                filename=filename,
+                writeSOS=writeSOS,
+                mip=mip,
+                max_length=max_length,
+            )
 
     def checkDuplicateVars(self) -> None:
         """
@@ -2026,36 +2682,49 @@ class LpProblem:
             )
 
     def assignVarsVals(self, values):
-        variables = self.variablesDict()
+        variables = self._variableNameIndex()
         for name in values:
             if name != "__dummy":
                 variables[name].varValue = values[name]
 
     def assignVarsDj(self, values):
-        variables = self.variablesDict()
+        variables = self._variableNameIndex()
         for name in values:
             if name != "__dummy":
                 variables[name].dj = values[name]
 
+    def _solutionRows(self):
+        """name -> constraint, to set the dual values and slacks of a solution"""
+        constraints = self._constraints
+        # the rows a clone shares get an object of their own, not a copy
+        return getattr(constraints, "solutionRow", constraints.__getitem__)
+
     def assignConsPi(self, values):
+        solutionRow = self._solutionRows()
+        blockRows = self._constraintBlockRows() if self._constraintBlocks else {}
         for name in values:
             try:
-                self.constraints[name].pi = values[name]
+                solutionRow(name).pi = values[name]
             except KeyError:
-                pass
+                if name in blockRows:
+                    block, row = blockRows[name]
+                    block.setPi(row, values[name])
 
     def assignConsSlack(self, values, activity=False):
+        solutionRow = self._solutionRows()
+        blockRows = self._constraintBlockRows() if self._constraintBlocks else {}
         for name in values:
             try:
+                constraint = solutionRow(name)
                 if activity:
                     # reports the activity not the slack
-                    self.constraints[name].slack = -1 * (
-                        self.constraints[name].constant + float(values[name])
-                    )
+                    constraint.slack = -1 * (constraint.constant + float(values[name]))
                 else:
-                    self.constraints[name].slack = float(values[name])
+                    constraint.slack = float(values[name])
             except KeyError:
-                pass
+                if name in blockRows:
+                    block, row = blockRows[name]
+                    block.setSlack(row, float(values[name]), activity)
 
     def get_dummyVar(self):
         if self.dummyVar is None:
@@ -2105,7 +2774,8 @@ class LpProblem:
         wasNone, dummyVar = self.fixObjective()
         # time it
         self.startClock()
-        status = solver.actualSolve(self, **kwargs)
+        with self._boundsApplied():
+            status = solver.actualSolve(self, **kwargs)
         self.stopClock()
         self.restoreObjective(wasNone, dummyVar)
         self.solver = solver
@@ -2155,7 +2825,8 @@ class LpProblem:
             zip(objectives, absoluteTols, relativeTols)
         ):
             self.setObjective(obj)
-            status = solver.actualSolve(self)
+            with self._boundsApplied():
+                status = solver.actualSolve(self)
             statuses.append(status)
             if debug:
                 self.writeLP(f"{i}Sequence.lp")
@@ -2174,7 +2845,8 @@ class LpProblem:
         if not (solver):
             solver = self.solver
         if self.resolveOK:
-            return self.solver.actualResolve(self, **kwargs)
+            with self._boundsApplied():
+                return self.solver.actualResolve(self, **kwargs)
         else:
             return self.solve(solver=solver, **kwargs)
 
@@ -2196,7 +2868,7 @@ class LpProblem:
 
         :return: number of constraints in model
         """
-        return len(self.constraints)
+        return len(self._constraints) + sum(len(b) for b in self._constraintBlocks)
 
     def getSense(self):
         return self.sense
@@ -2482,7 +3154,28 @@ def lpSum(
 
     :param vector: A list of linear expressions
     """
-    return LpAffineExpression().addInPlace(vector)
+    e = LpAffineExpression()._madeByOperator()
+    if isinstance(vector, (LpElement, dict, LpConstraint)) or not isinstance(
+        vector, Iterable
+    ):
+        return e.addInPlace(vector)
+    # same result as e.addInPlace(vector), with the two usual kinds of terms
+    # (variables and expressions such as coef * var) written straight into e
+    get = e.get
+    setitem = dict.__setitem__
+    for term in vector:
+        kind = type(term)
+        if kind is LpAffineExpression:
+            e.constant += term.constant
+            for v, x in term.items():
+                c = get(v)
+                setitem(e, v, x if c is None else c + x)
+        elif kind is LpVariable:
+            c = get(term)
+            setitem(e, term, 1 if c is None else c + 1)
+        else:
+            e.addInPlace(term)
+    return e
 
 
 def _vector_like(obj):
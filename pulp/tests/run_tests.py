@@ -1,7 +1,21 @@
 import unittest
 
 import pulp
-from pulp.tests import test_examples, test_gurobipy_env, test_pulp, test_sparse
+from pulp.tests import (
+    test_arrays,
+    test_binary,
+    test_blocks,
+    test_changes,
+    test_clones,
+    test_examples,
+    test_expression_builder,
+    test_gurobipy_env,
+    test_names,
+    test_pulp,
+    test_slots,
+    test_sparse,
+    test_variables_cache,
+)
 
 
 def pulpTestAll():
@@ -24,6 +38,15 @@ def get_test_suite() -> unittest.TestSuite:
     suite_all.addTests(loader.loadTestsFromTestCase(test_examples.Examples_DocsTests))
     suite_all.addTests(loader.loadTestsFromModule(test_pulp))
     suite_all.addTests(loader.loadTestsFromModule(test_sparse))
+    suite_all.addTests(loader.loadTestsFromModule(test_variables_cache))
+    suite_all.addTests(loader.loadTestsFromModule(test_expression_builder))
+    suite_all.addTests(loader.loadTestsFromModule(test_blocks))
+    suite_all.addTests(loader.loadTestsFromModule(test_slots))
+    suite_all.addTests(loader.loadTestsFromModule(test_names))
+    suite_all.addTests(loader.loadTestsFromModule(test_arrays))
+    suite_all.addTests(loader.loadTestsFromModule(test_binary))
+    suite_all.addTests(loader.loadTestsFromModule(test_changes))
+    suite_all.addTests(loader.loadTestsFromModule(test_clones))
     suite_all.addTests(loader.loadTestsFromModule(test_gurobipy_env))
 
     return suite_all
@@ -0,0 +1,169 @@
+"""
+Tests for LpProblem.to_arrays and LpProblem.from_arrays
+"""
+
+import math
+import unittest
+from array import array
+from unittest import mock
+
+from pulp import (
+    LpConstraintEQ,
+    LpConstraintLE,
+    LpInteger,
+    LpMaximize,
+    LpProblem,
+    LpVariable,
+    PULP_CBC_CMD,
+    PulpError,
+    arrays,
+    value,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def build():
+    x = [LpVariable("x0", 0, 3), LpVariable("x1", 0, cat=LpInteger), LpVariable("x2")]
+    prob = LpProblem("arrays", LpMaximize)
+    prob += 3 * x[0] + 2 * x[1] + 5
+    prob += x[0] + x[1] <= 4, "a"
+    prob += x[1] - 2.0 * x[2] >= -1, "b"
+    prob += x[2] == 1.5, "c"
+    return x, prob
+
+
+class ToArraysTest(unittest.TestCase):
+    def check(self, m):
+        self.assertEqual(m.shape, (3, 3))
+        self.assertEqual((m.name, m.sense, m.objective_constant), ("arrays", -1, 5))
+        self.assertEqual(m.row_names, ["a", "b", "c"])
+        self.assertEqual(m.col_names, ["x0", "x1", "x2"])
+        self.assertEqual(list(m.c), [3, 2, 0])
+        self.assertEqual(list(m.csr_indptr), [0, 2, 4, 5])
+        self.assertEqual(list(m.csr_indices), [0, 1, 1, 2, 2])
+        self.assertEqual(list(m.csr_data), [1, 1, 1, -2, 1])
+        self.assertEqual(list(m.csc_indptr), [0, 1, 3, 5])
+        self.assertEqual(list(m.csc_indices), [0, 0, 1, 1, 2])
+        self.assertEqual(list(m.csc_data), [1, 1, 1, -2, 1])
+        self.assertEqual(list(m.row_lower), [-math.inf, -1, 1.5])
+        self.assertEqual(list(m.row_upper), [4, math.inf, 1.5])
+        self.assertEqual(list(m.col_lower), [0, 0, -math.inf])
+        self.assertEqual(list(m.col_upper), [3, math.inf, math.inf])
+        self.assertEqual(list(m.integrality), [0, 1, 0])
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpy(self):
+        m = build()[1].to_arrays()
+        self.check(m)
+        self.assertIsInstance(m.csr_data, np.ndarray)
+        self.assertEqual(m.csc_indices.dtype, np.int64)
+
+    def test_array_buffers(self):
+        with mock.patch.object(arrays, "np", None):
+            m = build()[1].to_arrays()
+        self.check(m)
+        self.assertIsInstance(m.csr_data, array)
+        self.assertEqual(m.csc_indices.typecode, "q")
+
+    def test_without_csc(self):
+        m = arrays.toArrays(build()[1], csc=False)
+        self.assertEqual(list(m.csr_indices), [0, 1, 1, 2, 2])
+        self.assertIsNone(m.csc_indptr)
+        self.assertIsNone(m.csc_indices)
+        self.assertIsNone(m.csc_data)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_pending_rows(self):
+        x, prob = build()
+        prob.add_constraints_from_arrays(
+            x, np.array([[0, 1.0, 4.0], [2, 0, 0]]), LpConstraintLE, [9, 5], ["d", "e"]
+        )
+        m = prob.to_arrays()
+        self.assertEqual(len(prob._constraints), 3)
+        self.assertEqual(m.row_names, ["a", "b", "c", "d", "e"])
+        self.assertEqual(list(m.csr_indptr), [0, 2, 4, 5, 7, 8])
+        self.assertEqual(list(m.csr_indices[5:]), [1, 2, 0])
+        self.assertEqual(list(m.csr_data[5:]), [1, 4, 2])
+        self.assertEqual(list(m.csc_indptr), [0, 2, 5, 8])
+        self.assertEqual(list(m.row_upper[3:]), [9, 5])
+
+
+class FromArraysTest(unittest.TestCase):
+    def round_trip(self):
+        x, prob = build()
+        variables, copy = LpProblem.from_arrays(prob.to_arrays())
+        self.assertEqual(list(variables), ["x0", "x1", "x2"])
+        self.assertEqual([v.name for v in copy.variables()], ["x0", "x1", "x2"])
+        self.assertEqual(variables["x1"].cat, LpInteger)
+        self.assertEqual(variables["x0"].upBound, 3)
+        self.assertIsNone(variables["x2"].lowBound)
+        self.assertEqual(
+            {k: str(c) for k, c in copy.constraints.items()},
+            {k: str(c) for k, c in prob.constraints.items()},
+        )
+        self.assertEqual(copy.constraints["c"].sense, LpConstraintEQ)
+        prob.solve(PULP_CBC_CMD(msg=False))
+        copy.solve(PULP_CBC_CMD(msg=False))
+        self.assertAlmostEqual(value(copy.objective), value(prob.objective))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpy(self):
+        self.round_trip()
+
+    def test_array_buffers(self):
+        with mock.patch.object(arrays, "np", None):
+            self.round_trip()
+
+    def test_ranged_rows(self):
+        m = build()[1].to_arrays()
+        m.row_lower[0] = 1
+        self.assertRaises(PulpError, LpProblem.from_arrays, m)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class EvaluatorTest(unittest.TestCase):
+    def test_same_as_problem(self):
+        x, prob = build()
+        prob.add_constraints_from_arrays(x, np.array([[0, 0, 0], [1, 0, 1.0]]), -1, 3)
+        evaluator = prob.evaluator()
+        candidates = np.random.default_rng(0).uniform(-1, 4, (20, 3))
+        candidates[:4] = [[1, 2, 1.5], [3, 2, 1.5], [1, 2.5, 1.5], [0, 0, 0]]
+        gaps = evaluator.maxInfeasibility(candidates)
+        feasible = evaluator.feasible(candidates, eps=0.5)
+        for candidate, gap, ok in zip(candidates, gaps, feasible):
+            for v, val in zip(x, candidate.tolist()):
+                v.varValue = val
+            self.assertAlmostEqual(gap, prob.infeasibilityGap())
+            self.assertEqual(ok, prob.valid(eps=0.5))
+        self.assertEqual(gaps[0], 0)
+        self.assertEqual(list(feasible[:4]), [True, False, True, False])
+        self.assertEqual(evaluator.activity(candidates).shape, (20, 5))
+        activity = evaluator.activity(candidates[2])
+        self.assertEqual(list(activity), [3.5, -0.5, 1.5, 0, 2.5])
+
+    def test_solution(self):
+        x, prob = build()
+        prob.solve(PULP_CBC_CMD(msg=False))
+        evaluator = prob.evaluator()
+        solution = [v.varValue for v in prob.variables()]
+        self.assertEqual(evaluator.maxInfeasibility(solution), 0)
+        self.assertAlmostEqual(evaluator.objective(solution), value(prob.objective))
+        slack = [c.slack for c in prob.constraints.values()]
+        np.testing.assert_allclose(evaluator.slack(solution), slack)
+        integrality = evaluator.integralityViolation([0, 0.25, 0.5])
+        self.assertEqual(list(integrality), [0, 0.25, 0])
+        self.assertEqual(list(evaluator.boundViolation([4, -1, -1])), [1, 1, 0])
+
+    def test_missing_values(self):
+        evaluator = build()[1].evaluator()
+        self.assertFalse(evaluator.feasible([1, None, 1.5], eps=10))
+        self.assertRaises(ValueError, evaluator.activity, [1, 1])
+        self.assertRaises(ValueError, evaluator.activity, np.zeros((2, 2, 3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for LpProblem.dumps / LpProblem.loads and the binary format
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pulp import (
+    LpConstraintEQ,
+    LpInteger,
+    LpMaximize,
+    LpProblem,
+    PULP_CBC_CMD,
+    PulpError,
+    arrays,
+    binary,
+    value,
+)
+from pulp.tests.test_arrays import build as arrays_build
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def build():
+    x, prob = arrays_build()
+    # a row name that is not ASCII
+    row = prob.constraints.pop("c")
+    row.name = "ç"
+    prob.constraints["ç"] = row
+    return x, prob
+
+
+def fields(m):
+    return {
+        k: v if isinstance(v, (str, int, float)) else list(v)
+        for k, v in vars(m).items()
+    }
+
+
+class BinaryTest(unittest.TestCase):
+    def round_trip(self):
+        x, prob = build()
+        variables, copy = LpProblem.loads(prob.dumps())
+        self.assertEqual(list(variables), ["x0", "x1", "x2"])
+        self.assertEqual(variables["x1"].cat, LpInteger)
+        self.assertEqual(variables["x0"].upBound, 3)
+        self.assertIsNone(variables["x2"].lowBound)
+        self.assertEqual((copy.name, copy.sense), ("arrays", LpMaximize))
+        self.assertEqual(
+            {k: str(c) for k, c in copy.constraints.items()},
+            {k: str(c) for k, c in prob.constraints.items()},
+        )
+        self.assertEqual(copy.constraints["ç"].sense, LpConstraintEQ)
+        prob.solve(PULP_CBC_CMD(msg=False))
+        copy.solve(PULP_CBC_CMD(msg=False))
+        self.assertAlmostEqual(value(copy.objective), value(prob.objective))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpy(self):
+        self.round_trip()
+
+    def test_array_buffers(self):
+        with mock.patch.object(arrays, "np", None), mock.patch.object(
+            binary, "np", None
+        ):
+            self.round_trip()
+
+    def test_arrays(self):
+        m = build()[1].to_arrays()
+        for csc in (False, True):
+            self.assertEqual(fields(binary.loads(binary.dumps(m, csc))), fields(m))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_rows_are_not_copied(self):
+        data = build()[1].dumps()
+        _, prob = LpProblem.loads(data)
+        (block,) = prob._constraintBlocks
+        self.assertFalse(block.data.flags.writeable)
+        self.assertTrue(np.shares_memory(block.data, np.frombuffer(data, np.uint8)))
+        self.assertEqual(prob.numConstraints(), 3)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_memory_map(self):
+        x, prob = build()
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "problem.bin")
+            prob.toBinary(filename, csc=True)
+            m = binary.read(filename, mmap=True)
+            self.assertEqual(fields(m), fields(prob.to_arrays()))
+            self.assertIsInstance(m.csc_data.base, memoryview)
+            self.assertFalse(m.csc_data.flags.writeable)
+            _, copy = LpProblem.fromBinary(filename)
+            self.assertEqual(str(copy.constraints["b"]), "x1 - 2.0*x2 >= -1.0")
+            del m, copy
+            with mock.patch.object(binary, "np", None):
+                self.assertRaises(PulpError, binary.read, filename, mmap=True)
+
+    def test_errors(self):
+        self.assertRaises(PulpError, LpProblem.loads, b"not a model")
+        m = build()[1].to_arrays()
+        m.row_names[0] = "a\0"
+        self.assertRaises(PulpError, binary.dumps, m)
+
+
+if __name__ == "__main__":
+    unittest.main()
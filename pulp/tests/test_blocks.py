@@ -0,0 +1,215 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from pulp import (
+    LpBinary,
+    LpConstraintEQ,
+    LpConstraintGE,
+    LpConstraintLE,
+    LpMaximize,
+    LpMinimize,
+    LpProblem,
+    LpStatus,
+    LpVariable,
+    LpVariableBlock,
+    PULP_CBC_CMD,
+    PulpError,
+    lpSum,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class LpVariableBlockTest(unittest.TestCase):
+    def setUp(self):
+        self.x = LpVariableBlock("x", (10, 6, 4), lowBound=0, cat=LpBinary)
+
+    def test_declaration_is_lazy(self):
+        y = LpVariableBlock("y", (1000, 1000, 100), lowBound=0)
+        self.assertEqual(y.size, 10**8)
+        self.assertEqual(len(y._created), 0)
+        self.assertEqual(y[999, 0, 99].name, "y_999_0_99")
+        self.assertEqual(len(y._created), 1)
+
+    def test_elements_are_unique(self):
+        x = self.x
+        self.assertIs(x[3, 1, 2], x[3, 1, 2])
+        self.assertIs(x[3][1][2], x[3, 1, 2])
+        self.assertIs(x[:, 1][3, 2], x[3, 1, 2])
+        self.assertEqual((x[3, 1, 2].lowBound, x[3, 1, 2].upBound), (0, 1))
+
+    def test_slicing(self):
+        x = self.x
+        self.assertEqual(x[3, :, 2].shape, (6,))
+        self.assertEqual(x[..., 0].shape, (10, 6))
+        self.assertEqual(x[[1, 4], 0].shape, (2, 4))
+        self.assertEqual(x[2:5].shape, (3, 6, 4))
+        self.assertEqual(
+            [v.name for v in x[1, 2]], ["x_1_2_0", "x_1_2_1", "x_1_2_2", "x_1_2_3"]
+        )
+
+    def test_array_bounds(self):
+        y = LpVariableBlock("y", (3, 2), lowBound=[-1, 0], upBound=np.inf)
+        self.assertEqual((y[2, 0].lowBound, y[2, 0].upBound), (-1, None))
+        self.assertEqual(y[2, 1].lowBound, 0)
+        z = LpVariableBlock("z", 2, upBound=[1, np.nan])
+        self.assertEqual((z[0].upBound, z[1].upBound), (1, None))
+
+    def test_matmul(self):
+        x = self.x
+        e = np.arange(6.0) @ x[3, :, 2]
+        self.assertEqual(dict(e), {x[3, j, 2]: float(j) for j in range(1, 6)})
+        self.assertEqual(dict(x[3, :, 2] @ np.ones(6)), dict(x[3, :, 2].sum()))
+        a = np.array([[1, 2], [3, 4], [5, 6]])
+        rows = a @ x[0, :2, 0]
+        self.assertEqual(rows.shape, (3,))
+        self.assertEqual(dict(rows[2]), {x[0, 0, 0]: 5, x[0, 1, 0]: 6})
+        m = x[0, :3, :2]
+        self.assertEqual((np.ones(3) @ m).shape, (2,))
+        self.assertEqual((m @ np.ones(2)).shape, (3,))
+        self.assertEqual((a.T @ m).shape, (2, 2))
+        self.assertRaises(ValueError, lambda: np.ones(5) @ x[3, :, 2])
+        self.assertRaises(ValueError, lambda: np.ones(4) @ x[0])
+
+    def test_repeated_elements(self):
+        x = self.x
+        e = np.array([1, 2]) @ x[[0, 0], 0, 0]
+        self.assertEqual(dict(e), {x[0, 0, 0]: 3})
+
+    def test_solve_and_values(self):
+        x = self.x[0, :, 0]
+        prob = LpProblem("block", LpMaximize)
+        prob += np.arange(6) @ x
+        prob += x.sum() <= 2
+        prob.solve(PULP_CBC_CMD(msg=False))
+        np.testing.assert_array_equal(x.values(), [0, 0, 0, 0, 1, 1])
+        self.assertTrue(np.isnan(self.x[1, :, 0].values()).all())
+
+
+class CSR:
+    """Stands for a scipy CSR matrix"""
+
+    def __init__(self, dense):
+        self.shape = dense.shape
+        rows, self.indices = np.nonzero(dense)
+        self.data = dense[rows, self.indices]
+        self.indptr = np.concatenate(([0], np.cumsum((dense != 0).sum(axis=1))))
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class ConstraintsFromArraysTest(unittest.TestCase):
+    def setUp(self):
+        self.A = np.array([[1, 2, 0, 0], [0, 1, 1, 0], [1, 0, 0, 0]], dtype=float)
+        self.senses = [LpConstraintGE, LpConstraintGE, LpConstraintLE]
+        self.rhs = [2, 3, 4]
+
+    def bulk(self, x, A=None, names=None):
+        prob = LpProblem("bulk", LpMinimize)
+        prob += lpSum(x.variables() if isinstance(x, LpVariableBlock) else x)
+        prob.add_constraints_from_arrays(
+            x, self.A if A is None else A, self.senses, self.rhs, names
+        )
+        return prob
+
+    def classic(self, x):
+        prob = LpProblem("bulk", LpMinimize)
+        prob += lpSum(x)
+        for row, sense, rhs in zip(self.A, self.senses, self.rhs):
+            expr = lpSum(float(a) * v for a, v in zip(row, x) if a)
+            prob += expr >= rhs if sense == LpConstraintGE else expr <= rhs
+        return prob
+
+    def test_rows_stay_in_arrays(self):
+        x = LpVariableBlock("x", 4, lowBound=0)
+        prob = LpProblem("bulk")
+        block = prob.add_constraints_from_arrays(x, CSR(self.A), LpConstraintGE, 1)
+        self.assertEqual(prob.numConstraints(), 3)
+        self.assertEqual(len(prob._constraints), 0)
+        # the empty column is never created
+        self.assertEqual([v.name for v in prob.variables()], ["x_0", "x_1", "x_2"])
+        self.assertEqual(len(x._created), 3)
+        self.assertEqual(len(block), 3)
+        self.assertEqual(str(prob.constraints["_C2"]), "x_1 + x_2 >= 1.0")
+        self.assertEqual(len(prob._constraints), 3)
+        self.assertEqual(prob.numConstraints(), 3)
+
+    def test_same_as_classic_model(self):
+        x = LpVariableBlock("x", 4, lowBound=0)
+        bulk = self.bulk(x, CSR(self.A))
+        classic = self.classic(x.variables())
+        with tempfile.TemporaryDirectory() as tmp:
+            texts = []
+            for prob in (bulk, classic):
+                path = os.path.join(tmp, "model.mps")
+                prob.writeMPS(path, rename=1)
+                with open(path) as f:
+                    texts.append(f.read())
+        self.assertEqual(texts[0], texts[1])
+        self.assertEqual(len(bulk._constraints), 0)
+        self.assertEqual(
+            [str(c) for c in bulk.constraints.values()],
+            [str(c) for c in classic.constraints.values()],
+        )
+
+    def test_solution_values(self):
+        x = LpVariableBlock("x", 4, lowBound=0)
+        bulk = self.bulk(x)
+        bulk.solve(PULP_CBC_CMD(msg=False))
+        self.assertEqual(len(bulk._constraints), 0)
+        classic = self.classic([LpVariable(f"y_{i}", 0) for i in range(4)])
+        classic.solve(PULP_CBC_CMD(msg=False))
+        self.assertEqual(LpStatus[bulk.status], "Optimal")
+        for c, d in zip(bulk.constraints.values(), classic.constraints.values()):
+            self.assertAlmostEqual(c.pi, d.pi)
+            self.assertAlmostEqual(c.slack, d.slack)
+
+    def test_names_and_order(self):
+        x = [LpVariable(f"v{i}") for i in range(4)]
+        prob = self.bulk(x, names=["a", "b c", "d"])
+        prob += x[3] <= 1
+        self.assertEqual(list(prob.constraints), ["a", "b_c", "d", "_C1"])
+        prob = self.bulk(x)
+        prob += x[3] <= 1, "last"
+        prob.add_constraints_from_arrays(x, self.A[:1], LpConstraintEQ, 0)
+        self.assertEqual(list(prob.constraints), ["_C1", "_C2", "_C3", "last", "_C4"])
+
+    def test_explicit_zeros_and_duplicates(self):
+        x = [LpVariable(f"v{i}") for i in range(2)]
+
+        class Matrix:
+            shape = (1, 2)
+            indptr = [0, 3]
+            indices = [0, 1, 0]
+            data = [1.0, 0.0, 2.0]
+
+        prob = LpProblem("bulk")
+        prob.add_constraints_from_arrays(x, Matrix, LpConstraintLE, 5)
+        self.assertEqual(prob.variables(), [x[0]])
+        self.assertEqual(dict(prob.constraints["_C1"].expr), {x[0]: 3})
+
+    def test_invalid_arguments(self):
+        x = [LpVariable(f"v{i}") for i in range(4)]
+        prob = LpProblem("bulk")
+        add = prob.add_constraints_from_arrays
+        self.assertRaises(ValueError, add, x[:3], self.A, LpConstraintLE, 0)
+        self.assertRaises(PulpError, add, x, self.A, 2, 0)
+        self.assertRaises(PulpError, add, x, self.A, LpConstraintLE, np.inf)
+        self.assertRaises(ValueError, add, x, self.A, LpConstraintLE, 0, ["a"])
+        self.assertEqual(prob.numConstraints(), 0)
+
+    def test_pickle_with_pending_rows(self):
+        x = LpVariableBlock("x", 4, lowBound=0)
+        prob = pickle.loads(pickle.dumps(self.bulk(x)))
+        self.assertEqual(prob.numConstraints(), 3)
+        self.assertEqual(len(prob._constraints), 0)
+        self.assertEqual(str(prob.constraints["_C3"]), "x_0 <= 4.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
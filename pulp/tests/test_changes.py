@@ -0,0 +1,173 @@
+"""
+Tests for the change log of LpProblem and the HiGHS resolve that uses it
+"""
+
+import unittest
+
+from pulp import (
+    HiGHS,
+    LpConstraintEQ,
+    LpInteger,
+    LpMaximize,
+    LpProblem,
+    LpStatus,
+    LpVariable,
+    value,
+)
+
+
+def build():
+    x = LpVariable("x", 0, 4)
+    y = LpVariable("y", -1, 1)
+    z = LpVariable("z", 0)
+    prob = LpProblem("changes")
+    prob += x + 4 * y + 9 * z
+    prob += x + y <= 5, "c1"
+    prob += x + z >= 10, "c2"
+    prob += -y + z == 7, "c3"
+    return (x, y, z), prob
+
+
+class ChangeLogTest(unittest.TestCase):
+    def test_before_first_commit(self):
+        (x, y, z), prob = build()
+        changes = prob.changeLog.changes()
+        self.assertFalse(prob.changeLog.committed)
+        self.assertEqual(changes.addedVariables, [x, y, z])
+        self.assertEqual(changes.addedConstraints, ["c1", "c2", "c3"])
+        self.assertEqual(changes.oldRows, [])
+        self.assertEqual(changes.rows, ["c1", "c2", "c3"])
+
+    def test_no_changes(self):
+        _, prob = build()
+        prob.changeLog.commit()
+        self.assertEqual(prob.modifiedConstraints, [])
+        self.assertFalse(prob.changeLog.changes())
+
+    def test_changes(self):
+        (x, y, z), prob = build()
+        prob.changeLog.commit()
+        prob.constraints["c1"].changeRHS(3)
+        prob.constraints["c3"].sense = 1
+        x.upBound = 2
+        y.bounds(-2, 1)
+        z.cat = LpInteger
+        prob.objective[z] = 3
+        prob.constraints["c2"].expr[y] = 2
+        prob.constraints["c2"].expr.pop(z)
+        w = LpVariable("w", 0, 10)
+        prob += w + x >= 5, "c4"
+        del prob.constraints["c1"]
+        prob.sense = LpMaximize
+
+        changes = prob.changeLog.changes()
+        self.assertTrue(changes)
+        self.assertEqual(changes.addedVariables, [w])
+        self.assertEqual(changes.removedVariables, [])
+        self.assertEqual(changes.boundChanges, [x, y])
+        self.assertEqual(changes.categoryChanges, [z])
+        self.assertEqual(changes.objectiveChanges, {z: 3})
+        self.assertTrue(changes.senseChanged)
+        self.assertEqual(changes.addedConstraints, ["c4"])
+        self.assertEqual(changes.removedConstraints, ["c1"])
+        self.assertEqual(changes.rhsChanges, ["c3"])
+        self.assertEqual(changes.coefficientChanges, {"c2": {x: 1, y: 2}})
+        self.assertEqual(changes.oldRows, ["c1", "c2", "c3"])
+        self.assertEqual(changes.rows, ["c2", "c3", "c4"])
+        self.assertEqual(changes.columns, [x, y, z, w])
+
+        prob.changeLog.commit(changes)
+        self.assertFalse(prob.changeLog.changes())
+
+    def test_rows_by_name(self):
+        (x, y, z), prob = build()
+        prob.changeLog.commit()
+        del prob.constraints["c1"]
+        prob += x >= 1, "c1"
+        changes = prob.changeLog.changes()
+        self.assertEqual(changes.removedConstraints, [])
+        self.assertEqual(changes.rhsChanges, ["c1"])
+        self.assertEqual(changes.coefficientChanges, {"c1": {x: 1}})
+
+    def test_order_is_kept(self):
+        (x, y, z), prob = build()
+        prob.changeLog.commit()
+        del prob.constraints["c2"]
+        prob += y <= 0, "c0"
+        changes = prob.changeLog.changes()
+        self.assertEqual(changes.rows, ["c1", "c3", "c0"])
+        prob.changeLog.commit(changes)
+        prob += x <= 3, "c2"
+        self.assertEqual(prob.changeLog.changes().rows, ["c1", "c3", "c0", "c2"])
+
+
+@unittest.skipUnless(HiGHS().available(), "HiGHS not available")
+class HiGHSResolveTest(unittest.TestCase):
+    def check(self, prob):
+        """resolves prob and compares with a new solve of a copy"""
+        status = prob.resolve()
+        solution = (
+            LpStatus[status],
+            {v.name: (v.varValue, v.dj) for v in prob.variables()},
+            value(prob.objective),
+            {k: (c.pi, c.slack) for k, c in prob.constraints.items()},
+        )
+        copy = prob.deepcopy()
+        copy.addVariables(prob.variables())
+        copy.solve(HiGHS(msg=False))
+        for (name, (varValue, dj)), v in zip(solution[1].items(), copy.variables()):
+            self.assertAlmostEqual(varValue, v.varValue, msg=name)
+            self.assertAlmostEqual(dj, v.dj, msg=name)
+        self.assertAlmostEqual(solution[2], value(copy.objective))
+        for name, c in copy.constraints.items():
+            self.assertAlmostEqual(solution[3][name][0], c.pi, msg=name)
+            self.assertAlmostEqual(solution[3][name][1], c.slack, msg=name)
+        self.assertEqual(solution[0], "Optimal")
+
+    def test_resolve(self):
+        (x, y, z), prob = build()
+        prob.solve(HiGHS(msg=False))
+        self.assertFalse(prob.changeLog.committed)
+        # the first resolve builds the model again and starts the change log
+        self.check(prob)
+        model = prob.solverModel
+        self.assertFalse(prob.changeLog.changes())
+
+        prob.constraints["c2"].expr[y] = 2
+        prob.constraints["c2"].expr.pop(z)
+        prob.constraints["c2"].changeRHS(5)
+        self.check(prob)
+
+        prob.objective[z] = 3
+        y.bounds(None, 3)
+        prob.constraints["c3"].changeRHS(2)
+        self.check(prob)
+
+        del prob.constraints["c1"]
+        prob.objective[x] = -1
+        u = LpVariable("u", 0, 5)
+        prob += u + y >= 1, "c5"
+        prob += u + x <= 4, "c6"
+        self.check(prob)
+
+        z.cat = LpInteger
+        prob.constraints["c3"].changeRHS(2.5)
+        self.check(prob)
+        self.assertIs(prob.solverModel, model)
+
+        prob.sense = LpMaximize
+        prob.objective = -prob.objective
+        self.check(prob)
+
+    def test_constraint_sense(self):
+        (x, y, z), prob = build()
+        prob.solve(HiGHS(msg=False))
+        prob.resolve()
+        prob.constraints["c2"].sense = LpConstraintEQ
+        prob.constraints["c2"].changeRHS(11)
+        self.check(prob)
+        self.assertAlmostEqual(x.varValue + z.varValue, 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
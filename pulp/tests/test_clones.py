@@ -0,0 +1,224 @@
+"""
+Tests for LpProblem.clone
+"""
+
+import unittest
+
+from pulp import (
+    HiGHS,
+    LpConstraintEQ,
+    LpProblem,
+    LpVariable,
+    PULP_CBC_CMD,
+    value,
+)
+from pulp.tests.test_changes import build as changes_build
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def build():
+    (x, y, z), prob = changes_build()
+    prob.objective.name = "obj"
+    return (x, y, z), prob
+
+
+def rows(prob):
+    return {name: str(c) for name, c in prob.constraints.items()}
+
+
+class CloneTest(unittest.TestCase):
+    def test_shares_until_changed(self):
+        (x, y, z), prob = build()
+        before = rows(prob)
+        clone = prob.clone()
+        self.assertEqual(rows(clone), before)
+        c1 = clone._constraints._base["c1"]
+        self.assertIs(clone.constraints.values()[0], c1)
+        self.assertIsNot(c1, prob.constraints["c1"])
+
+        clone.constraints["c1"].changeRHS(3)
+        clone.constraints["c2"].expr[y] = 2
+        clone.constraints["c3"].addInPlace(x)
+        clone.objective[z] = 3
+        self.assertEqual(rows(prob), before)
+        self.assertEqual(str(prob.objective), "x + 4*y + 9*z")
+        self.assertEqual(str(clone.objective), "x + 4*y + 3*z")
+        self.assertEqual(clone.objective.name, "obj")
+        self.assertEqual(str(clone.constraints["c1"]), "x + y <= 3")
+        self.assertEqual(str(clone.constraints["c2"]), "x + 2*y + z >= 10.0")
+        self.assertEqual(str(clone.constraints["c3"]), "x - y + z = 7.0")
+        self.assertIsNot(clone.constraints["c1"], c1)
+        self.assertEqual(clone.constraints["c1"].name, "c1")
+
+        # and the other way round
+        prob.constraints["c1"].changeRHS(1)
+        self.assertEqual(str(prob.constraints["c1"]), "x + y <= 1")
+        self.assertEqual(str(clone.constraints["c1"]), "x + y <= 3")
+        self.assertEqual(str(c1), "x + y <= 5.0")
+
+    def test_original_is_untouched(self):
+        (x, y, z), prob = build()
+        constraints, objective = prob.constraints, prob.objective
+        c2 = constraints["c2"]
+        clone = prob.clone()
+        self.assertIs(prob.constraints, constraints)
+        self.assertIs(prob.constraints["c2"], c2)
+        self.assertIs(prob.objective, objective)
+        # changes in place to the objects held before cloning
+        objective += 5 * x
+        c2.changeRHS(1)
+        c2.addInPlace(y)
+        self.assertEqual(str(prob.objective), "6*x + 4*y + 9*z")
+        self.assertEqual(str(prob.constraints["c2"]), "x + y + z >= 1")
+        self.assertEqual(str(clone.objective), "x + 4*y + 9*z")
+        self.assertEqual(str(clone.constraints["c2"]), "x + z >= 10.0")
+        # the copy of the rows is made again for the next clones
+        other = prob.clone()
+        self.assertEqual(str(other.objective), "6*x + 4*y + 9*z")
+        self.assertEqual(str(other.constraints["c2"]), "x + y + z >= 1")
+        self.assertIs(other._constraints._base["c1"], clone._constraints._base["c1"])
+
+    def test_copies_are_reused(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        other = prob.clone()
+        self.assertIs(other._constraints._base, clone._constraints._base)
+        self.assertIs(other._objective, clone._objective)
+        del prob.constraints["c3"]
+        self.assertEqual(list(prob.clone().constraints), ["c1", "c2"])
+        self.assertEqual(list(clone.constraints), ["c1", "c2", "c3"])
+
+    def test_held_rows_get_duals(self):
+        x, y = LpVariable("x", 0), LpVariable("y", 0)
+        prob = LpProblem("held")
+        prob += x + 2 * y
+        c = x + y >= 3
+        prob += c, "c"
+        clone = prob.clone()
+        clone.constraints["c"].changeRHS(4)
+        prob.solve(PULP_CBC_CMD(msg=False))
+        self.assertAlmostEqual(value(prob.objective), 3)
+        clone.solve(PULP_CBC_CMD(msg=False))
+        self.assertAlmostEqual(value(clone.objective), 4)
+        self.assertIs(prob.constraints["c"], c)
+        self.assertEqual(c.pi, 1)
+        self.assertEqual(clone.constraints["c"].pi, 1)
+
+    def test_add_and_delete(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        w = LpVariable("w", 0, 1)
+        del clone.constraints["c2"]
+        clone += w + x >= 1, "c4"
+        clone += x <= 2, "c2"
+        self.assertEqual(list(clone.constraints), ["c1", "c3", "c4", "c2"])
+        self.assertEqual(clone.numConstraints(), 4)
+        self.assertEqual([v.name for v in clone.variables()], ["w", "x", "y", "z"])
+        self.assertEqual(list(prob.constraints), ["c1", "c2", "c3"])
+        self.assertEqual([v.name for v in prob.variables()], ["x", "y", "z"])
+        self.assertNotIn("c4", prob.constraints)
+        self.assertRaises(KeyError, clone.constraints.__getitem__, "c5")
+
+    def test_new_variable_in_shared_row(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        self.assertEqual(len(clone.variables()), 3)
+        w = LpVariable("w")
+        clone.constraints["c1"].expr[w] = 1
+        self.assertEqual(len(clone.variables()), 4)
+        self.assertEqual(len(prob.variables()), 3)
+
+    def test_clone_of_clone(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        clone.constraints["c1"].changeRHS(3)
+        del clone.constraints["c3"]
+        held = clone.constraints["c1"]
+        other = clone.clone()
+        self.assertIs(other._constraints._base, clone._constraints._base)
+        other.constraints["c1"].changeRHS(2)
+        held.changeRHS(3)
+        self.assertEqual(str(clone.constraints["c1"]), "x + y <= 3")
+        self.assertEqual(str(other.constraints["c1"]), "x + y <= 2")
+        self.assertEqual(str(prob.constraints["c1"]), "x + y <= 5.0")
+        self.assertEqual(list(other.constraints), ["c1", "c2"])
+
+    def test_solutions(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        clone.constraints["c3"].changeRHS(8)
+        clone.constraints["c2"].sense = LpConstraintEQ
+        for problem, objective in ((prob, 54), (clone, 62)):
+            problem.solve(PULP_CBC_CMD(msg=False))
+            self.assertAlmostEqual(value(problem.objective), objective)
+        # the solution has rows of its own, the expressions are still shared
+        row, base = clone._constraints._rows["c1"], clone._constraints._base["c1"]
+        self.assertIsNot(row, base)
+        self.assertIs(row.expr, base.expr)
+        self.assertAlmostEqual(prob.constraints["c1"].slack, 2)
+        self.assertAlmostEqual(clone.constraints["c1"].slack, 3)
+
+    @unittest.skipUnless(HiGHS().available(), "HiGHS not available")
+    def test_highs_duals(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        clone.constraints["c1"].changeRHS(4)
+        clone.objective[x] = 10
+        prob.solve(HiGHS(msg=False))
+        clone.solve(HiGHS(msg=False))
+        self.assertAlmostEqual(value(clone.objective), 90)
+        self.assertEqual([c.pi for c in prob.constraints.values()], [0, 1, 8])
+        self.assertEqual([c.pi for c in clone.constraints.values()], [0, 10, -1])
+        self.assertEqual(prob.constraints["c1"].slack, 2)
+        self.assertEqual(clone.constraints["c1"].slack, 1)
+
+    def test_bounds(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        clone.setBounds(x, 0, 2)
+        other = clone.clone()
+        self.assertEqual(other.getBounds(x), (0, 2))
+        other.setBounds(x, 0, 3)
+        self.assertEqual(prob.getBounds(x), (0, 4))
+        self.assertEqual(clone.getBounds(x), (0, 2))
+        self.assertEqual(clone.getBounds(y), (-1, 1))
+        for problem, objective in ((prob, 54), (clone, 78), (other, 66)):
+            problem.solve(PULP_CBC_CMD(msg=False))
+            self.assertAlmostEqual(value(problem.objective), objective)
+        self.assertEqual((x.lowBound, x.upBound), (0, 4))
+        self.assertEqual(list(clone.to_arrays().col_upper), [2, 1, float("inf")])
+        self.assertEqual(list(prob.to_arrays().col_upper), [4, 1, float("inf")])
+        self.assertEqual(clone.toDict()["variables"][0]["upBound"], 2)
+
+    @unittest.skipUnless(HiGHS().available(), "HiGHS not available")
+    def test_highs_bounds(self):
+        (x, y, z), prob = build()
+        clone = prob.clone()
+        clone.setBounds(x, 0, 2)
+        clone.solve(HiGHS(msg=False))
+        self.assertAlmostEqual(value(clone.objective), 78)
+        prob.solve(HiGHS(msg=False))
+        self.assertAlmostEqual(value(prob.objective), 54)
+        self.assertEqual(x.upBound, 4)
+        # a resolve of the clone gets its bounds too
+        clone.constraints["c1"].changeRHS(4)
+        clone.resolve()
+        self.assertAlmostEqual(value(clone.objective), 78)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_blocks(self):
+        (x, y, z), prob = build()
+        prob.add_constraints_from_arrays([x, y], np.array([[1.0, 1], [0, 1]]), -1, 6)
+        clone = prob.clone()
+        self.assertEqual(clone.numConstraints(), 5)
+        self.assertEqual(list(clone.constraints)[3:], ["_C1", "_C2"])
+        self.assertEqual(len(prob._constraintBlocks), 1)
+        self.assertEqual(list(prob.constraints)[3:], ["_C1", "_C2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
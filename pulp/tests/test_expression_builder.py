@@ -0,0 +1,135 @@
+import unittest
+
+from pulp import (
+    LpAffineExpression,
+    LpVariable,
+    LpVariableBlock,
+    PulpError,
+    expressionBuilder,
+    lpSum,
+)
+from pulp import pulp as pulp_module
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ExpressionBuilderTest(unittest.TestCase):
+    def setUp(self):
+        self.x = [LpVariable(f"x{i}") for i in range(5)]
+
+    def test_sum_matches_lpSum(self):
+        with expressionBuilder():
+            e = sum(2 * v for v in self.x) - 3
+        self.assertEqual(dict(e), dict(lpSum(2 * v for v in self.x)))
+        self.assertEqual(e.constant, -3)
+
+    def test_named_operands_are_not_modified(self):
+        x = self.x
+        with expressionBuilder():
+            a = x[0] + x[1]
+            b = a + x[2]
+            c = a - x[3]
+            d = 5 - a
+            items = [x[0] + 1]
+            f = items[0] + x[4]
+        self.assertEqual(str(a), "x0 + x1")
+        self.assertEqual(str(b), "x0 + x1 + x2")
+        self.assertEqual(str(c), "x0 + x1 - x3")
+        self.assertEqual(str(d), "-x0 - x1 + 5")
+        self.assertEqual(str(items[0]), "x0 + 1")
+        self.assertEqual(str(f), "x0 + x4 + 1")
+
+    def test_temporaries_keep_copy_semantics(self):
+        x = self.x
+        with expressionBuilder():
+            e = LpAffineExpression(x[0], name="tmp") + x[1]
+            n = -(x[0] + x[1] + 2)
+            r = 1 - (x[2] - x[3])
+        self.assertIsNone(e.name)
+        self.assertEqual(str(n), "-x0 - x1 - 2")
+        self.assertEqual(str(r), "-x2 + x3 + 1")
+
+    @unittest.skipIf(
+        pulp_module._TEMPORARY_REFCOUNT is None, "no reference counts to calibrate"
+    )
+    def test_temporaries_are_reused(self):
+        x = self.x
+        seen = []
+
+        def keep(e):
+            seen.append(id(e))
+            return e
+
+        with expressionBuilder():
+            total = keep(x[0] + x[1]) + x[2]
+            self.assertEqual(id(total), seen[0])
+            self.assertEqual(pulp_module._building, 1)
+            with expressionBuilder():
+                pass
+            self.assertEqual(pulp_module._building, 1)
+        self.assertEqual(pulp_module._building, 0)
+        e = x[0] + x[1]
+        self.assertIsNot(e + x[2], e)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_arrays_are_not_modified(self):
+        # the ufuncs of object arrays hand the items to the operators without
+        # a reference that the reference count can see
+        x = self.x
+        a = np.array([x[0] + x[1], x[2] + 1], dtype=object)
+        m = LpVariableBlock("b", (2, 2)) @ np.array([[1, 2], [3, 4]])
+        with expressionBuilder():
+            e = a + x[3]
+            f = m - 1
+            g = -m
+        self.assertEqual([str(v) for v in a], ["x0 + x1", "x2 + 1"])
+        self.assertEqual([str(v) for v in e], ["x0 + x1 + x3", "x2 + x3 + 1"])
+        self.assertEqual(str(m[0, 0]), "b_0_0 + 3*b_0_1")
+        self.assertEqual(str(f[0, 0]), "b_0_0 + 3*b_0_1 - 1.0")
+        self.assertEqual(str(m[1, 1]), "2*b_1_0 + 4*b_1_1")
+        self.assertEqual(str(g[1, 1]), "-2*b_1_0 - 4*b_1_1")
+
+    def test_outside_builder_copies(self):
+        x = self.x
+        e = x[0] + x[1]
+        before = dict(e)
+        (e + x[2]) + x[3]
+        self.assertEqual(dict(e), before)
+
+
+class TermAndLpSumTest(unittest.TestCase):
+    def setUp(self):
+        self.x = LpVariable("x")
+        self.y = LpVariable("y")
+
+    def test_scalar_times_variable(self):
+        x = self.x
+        self.assertEqual(repr(3 * x), "3*x + 0")
+        self.assertEqual(repr(x * 2.5), "2.5*x + 0.0")
+        self.assertEqual(repr(0 * x), "0.0")
+        self.assertIsNone((3 * x).name)
+        self.assertRaises(PulpError, lambda: x * float("nan"))
+
+    def test_lpSum_mixed_terms(self):
+        x, y = self.x, self.y
+        e = lpSum([2 * x, y, 3, [x, 1], x + y + 1, {"a": y}])
+        self.assertEqual(dict(e), {x: 4, y: 3})
+        self.assertEqual(e.constant, 5)
+        self.assertEqual(dict(lpSum(x)), {x: 1})
+        self.assertEqual(lpSum(5).constant, 5)
+        self.assertEqual(dict(lpSum({1: x, 2: 2 * y})), {x: 1, y: 2})
+        self.assertRaises(PulpError, lpSum, [x, float("inf")])
+
+    def test_lpSum_does_not_modify_terms(self):
+        x, y = self.x, self.y
+        term = 2 * x + y
+        e = lpSum([term, term])
+        self.assertEqual(dict(term), {x: 2, y: 1})
+        self.assertEqual(dict(e), {x: 4, y: 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import pickle
+import unittest
+import warnings
+
+from pulp import (
+    LpAffineExpression,
+    LpConstraint,
+    LpConstraintVar,
+    LpProblem,
+    LpVariable,
+)
+from pulp import pulp as pulp_module
+
+
+class LazyNameTest(unittest.TestCase):
+    def test_name_is_formatted_when_read(self):
+        x = LpVariable("a b")
+        self.assertEqual(x._pendingName, "a b")
+        self.assertEqual(x.name, "a_b")
+        self.assertIsNone(x._pendingName)
+        self.assertEqual(str(x), "a_b")
+
+    def test_generated_name(self):
+        x = LpVariable(("x_%d_%d", (3, 4)), 0, 1)
+        self.assertEqual(x.name, "x_3_4")
+        self.assertEqual(repr(2 * x), "2*x_3_4 + 0")
+
+    def test_illegal_characters_warn_on_first_read(self):
+        x = LpVariable("-x")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(x.name, "_x")
+            self.assertEqual(x.name, "_x")
+        self.assertEqual(len(caught), 1)
+
+    def test_empty_names(self):
+        self.assertIsNone(LpVariable("").name)
+        self.assertIsNone(LpVariable(None).name)
+        self.assertIsNone(LpAffineExpression().name)
+        self.assertIsNone(LpConstraint().name)
+        self.assertEqual(LpAffineExpression(name="a-b").name, "a_b")
+
+    def test_creation_keeps_variables_cache(self):
+        prob = LpProblem("names")
+        prob += LpVariable("x") >= 1
+        prob.variables()
+        version = pulp_module._structure_version
+        LpVariable("y")
+        self.assertEqual(pulp_module._structure_version, version)
+        self.assertTrue(prob._variablesCacheValid())
+
+    def test_rename_before_and_after_read(self):
+        x = LpVariable("x")
+        x.name = "y[1]"
+        self.assertEqual(x.name, "y_1_")
+        x.name = "z"
+        self.assertEqual(x.name, "z")
+
+    def test_column_wise_variable(self):
+        obj = LpConstraintVar("obj")
+        x = LpVariable("x", 0, None, e=2 * obj)
+        self.assertEqual(x.name, "x")
+
+    def test_pickle_pending_name(self):
+        x = pickle.loads(pickle.dumps(LpVariable(("v_%d", (7,)))))
+        self.assertEqual(x.name, "v_7")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import copy
+import pickle
+import unittest
+import weakref
+
+from pulp import (
+    LpAffineExpression,
+    LpConstraint,
+    LpConstraintGE,
+    LpConstraintVar,
+    LpVariable,
+)
+
+
+class SlotsTest(unittest.TestCase):
+    def setUp(self):
+        self.x = LpVariable("x", 0, 4)
+        self.y = LpVariable("y", cat="Binary")
+
+    def test_no_instance_dict_by_default(self):
+        expr = 2 * self.x + self.y + 1
+        row = LpConstraint(expr, LpConstraintGE, "c", 2)
+        self.assertFalse(hasattr(expr, "__dict__"))
+        for obj in (self.x, row, LpConstraintVar("cv")):
+            self.assertEqual(obj.__dict__, {})
+
+    def test_solver_attributes(self):
+        self.x.solverVar = "handle"
+        row = LpConstraint(self.x, LpConstraintGE, "c", 2)
+        row.solverConstraint = 3
+        obj = LpConstraintVar("obj")
+        self.x.add_expression(2 * obj)
+        self.assertEqual(self.x.solverVar, "handle")
+        self.assertEqual(row.solverConstraint, 3)
+        self.assertEqual(str(self.x.expression), "2*obj")
+        self.assertEqual(dict(obj.constraint.expr), {self.x: 2})
+        self.assertIsNotNone(LpVariable.expression.match("-x"))
+        with self.assertRaises(AttributeError):
+            (self.x + 1).solverVar = 1
+
+    def test_weakrefs(self):
+        for obj in (self.x, self.x + 1, LpConstraint(self.x)):
+            self.assertIs(weakref.ref(obj)(), obj)
+
+    def test_pickle_and_copy(self):
+        expr = LpAffineExpression([(self.x, 2), (self.y, -1)], 3, name="e")
+        expr._in_problem = True
+        row = LpConstraint(expr, LpConstraintGE, "c", 2)
+        self.x.solverVar = 7
+        for dup in (pickle.loads(pickle.dumps(row)), copy.deepcopy(row)):
+            x, y = sorted(dup.keys(), key=lambda v: v.name)
+            self.assertEqual((x.name, x.lowBound, x.upBound, x.solverVar), ("x", 0, 4, 7))
+            self.assertEqual((y.cat, y.upBound), ("Integer", 1))
+            self.assertEqual(dict(dup.expr), {x: 2, y: -1})
+            self.assertEqual((dup.expr.constant, dup.expr.name), (3, "e"))
+            self.assertTrue(dup.expr._in_problem)
+            self.assertEqual(str(dup), str(row))
+        self.assertEqual(dict(copy.copy(expr)), dict(expr))
+
+
+if __name__ == "__main__":
+    unittest.main()
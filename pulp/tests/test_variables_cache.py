@@ -0,0 +1,134 @@
+import pickle
+import unittest
+
+from pulp import (
+    LpAffineExpression,
+    LpConstraint,
+    LpConstraintEQ,
+    LpConstraintVar,
+    LpMinimize,
+    LpProblem,
+    LpVariable,
+)
+
+
+def names(prob):
+    return [v.name for v in prob.variables()]
+
+
+class VariablesCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.x = LpVariable("x", 0, 4)
+        self.y = LpVariable("y", -1, 1)
+        self.z = LpVariable("z", 0)
+        self.prob = LpProblem("cache", LpMinimize)
+        self.prob += self.x + 4 * self.y
+        self.prob += self.x + self.y <= 5, "c1"
+
+    def test_unchanged_model_is_not_rescanned(self):
+        first = self.prob.variables()
+        self.assertEqual(names(self.prob), ["x", "y"])
+        self.assertTrue(self.prob._variablesCacheValid())
+        self.assertIs(self.prob.variables(), first)
+
+    def test_new_constraint(self):
+        self.prob.variables()
+        self.prob += self.z - self.x >= 1, "c2"
+        self.assertTrue(self.prob._variablesCacheValid())
+        self.assertEqual(names(self.prob), ["x", "y", "z"])
+
+    def test_constraint_mutated_in_place(self):
+        self.prob.variables()
+        self.prob.constraints["c1"].addInPlace(self.z)
+        self.assertEqual(names(self.prob), ["x", "y", "z"])
+
+    def test_expression_item_assignment(self):
+        self.prob.variables()
+        self.prob.constraints["c1"].expr[self.z] = 2
+        self.assertEqual(names(self.prob), ["x", "y", "z"])
+
+    def test_objective_mutated_and_replaced(self):
+        self.prob.variables()
+        self.prob.objective += self.z
+        self.assertEqual(names(self.prob), ["x", "y", "z"])
+        w = LpVariable("w")
+        self.prob.setObjective(w + self.x)
+        self.assertEqual(names(self.prob), ["w", "x", "y", "z"])
+
+    def test_rename_resorts(self):
+        self.prob.variables()
+        self.x.name = "zz"
+        self.assertEqual(names(self.prob), ["y", "zz"])
+
+    def test_direct_constraint_assignment(self):
+        self.prob.variables()
+        self.prob.constraints["c2"] = LpConstraint(self.z, rhs=1)
+        self.assertEqual(names(self.prob), ["x", "y", "z"])
+
+    def test_extend_registers_variables(self):
+        self.prob.extend({"c2": self.z >= 1})
+        self.assertEqual(self.prob.numVariables(), 3)
+        self.prob.extend([("c3", LpVariable("a") <= 1)])
+        self.assertEqual(self.prob.numVariables(), 4)
+        self.assertEqual(names(self.prob), ["a", "x", "y", "z"])
+
+    def test_column_wise(self):
+        prob = LpProblem("columns", LpMinimize)
+        obj = LpConstraintVar("obj")
+        c1 = LpConstraintVar("c1", LpConstraintEQ, 1)
+        prob.setObjective(obj)
+        prob += c1
+        a = LpVariable("a", 0, None, e=obj + c1)
+        self.assertEqual(names(prob), ["a"])
+        LpVariable("b", 0, None, e=2 * obj + c1)
+        self.assertEqual(names(prob), ["a", "b"])
+
+    def test_pickle_round_trip(self):
+        self.prob.variables()
+        prob = pickle.loads(pickle.dumps(self.prob))
+        self.assertFalse(prob._variablesCacheValid())
+        self.assertEqual(names(prob), ["x", "y"])
+        z = LpVariable("z")
+        prob.constraints["c1"].addInPlace(z)
+        self.assertEqual(names(prob), ["x", "y", "z"])
+
+    def test_copy(self):
+        self.prob.variables()
+        copy = self.prob.deepcopy()
+        copy += self.z >= 1, "c2"
+        self.assertEqual(names(copy), ["x", "y", "z"])
+        self.assertEqual(names(self.prob), ["x", "y"])
+
+    def test_fresh_expressions_keep_cache(self):
+        self.prob.variables()
+        LpAffineExpression([(self.x, 1), (self.z, 2)]) + self.y
+        self.assertTrue(self.prob._variablesCacheValid())
+
+    def test_name_index(self):
+        self.assertEqual(self.prob.variablesDict(), {"x": self.x, "y": self.y})
+        self.prob += self.z >= 1, "c2"
+        self.assertIs(self.prob.variablesDict()["z"], self.z)
+        self.z.name = "w"
+        self.assertEqual(sorted(self.prob.variablesDict()), ["w", "x", "y"])
+
+    def test_name_index_is_rebuilt_lazily(self):
+        self.prob.variablesDict()
+        self.prob.addVariable(self.z)
+        self.assertIsNone(self.prob._variablesByName)
+        self.assertIs(self.prob.variablesDict()["z"], self.z)
+
+    def test_variables_dict_is_a_copy(self):
+        self.prob.variablesDict().clear()
+        self.assertEqual(sorted(self.prob.variablesDict()), ["x", "y"])
+
+    def test_assign_values_after_changes(self):
+        self.prob.assignVarsVals({"x": 1, "y": 0})
+        self.prob.constraints["c1"].addInPlace(self.z)
+        self.prob.assignVarsVals({"x": 2, "y": 1, "z": 3, "__dummy": 0})
+        self.prob.assignVarsDj({"z": 0.5})
+        self.assertEqual((self.x.varValue, self.y.varValue, self.z.varValue), (2, 1, 3))
+        self.assertEqual(self.z.dj, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
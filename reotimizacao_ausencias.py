@@ -0,0 +1,133 @@
+# reotimizacao_ausencias.py
+"""Re-otimização da escala após ausências (ex.: engenheiro afastado por doença).
+
+Parte da escala já resolvida por build_model, fixa X = 0 para os ausentes,
+penaliza cada atribuição que muda em relação à escala anterior e resolve
+novamente com warmStart a partir da solução anterior. O objetivo e os limites
+das variáveis são restaurados depois da re-otimização.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import time
+from dataclasses import dataclass
+
+import pulp
+
+
+@dataclass
+class Replanejamento:
+    status: str
+    custo: float
+    tempo: float
+    mudancas: int                          # atribuições X_ij alteradas
+    colaboradores_alterados: List[int]
+    atribuicoes: Dict[int, Optional[int]]  # colaborador -> turno (None = não alocado)
+
+
+def reotimizar_ausencias(
+    model: pulp.LpProblem,
+    x_vars: Dict[Tuple[int, int], pulp.LpVariable],
+    ausentes: Iterable[int],
+    w_vars: Optional[Dict[Tuple[int, int, int], pulp.LpVariable]] = None,
+    penalidade_mudanca: float = 1000.0,
+    solver: Optional[pulp.LpSolver] = None,
+) -> Replanejamento:
+    """Re-planeja a escala de `model` (já resolvido) sem os colaboradores `ausentes`.
+
+    As X dos ausentes ficam fixas em 0 apenas durante esta resolução: ao final,
+    o objetivo e os limites originais de `model` são restaurados, e os valores
+    das variáveis são os da nova escala.
+
+    :param penalidade_mudanca: custo somado ao objetivo por atribuição X_ij
+        diferente da escala anterior
+    :param w_vars: se informado, as W dos ausentes recebem valor inicial 0 no
+        ponto de partida, deixando o warmStart consistente (não são fixadas)
+    """
+    anterior = {}
+    for key, var in x_vars.items():
+        if var.value() is None:
+            raise ValueError("O modelo precisa ter sido resolvido antes da re-otimização")
+        anterior[key] = 1 if var.value() > 0.5 else 0
+
+    ausentes = set(ausentes)
+    limites_originais = {}
+    for (i, j), var in x_vars.items():
+        if i in ausentes:
+            limites_originais[var] = (var.lowBound, var.upBound)
+            var.bounds(0, 0)
+            var.setInitialValue(0)
+    if w_vars is not None:
+        for (i, _j, _k), var in w_vars.items():
+            if i in ausentes:
+                var.setInitialValue(0)
+
+    # |X_ij - anterior_ij| é linear para X binária e anterior conhecido
+    desvio = pulp.lpSum(
+        var if anterior[key] == 0 else 1 - var for key, var in x_vars.items()
+    )
+
+    objetivo_original = model.objective
+    model.setObjective(objetivo_original + penalidade_mudanca * desvio)
+
+    if solver is None:
+        solver = pulp.PULP_CBC_CMD(msg=False, warmStart=True)
+
+    start_time = time.time()
+    try:
+        model.solve(solver)
+    finally:
+        model.setObjective(objetivo_original)
+        for var, (inferior, superior) in limites_originais.items():
+            var.bounds(inferior, superior)
+    end_time = time.time()
+
+    status = pulp.LpStatus[model.status]
+    if status not in ["Optimal", "Feasible"]:
+        return Replanejamento(status=status, custo=float("inf"), tempo=end_time - start_time,
+                              mudancas=0, colaboradores_alterados=[], atribuicoes={})
+
+    atribuicoes: Dict[int, Optional[int]] = {}
+    mudancas = 0
+    alterados = set()
+    for (i, j), var in x_vars.items():
+        novo = 1 if var.value() > 0.5 else 0
+        atribuicoes.setdefault(i, None)
+        if novo:
+            atribuicoes[i] = j
+        if novo != anterior[(i, j)]:
+            mudancas += 1
+            alterados.add(i)
+
+    return Replanejamento(
+        status=status,
+        custo=pulp.value(objetivo_original),
+        tempo=end_time - start_time,
+        mudancas=mudancas,
+        colaboradores_alterados=sorted(alterados),
+        atribuicoes=atribuicoes,
+    )
+
+
+if __name__ == "__main__":
+    import random
+
+    from cenarios_comparacao import gerar_dados_aleatorios
+    from solver import build_model_from_data
+
+    random.seed(42)
+    dados = gerar_dados_aleatorios(300, 4, 3)
+    model, x_vars, w_vars, _swap = build_model_from_data(dados)
+
+    start_time = time.time()
+    model.solve(pulp.PULP_CBC_CMD(msg=False))
+    tempo_frio = time.time() - start_time
+    print(f"Solução inicial: {pulp.LpStatus[model.status]}, "
+          f"custo={pulp.value(model.objective):.2f}, tempo={tempo_frio:.2f}s")
+
+    # dois engenheiros escalados faltam
+    escalados = sorted({i for (i, j), var in x_vars.items() if var.value() > 0.5})
+    ausentes = escalados[:2]
+    print(f"Ausentes: {ausentes}")
+
+    r = reotimizar_ausencias(model, x_vars, ausentes, w_vars=w_vars)
+    print(f"Re-planejamento: {r.status}, custo={r.custo:.2f}, tempo={r.tempo:.2f}s, "
+          f"mudanças={r.mudancas} (colaboradores {r.colaboradores_alterados})")
@@ -0,0 +1,268 @@
+# servico_escalas.py
+"""Serviço HTTP local de escalas, com o pulp já importado e modelos pré-construídos.
+
+Cada chamada de `python solver.py` paga a inicialização do Python, o import do
+pulp (que carrega todas as APIs de solver), a construção do modelo e só então
+o CBC. O serviço fica no ar e mantém, por formato de instância
+(colaboradores, turnos, linhas), um modelo (template) já construído:
+uma nova instância do mesmo formato só atualiza coeficientes e lados direitos.
+
+As linhas que dependem dos dados são escritas de forma que a estrutura não
+mude entre instâncias:
+* skill:          sum_i skill_ik W_ijk >= min_skill_required_k  (coeficientes e RHS)
+* cobertura:      sum_i W_ijk >= min_cover_k                   (RHS)
+* linearização:   W_ijk <= Y_ik  e  W_ijk - X_ij >= Y_ik - 1    (RHS)
+* troca D↔N:      Swap_i - a_ij X_ij >= 0, a_ij = 1 se j é do período oposto (coeficiente)
+
+Uso:
+    python servico_escalas.py --porta 8765 --workers 2
+    curl -X POST --data @instancia.json http://127.0.0.1:8765/resolver
+    curl http://127.0.0.1:8765/saude
+
+O corpo do POST é uma instância no formato JSON de instancias.py; a resposta
+traz a escala e os tempos de fila, de atualização do modelo e do solver.
+"""
+from typing import List, Optional, Tuple
+import argparse
+import json
+import queue
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pulp
+
+from instancias import dados_para_dict, dict_para_dados
+from solver import Dados, is_night_shift
+
+Formato = Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]
+
+
+class ModeloEscala:
+    """MIP de escalas com estrutura fixa para um formato de instância"""
+
+    def __init__(self, employees: List[int], shifts: List[int], lines: List[int],
+                 swap_penalty: float = 5000):
+        self.formato: Formato = (tuple(employees), tuple(shifts), tuple(lines))
+        self.model = pulp.LpProblem("Escalas_CSE_MIP", pulp.LpMinimize)
+
+        self.x_vars = {(i, j): pulp.LpVariable(f"X_{i}_{j}", cat=pulp.LpBinary)
+                       for i in employees for j in shifts}
+        self.w_vars = {(i, j, k): pulp.LpVariable(f"W_{i}_{j}_{k}", cat=pulp.LpBinary)
+                       for i in employees for j in shifts for k in lines}
+        self.swap = {i: pulp.LpVariable(f"Swap_{i}", cat=pulp.LpBinary) for i in employees}
+
+        # coeficientes do objetivo em X são preenchidos em atualizar()
+        self.model += pulp.LpAffineExpression(
+            [(var, 0) for var in self.x_vars.values()]
+            + [(self.swap[i], swap_penalty) for i in employees])
+
+        self.skill_rows = {}
+        self.cover_rows = {}
+        for j in shifts:
+            for k in lines:
+                expr = pulp.LpAffineExpression([(self.w_vars[(i, j, k)], 0) for i in employees])
+                self.skill_rows[(j, k)] = pulp.LpConstraint(
+                    expr, pulp.LpConstraintGE, f"Skill_{j}_{k}", 0)
+                self.model += self.skill_rows[(j, k)]
+                self.cover_rows[(j, k)] = pulp.LpConstraint(
+                    pulp.lpSum(self.w_vars[(i, j, k)] for i in employees),
+                    pulp.LpConstraintGE, f"Cobertura_{j}_{k}", 0)
+                self.model += self.cover_rows[(j, k)]
+
+        for i in employees:
+            self.model += pulp.lpSum(self.x_vars[(i, j)] for j in shifts) <= 1, f"Um_turno_{i}"
+
+        self.avail_rows = {}
+        self.lin_rows = {}
+        for (i, j, k), w in self.w_vars.items():
+            x = self.x_vars[(i, j)]
+            self.model += w <= x, f"Lin_x_{i}_{j}_{k}"
+            self.avail_rows[(i, j, k)] = pulp.LpConstraint(
+                pulp.LpAffineExpression(w), pulp.LpConstraintLE, f"Lin_y_{i}_{j}_{k}", 0)
+            self.model += self.avail_rows[(i, j, k)]
+            self.lin_rows[(i, j, k)] = pulp.LpConstraint(
+                w - x, pulp.LpConstraintGE, f"Lin_xy_{i}_{j}_{k}", 0)
+            self.model += self.lin_rows[(i, j, k)]
+
+        self.swap_rows = {}
+        for (i, j), x in self.x_vars.items():
+            self.swap_rows[(i, j)] = pulp.LpConstraint(
+                pulp.LpAffineExpression([(self.swap[i], 1), (x, 0)]),
+                pulp.LpConstraintGE, f"Troca_{i}_{j}", 0)
+            self.model += self.swap_rows[(i, j)]
+
+    def atualizar(self, dados: Dados) -> None:
+        """Copia coeficientes e lados direitos de `dados` para o modelo"""
+        (employees, shifts, lines, shift_cost, employee_cost,
+         availability, skill_level, shift_class, min_skill_required, min_cover) = dados
+
+        objective = self.model.objective
+        for (i, j), var in self.x_vars.items():
+            objective[var] = shift_cost[j] + employee_cost[i]
+
+        for (j, k), row in self.skill_rows.items():
+            for i in employees:
+                row.expr[self.w_vars[(i, j, k)]] = skill_level[(i, k)]
+            row.changeRHS(min_skill_required[k])
+        for (j, k), row in self.cover_rows.items():
+            row.changeRHS(min_cover[k])
+
+        for (i, j, k), row in self.avail_rows.items():
+            y = availability[(i, k)]
+            row.changeRHS(y)
+            self.lin_rows[(i, j, k)].changeRHS(y - 1)
+
+        for (i, j), row in self.swap_rows.items():
+            cat_period = "D" if "D" in shift_class[i] else "N"
+            oposto = is_night_shift(j, shift_cost) == (cat_period == "D")
+            row.expr[self.x_vars[(i, j)]] = -1 if oposto else 0
+
+    def resolver(self, solver: pulp.LpSolver) -> dict:
+        self.model.solve(solver)
+        status = pulp.LpStatus[self.model.status]
+        resposta = {"status": status}
+        if status in ["Optimal", "Feasible"]:
+            resposta["custo"] = pulp.value(self.model.objective)
+            resposta["atribuicoes"] = {str(i): j for (i, j), var in sorted(self.x_vars.items())
+                                       if var.value() > 0.5}
+        return resposta
+
+
+class ServicoEscalas:
+    """Fila de pedidos atendida por `workers` threads, cada uma com seus modelos
+
+    O CBC roda num subprocesso, então as threads resolvem em paralelo; os
+    modelos não são compartilhados entre threads.
+    """
+
+    def __init__(self, solver_name: str = "PULP_CBC_CMD", workers: int = 1,
+                 limite_tempo: Optional[float] = None, max_templates: int = 16):
+        self.solver_name = solver_name
+        self.limite_tempo = limite_tempo
+        self.max_templates = max_templates
+        self.fila: "queue.Queue" = queue.Queue()
+        self.atendidos = 0
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._trabalhador, daemon=True)
+                         for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submeter(self, dados: Dados) -> dict:
+        """Enfileira a instância e espera a resposta"""
+        pedido = {"dados": dados, "chegada": time.time(), "pronto": threading.Event()}
+        self.fila.put(pedido)
+        pedido["pronto"].wait()
+        return pedido["resposta"]
+
+    def _trabalhador(self) -> None:
+        solver = pulp.getSolver(self.solver_name, msg=False, timeLimit=self.limite_tempo)
+        templates: "OrderedDict[Formato, ModeloEscala]" = OrderedDict()
+        while True:
+            pedido = self.fila.get()
+            inicio = time.time()
+            try:
+                dados = pedido["dados"]
+                formato = (tuple(dados[0]), tuple(dados[1]), tuple(dados[2]))
+                modelo = templates.get(formato)
+                reutilizado = modelo is not None
+                if reutilizado:
+                    templates.move_to_end(formato)
+                else:
+                    modelo = ModeloEscala(dados[0], dados[1], dados[2])
+                    templates[formato] = modelo
+                    if len(templates) > self.max_templates:
+                        templates.popitem(last=False)
+                modelo.atualizar(dados)
+                preparado = time.time()
+                resposta = modelo.resolver(solver)
+                fim = time.time()
+                resposta.update(
+                    template="reutilizado" if reutilizado else "novo",
+                    tempo_fila=inicio - pedido["chegada"],
+                    tempo_preparo=preparado - inicio,
+                    tempo_solver=fim - preparado,
+                    latencia=fim - pedido["chegada"],
+                )
+            except Exception as e:
+                resposta = {"status": "Erro", "erro": f"{type(e).__name__}: {e}",
+                            "tempo_fila": inicio - pedido["chegada"]}
+            with self._lock:
+                self.atendidos += 1
+            pedido["resposta"] = resposta
+            pedido["pronto"].set()
+
+
+def criar_servidor(servico: ServicoEscalas, host: str = "127.0.0.1",
+                   porta: int = 8765) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def _responder(self, codigo: int, corpo: dict) -> None:
+            dados = json.dumps(corpo).encode()
+            self.send_response(codigo)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def do_GET(self):
+            if self.path != "/saude":
+                self._responder(404, {"erro": "rota desconhecida"})
+                return
+            self._responder(200, {"status": "ok", "fila": servico.fila.qsize(),
+                                  "atendidos": servico.atendidos})
+
+        def do_POST(self):
+            if self.path != "/resolver":
+                self._responder(404, {"erro": "rota desconhecida"})
+                return
+            try:
+                tamanho = int(self.headers.get("Content-Length", 0))
+                dados = dict_para_dados(json.loads(self.rfile.read(tamanho)))
+            except (ValueError, KeyError, TypeError) as e:
+                self._responder(400, {"erro": f"instância inválida: {e}"})
+                return
+            resposta = servico.submeter(dados)
+            self._responder(500 if resposta["status"] == "Erro" else 200, resposta)
+
+        def log_message(self, format, *args):
+            pass  # sem log por pedido
+
+    return ThreadingHTTPServer((host, porta), Handler)
+
+
+def resolver_remoto(dados: Dados, url: str = "http://127.0.0.1:8765") -> dict:
+    """Envia uma instância ao serviço e devolve a resposta"""
+    pedido = urllib.request.Request(
+        f"{url}/resolver", data=json.dumps(dados_para_dict(dados)).encode(),
+        headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(pedido) as resposta:
+        return json.loads(resposta.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço HTTP local de escalas")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1, help="threads de resolução")
+    parser.add_argument("--solver", default="PULP_CBC_CMD", help="nome para pulp.getSolver")
+    parser.add_argument("--limite-tempo", type=float, default=None,
+                        help="timeLimit do solver por pedido (s)")
+    args = parser.parse_args()
+
+    servico = ServicoEscalas(args.solver, args.workers, args.limite_tempo)
+    servidor = criar_servidor(servico, args.host, args.porta)
+    print(f"Serviço de escalas em http://{args.host}:{args.porta} "
+          f"(solver {args.solver}, {args.workers} worker(s))", flush=True)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,48 @@
-from typing import Dict, List, Tuple
+"""Modelo MIP de escalas (CSE) e CLI de resolução em lote.
+
+Sem argumentos, resolve a instância original e imprime o relatório:
+    python solver.py
+
+Com arquivos ou diretórios de instâncias (JSON/CSV, ver instancias.py), resolve
+em um pool de processos e grava uma linha JSON por instância assim que termina:
+    python solver.py instancias/ --workers 8 --solver PULP_CBC_CMD --saida resultados.jsonl
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass
+
 import pulp
 
-# esse é o solver de submissão para correção
-def build_model() -> Tuple[
-    pulp.LpProblem,
-    Dict[Tuple[int, int], pulp.LpVariable],
-    Dict[Tuple[int, int, int], pulp.LpVariable],
-    Dict[Tuple[int,int], int],
-    Dict[int,int],
-    Dict[int,int]
-]:
-    """Construção da modelagem de programação  linear inteira mista"""
+if TYPE_CHECKING:
+    # numpy só é necessário para o relatório (solution_view)
+    import numpy as np
+
+# Dados de uma instância, na mesma ordem de cenarios_comparacao.gerar_dados_aleatorios:
+# (employees, shifts, lines, shift_cost, employee_cost, availability,
+#  skill_level, shift_class, min_skill_required, min_cover)
+Dados = Tuple[
+    List[int],
+    List[int],
+    List[int],
+    Dict[int, int],
+    Dict[int, float],
+    Dict[Tuple[int, int], int],
+    Dict[Tuple[int, int], int],
+    Dict[int, str],
+    Dict[int, int],
+    Dict[int, int],
+]
+
+
+def default_data() -> Dados:
+    """Dados da instância original (18 colaboradores, 4 turnos, 3 linhas)"""
 
     # definição dos conjuntos
     employees: List[int] = list(range(1, 19))  # 18 funcionários
@@ -66,71 +98,234 @@ def build_model() -> Tuple[
     min_skill_required = {1:6,2:8,3:7}
     min_cover = {1:1,2:2,3:2}
 
+    return (employees, shifts, lines, shift_cost, employee_cost,
+            availability, skill_level, shift_class, min_skill_required, min_cover)
+
+
+def is_night_shift(j: int, shift_cost: Dict[int, int]) -> bool:
+    """Turnos noturnos são os de custo 2 (mesma convenção de cenarios_comparacao)"""
+    return shift_cost[j] == 2
+
+
+def valid_index_sets(data: Dados, allow_swap: bool = True) -> Tuple[
+    List[Tuple[int, int]],
+    Dict[Tuple[int, int], List[int]]
+]:
+    """Índices esparsos do modelo, calculados uma vez a partir dos dados
+
+    :return: (pares (i, j) com X, colaboradores disponíveis por (j, k) com W).
+        Sem `allow_swap`, os turnos do período oposto ao da categoria do
+        colaborador ficam de fora.
+    """
+    (employees, shifts, lines, shift_cost, _employee_cost,
+     availability, _skill_level, shift_class, _min_skill_required, _min_cover) = data
+
+    x_keys = []
+    for i in employees:
+        is_day = "D" in shift_class[i]
+        for j in shifts:
+            if allow_swap or is_night_shift(j, shift_cost) != is_day:
+                x_keys.append((i, j))
+
+    available = {(j, k): [] for j in shifts for k in lines}
+    for (i, j) in x_keys:
+        for k in lines:
+            if availability[(i, k)] == 1:
+                available[(j, k)].append(i)
+    return x_keys, available
+
+
+def build_model_from_data(data: Dados, swap_penalty: float = 5000, allow_swap: bool = True) -> Tuple[
+    pulp.LpProblem,
+    Dict[Tuple[int, int], pulp.LpVariable],
+    Dict[Tuple[int, int, int], pulp.LpVariable],
+    Dict[int, pulp.LpVariable]
+]:
+    """Construção do MIP de escalas para uma instância qualquer
+
+    X existe só para os pares (i, j) permitidos e W só para as linhas que o
+    colaborador atende (availability = 1): W_ijk = X_ij * Y_ik vale 0 quando
+    Y_ik = 0 e X_ij quando Y_ik = 1, então uma igualdade substitui as três
+    desigualdades da linearização. Com `allow_swap=False`, os turnos do
+    período oposto nem são criados e não há variáveis de troca.
+    """
+
+    (employees, shifts, lines, shift_cost, employee_cost,
+     availability, skill_level, shift_class, min_skill_required, min_cover) = data
+
+    x_keys, available = valid_index_sets(data, allow_swap)
+
     # Modelo
     model = pulp.LpProblem("Escalas_CSE_MIP", pulp.LpMinimize)
 
-    # Variáveis
+    # Variáveis (somente sobre os índices válidos)
     x_vars = {(i,j): pulp.LpVariable(f"X_{i}_{j}", cat=pulp.LpBinary)
-              for i in employees for j in shifts}
+              for (i,j) in x_keys}
     w_vars = {(i,j,k): pulp.LpVariable(f"W_{i}_{j}_{k}", cat=pulp.LpBinary)
-              for i in employees for j in shifts for k in lines}
+              for (j,k), colabs in available.items() for i in colabs}
 
     # NOVO: variáveis binárias indicando troca D↔N
-    swap = {i: pulp.LpVariable(f"Swap_{i}", cat=pulp.LpBinary) for i in employees}
+    swap = ({i: pulp.LpVariable(f"Swap_{i}", cat=pulp.LpBinary) for i in employees}
+            if allow_swap else {})
 
     # Função objetivo
     model += (
         pulp.lpSum((shift_cost[j] + employee_cost[i]) * x_vars[(i,j)]
-                   for i in employees for j in shifts)
-        + pulp.lpSum(5000 * swap[i] for i in employees)
+                   for (i,j) in x_keys)
+        + pulp.lpSum(swap_penalty * swap[i] for i in swap)
     )
 
     # Cobertura mínima de nível de habilidade
     for j in shifts:
         for k in lines:
             model += pulp.lpSum(skill_level[(i,k)] * w_vars[(i,j,k)]
-                                for i in employees) >= min_skill_required[k]
+                                for i in available[(j,k)]
+                                if skill_level[(i,k)]) >= min_skill_required[k]
 
     # Cobertura mínima de engenheiros
     for j in shifts:
         for k in lines:
-            model += pulp.lpSum(w_vars[(i,j,k)] for i in employees) >= min_cover[k]
+            model += pulp.lpSum(w_vars[(i,j,k)] for i in available[(j,k)]) >= min_cover[k]
 
     # No máximo 1 turno por funcionário
+    x_by_employee = {i: [] for i in employees}
+    for (i,j), var in x_vars.items():
+        x_by_employee[i].append(var)
     for i in employees:
-        model += pulp.lpSum(x_vars[(i,j)] for j in shifts) <= 1
+        model += pulp.lpSum(x_by_employee[i]) <= 1
 
-    # Linearização W = X * Y
-    for i in employees:
-        for j in shifts:
-            for k in lines:
-                y = availability[(i,k)]
-                model += w_vars[(i,j,k)] <= x_vars[(i,j)]
-                model += w_vars[(i,j,k)] <= y
-                model += w_vars[(i,j,k)] >= x_vars[(i,j)] + y - 1
+    # Linearização W = X * Y (Y = 1 para toda W criada)
+    for (i,j,k), var in w_vars.items():
+        model += var == x_vars[(i,j)]
 
     #     DIURNO <-> NOTURNO —  COM custo para a mudança
-    for i in employees:
+    for i in swap:
         cat = shift_class[i]  # MDA/MDB/MNA/MNB
 
         # determina se o funcionário é originalmente D ou N
         cat_period = "D" if "D" in cat else "N"
 
-        if cat_period == "D":
-            # swap_i = 1 se escolher turno noturno
-            model += swap[i] >= x_vars[(i,3)]
-            model += swap[i] >= x_vars[(i,4)]
-        else:
-            # swap_i = 1 se escolher turno diurno
-            model += swap[i] >= x_vars[(i,1)]
-            model += swap[i] >= x_vars[(i,2)]
+        for j in shifts:
+            # swap_i = 1 se escolher turno do período oposto
+            if is_night_shift(j, shift_cost) == (cat_period == "D"):
+                model += swap[i] >= x_vars[(i,j)]
+
+    return model, x_vars, w_vars, swap
+
+
+@dataclass
+class SolutionView:
+    """Valores de X e W de uma solução em arrays densos (índices em employees/shifts/lines)"""
+    employees: List[int]
+    shifts: List[int]
+    lines: List[int]
+    x: np.ndarray            # (colaboradores, turnos)
+    w: np.ndarray            # (colaboradores, turnos, linhas)
+    skill: np.ndarray        # (colaboradores, linhas)
+    shift_cost: np.ndarray   # (turnos,)
+    employee_cost: np.ndarray  # (colaboradores,)
+    opposite: np.ndarray     # (colaboradores, turnos): turno do período oposto
+
+    def coverage(self) -> np.ndarray:
+        """Pessoas por (turno, linha)"""
+        return self.w.sum(axis=0)
+
+    def skill_sum(self) -> np.ndarray:
+        """Soma de skill por (turno, linha)"""
+        return (self.w * self.skill[:, None, :]).sum(axis=0)
+
+    def cost_per_employee(self) -> np.ndarray:
+        """Custo de turno + colaborador de cada colaborador (0 se não escalado)"""
+        return self.x @ self.shift_cost + self.x.sum(axis=1) * self.employee_cost
+
+    def swaps(self) -> np.ndarray:
+        """Colaboradores escalados em turno do período oposto"""
+        return (self.x * self.opposite).sum(axis=1) > 0.5
+
+    def swap_count(self) -> int:
+        return int(self.swaps().sum())
+
+
+def solution_view(data: Dados, x_vars: Dict[Tuple[int, int], pulp.LpVariable],
+                  w_vars: Dict[Tuple[int, int, int], pulp.LpVariable]) -> SolutionView:
+    """Lê X e W de uma vez para arrays NumPy (variáveis ausentes valem 0)"""
+    import numpy as np
+
+    def _values(variables: Dict, flat_index, shape: Tuple[int, ...]) -> np.ndarray:
+        """Array `shape` com os varValue das variáveis nas posições (achatadas) de `flat_index`"""
+        array = np.zeros(shape)
+        n = len(variables)
+        positions = np.fromiter(flat_index, dtype=np.intp, count=n)
+        values = np.fromiter((var.varValue or 0.0 for var in variables.values()),
+                             dtype=float, count=n)
+        np.put(array, positions, values)
+        return array
+
+    (employees, shifts, lines, shift_cost, employee_cost,
+     _availability, skill_level, shift_class, _min_skill_required, _min_cover) = data
+
+    e_pos = {i: n for n, i in enumerate(employees)}
+    s_pos = {j: n for n, j in enumerate(shifts)}
+    l_pos = {k: n for n, k in enumerate(lines)}
+
+    n_s, n_l = len(shifts), len(lines)
+    x = _values(x_vars, (e_pos[i] * n_s + s_pos[j] for (i, j) in x_vars),
+                (len(employees), n_s))
+    w = _values(w_vars, ((e_pos[i] * n_s + s_pos[j]) * n_l + l_pos[k] for (i, j, k) in w_vars),
+                (len(employees), n_s, n_l))
+
+    night = np.array([is_night_shift(j, shift_cost) for j in shifts])
+    is_day = np.array(["D" in shift_class[i] for i in employees])
+    return SolutionView(
+        employees=list(employees),
+        shifts=list(shifts),
+        lines=list(lines),
+        x=x,
+        w=w,
+        skill=np.array([[skill_level[(i, k)] for k in lines] for i in employees], dtype=float),
+        shift_cost=np.array([shift_cost[j] for j in shifts], dtype=float),
+        employee_cost=np.array([employee_cost[i] for i in employees], dtype=float),
+        opposite=night[None, :] == is_day[:, None],
+    )
+
+
+def cbc_node_count(log_path: str) -> int:
+    """Número de nós enumerados pelo CBC, lido do arquivo de log (-1 se ausente)"""
+    with open(log_path) as f:
+        for line in f:
+            if line.startswith("Enumerated nodes:"):
+                return int(line.split(":")[1])
+    return -1
+
+
+# esse é o solver de submissão para correção
+def build_model(data: Optional[Dados] = None) -> Tuple[
+    pulp.LpProblem,
+    Dict[Tuple[int, int], pulp.LpVariable],
+    Dict[Tuple[int, int, int], pulp.LpVariable],
+    Dict[Tuple[int,int], int],
+    Dict[int,int],
+    Dict[int,int]
+]:
+    """Construção da modelagem de programação  linear inteira mista
+
+    :param data: instância a modelar; por padrão, default_data()
+    """
+    if data is None:
+        data = default_data()
+    (_employees, _shifts, _lines, _shift_cost, _employee_cost,
+     _availability, skill_level, _shift_class, min_skill_required, min_cover) = data
+
+    model, x_vars, w_vars, _swap = build_model_from_data(data)
 
     return model, x_vars, w_vars, skill_level, min_skill_required, min_cover
 
 
 def solve_and_format() -> str:
+    # os mesmos dados para o modelo e para o relatório
+    data = default_data()
     (model, x_vars, w_vars, skill_level, 
-     min_skill_required, min_cover) = build_model()
+     min_skill_required, min_cover) = build_model(data)
 
     model.solve(pulp.PULP_CBC_CMD(msg=False))
 
@@ -152,17 +347,15 @@ def solve_and_format() -> str:
 
     # W_ijk (cobertura)
     lines.append("\nCobertura por linha e turno (pessoas e skill_sum):")
-    employees = sorted({i for (i,_j) in x_vars})
-    shifts = sorted({j for (_i,j) in x_vars})
-    for j in shifts:
-        for k in [1,2,3]:
-            cover = sum(w_vars[(i,j,k)].value() for i in employees)
-            skill_sum = sum(skill_level[(i,k)] * w_vars[(i,j,k)].value()
-                            for i in employees)
+    view = solution_view(data, x_vars, w_vars)
+    coverage = view.coverage()
+    skill_sum = view.skill_sum()
+    for jn, j in enumerate(view.shifts):
+        for kn, k in enumerate(view.lines):
             lines.append(
                 f" - Turno {j}, Linha {k}: "
-                f"pessoas={int(round(cover))}, "
-                f"skill_sum={int(round(skill_sum))}, "
+                f"pessoas={int(round(coverage[jn, kn]))}, "
+                f"skill_sum={int(round(skill_sum[jn, kn]))}, "
                 f"req_skill={min_skill_required[k]}, "
                 f"min_pessoas={min_cover[k]}"
             )
@@ -170,8 +363,115 @@ def solve_and_format() -> str:
     return "\n".join(lines)
 
 
-def main():
-    print(solve_and_format())
+# solver de cada processo do pool: criado uma vez, no initializer
+_worker_solver: Optional[pulp.LpSolver] = None
+
+
+def _init_worker(solver_name: str, time_limit: Optional[float]) -> None:
+    global _worker_solver
+    _worker_solver = pulp.getSolver(solver_name, msg=False, timeLimit=time_limit)
+
+
+def solve_instance_file(path: str, solver: Optional[pulp.LpSolver] = None) -> dict:
+    """Resolve um arquivo de instância e devolve o registro JSON do resultado"""
+    from instancias import carregar_instancia
+
+    solver = solver or _worker_solver or pulp.PULP_CBC_CMD(msg=False)
+    record = {"instancia": path, "pid": os.getpid()}
+    start_time = time.time()
+    try:
+        data = carregar_instancia(path)
+        read_time = time.time()
+        model, x_vars, _w_vars, _swap = build_model_from_data(data)
+        build_time = time.time()
+        model.solve(solver)
+        solve_time = time.time()
+    except Exception as e:
+        # uma instância com problema não interrompe o lote
+        record.update(status="Erro", erro=f"{type(e).__name__}: {e}",
+                      tempo_total=time.time() - start_time)
+        return record
+
+    status = pulp.LpStatus[model.status]
+    record.update(
+        status=status,
+        custo=pulp.value(model.objective) if status in ["Optimal", "Feasible"] else None,
+        tempo_leitura=read_time - start_time,
+        tempo_construcao=build_time - read_time,
+        tempo_solver=solve_time - build_time,
+        tempo_total=solve_time - start_time,
+    )
+    if status in ["Optimal", "Feasible"]:
+        record["atribuicoes"] = {str(i): j for (i, j), var in sorted(x_vars.items())
+                                 if var.value() > 0.5}
+    return record
+
+
+def solve_batch(paths: List[str], workers: int = 1, solver_name: str = "PULP_CBC_CMD",
+                time_limit: Optional[float] = None, chunksize: Optional[int] = None):
+    """Resolve as instâncias e gera os registros na ordem em que terminam
+
+    Os processos do pool vivem o lote inteiro: o pulp é importado e o solver
+    criado uma vez por processo, e as instâncias são enviadas em blocos
+    (`chunksize`) para diluir a comunicação entre processos.
+    """
+    if workers <= 1:
+        _init_worker(solver_name, time_limit)
+        for path in paths:
+            yield solve_instance_file(path)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, min(32, len(paths) // (workers * 4)))
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(solver_name, time_limit)) as pool:
+        yield from pool.imap_unordered(solve_instance_file, paths, chunksize)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Resolução de escalas (uma instância ou em lote)")
+    parser.add_argument("caminhos", nargs="*",
+                        help="arquivos ou diretórios de instâncias JSON/CSV "
+                             "(sem caminhos, resolve a instância original)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="processos do pool (padrão: número de núcleos)")
+    parser.add_argument("--solver", default="PULP_CBC_CMD",
+                        help="nome do solver para pulp.getSolver (ex.: PULP_CBC_CMD, HiGHS)")
+    parser.add_argument("--limite-tempo", type=float, default=None,
+                        help="timeLimit do solver por instância (s)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="instâncias enviadas por vez a cada processo")
+    parser.add_argument("--saida", default="-", help="arquivo JSONL de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if not args.caminhos:
+        print(solve_and_format())
+        return
+
+    from instancias import listar_instancias
+
+    try:
+        if not pulp.getSolver(args.solver, msg=False).available():
+            parser.error(f"solver indisponível: {args.solver}")
+    except pulp.PulpSolverError as e:
+        parser.error(str(e))
+
+    paths = listar_instancias(args.caminhos)
+    out = sys.stdout if args.saida == "-" else open(args.saida, "w")
+    start_time = time.time()
+    n_ok = 0
+    try:
+        for record in solve_batch(paths, args.workers, args.solver,
+                                  args.limite_tempo, args.chunksize):
+            n_ok += record["status"] in ["Optimal", "Feasible"]
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    total_time = time.time() - start_time
+    print(f"{len(paths)} instâncias ({n_ok} viáveis) em {total_time:.2f}s "
+          f"({len(paths) / max(total_time, 1e-9):.1f} instâncias/s)", file=sys.stderr)
 
 
 if __name__ == "__main__":
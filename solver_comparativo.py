@@ -1,11 +1,71 @@
 # analise_resultados.py
+"""Análise de desempenho dos algoritmos com histórico para detectar regressões.
+
+Executa cada cenário/algoritmo R vezes, grava as medições em um SQLite local
+(com host, commit do git e parâmetros), calcula medianas com intervalos de
+confiança bootstrap e compara o tempo com uma execução anterior (baseline):
+uma regressão é sinalizada quando o teste de Mann–Whitney unilateral indica
+que o tempo atual é maior (p < alfa) E a mediana piorou mais que o efeito
+mínimo (relativo e absoluto). Com regressões, o processo termina com código 1.
+
+Uso:
+    python solver_comparativo.py --repeticoes 10
+    python solver_comparativo.py --repeticoes 10 --baseline 3
+"""
+from typing import List, Optional, Tuple
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import time
+
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
+import pulp
+
+from cenarios_comparacao import solver_genetico_pulp, solver_greedy, solver_mip_pulp
+
+CENARIOS = [
+    ("Cenário 1: Mais Colaboradores", 36, 4, 3),
+    ("Cenário 2: Mais Turnos", 18, 8, 3),
+    ("Cenário 3: Mais Linhas", 18, 4, 6),
+    ("Cenário 4: Completo", 24, 6, 4),
+]
+ALGORITMOS = [solver_mip_pulp, solver_greedy, solver_genetico_pulp]
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL,
+    host TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    python TEXT NOT NULL,
+    pulp TEXT NOT NULL,
+    parametros TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicoes (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id),
+    cenario TEXT NOT NULL,
+    algoritmo TEXT NOT NULL,
+    repeticao INTEGER NOT NULL,
+    custo REAL,
+    tempo REAL NOT NULL,
+    viavel INTEGER NOT NULL
+);
+"""
+
+
 def analisar_desempenho(resultados_totais):
     """Analisa estatisticamente os resultados"""
-    
+
     dados = []
     for nome_cenario, resultados in resultados_totais:
         for resultado in resultados:
@@ -16,16 +76,266 @@ def analisar_desempenho(resultados_totais):
                 'Tempo': resultado.tempo,
                 'Viavel': resultado.viável
             })
-    
+
     df = pd.DataFrame(dados)
-    
+
     return df
 
-# Para executar a análise, adicione ao main:
+
+def executar_repeticoes(repeticoes: int, seed: int = 42) -> pd.DataFrame:
+    """Executa cada cenário/algoritmo `repeticoes` vezes
+
+    A semente de cada execução depende só de (seed, cenário, algoritmo,
+    repetição), então as mesmas instâncias são sorteadas em todas as execuções
+    do histórico e as diferenças de tempo vêm do código, não dos dados.
+    """
+    dados = []
+    for nome_cenario, n_colabs, n_turnos, n_linhas in CENARIOS:
+        for algoritmo in ALGORITMOS:
+            for r in range(repeticoes):
+                random.seed(f"{seed}-{nome_cenario}-{algoritmo.__name__}-{r}")
+                resultado = algoritmo(n_colabs, n_turnos, n_linhas)
+                dados.append({
+                    'Cenario': nome_cenario,
+                    'Algoritmo': resultado.algoritmo,
+                    'Repeticao': r,
+                    'Custo': resultado.custo if resultado.viável else np.nan,
+                    'Tempo': resultado.tempo,
+                    'Viavel': resultado.viável
+                })
+            print(f"  {nome_cenario} / {algoritmo.__name__}: {repeticoes} repetições", flush=True)
+    return pd.DataFrame(dados)
+
+
+def _git_commit() -> str:
+    """Commit atual (com sufixo -dirty se houver mudanças não commitadas)"""
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=diretorio, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        sujo = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                              cwd=diretorio, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido"
+    return commit + ("-dirty" if sujo.strip() else "")
+
+
+def abrir_historico(caminho: str) -> sqlite3.Connection:
+    """Abre (e cria, se preciso) o histórico; quem chama deve fechar a conexão"""
+    con = sqlite3.connect(caminho)
+    con.executescript(ESQUEMA)
+    return con
+
+
+def salvar_execucao(con: sqlite3.Connection, df: pd.DataFrame, parametros: dict) -> int:
+    """Grava a execução e as medições; devolve o id da execução"""
+    with con:
+        cursor = con.execute(
+            "INSERT INTO execucoes (data, host, git_commit, python, pulp, parametros) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (time.strftime("%Y-%m-%dT%H:%M:%S"), platform.node(), _git_commit(),
+             platform.python_version(), pulp.__version__, json.dumps(parametros, sort_keys=True)))
+        execucao_id = cursor.lastrowid
+        con.executemany(
+            "INSERT INTO medicoes (execucao_id, cenario, algoritmo, repeticao, custo, tempo, viavel) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(execucao_id, linha.Cenario, linha.Algoritmo, int(linha.Repeticao),
+              None if pd.isna(linha.Custo) else float(linha.Custo), float(linha.Tempo),
+              int(linha.Viavel))
+             for linha in df.itertuples()])
+    return execucao_id
+
+
+def carregar_execucao(con: sqlite3.Connection, execucao_id: int) -> pd.DataFrame:
+    return pd.read_sql_query(
+        "SELECT cenario AS Cenario, algoritmo AS Algoritmo, repeticao AS Repeticao, "
+        "custo AS Custo, tempo AS Tempo, viavel AS Viavel FROM medicoes WHERE execucao_id = ?",
+        con, params=(execucao_id,))
+
+
+def baseline_anterior(con: sqlite3.Connection, execucao_id: int) -> Optional[int]:
+    """Execução mais recente antes de `execucao_id` no mesmo host e com os mesmos parâmetros
+
+    O número de repetições não entra na comparação dos parâmetros.
+    """
+    host, parametros = con.execute("SELECT host, parametros FROM execucoes WHERE id = ?",
+                                   (execucao_id,)).fetchone()
+    atuais = json.loads(parametros)
+    atuais.pop("repeticoes", None)
+    for anterior_id, anteriores in con.execute(
+            "SELECT id, parametros FROM execucoes WHERE host = ? AND id < ? ORDER BY id DESC",
+            (host, execucao_id)):
+        anteriores = json.loads(anteriores)
+        anteriores.pop("repeticoes", None)
+        if anteriores == atuais:
+            return anterior_id
+    return None
+
+
+def intervalo_bootstrap(valores, confianca: float = 0.95, reamostras: int = 2000,
+                        seed: int = 0) -> Tuple[float, float]:
+    """Intervalo de confiança bootstrap (percentil) para a mediana"""
+    valores = np.asarray(valores, dtype=float)
+    rng = np.random.default_rng(seed)
+    medianas = np.median(rng.choice(valores, size=(reamostras, len(valores))), axis=1)
+    alfa = (1 - confianca) / 2
+    return float(np.quantile(medianas, alfa)), float(np.quantile(medianas, 1 - alfa))
+
+
+def _distribuicao_u(n1: int, n2: int) -> List[int]:
+    """Número de arranjos sem empates com cada valor de U (U = 0..n1*n2)"""
+    # contagens[m][n] é a distribuição para amostras de tamanhos m e n
+    contagens = [[[1] for _n in range(n2 + 1)] for _m in range(n1 + 1)]
+    for m in range(1, n1 + 1):
+        for n in range(1, n2 + 1):
+            distribuicao = [0] * (m * n + 1)
+            # o maior valor vem de `a` (soma n a U) ou de `b`
+            for u, c in enumerate(contagens[m - 1][n]):
+                distribuicao[u + n] += c
+            for u, c in enumerate(contagens[m][n - 1]):
+                distribuicao[u] += c
+            contagens[m][n] = distribuicao
+    return contagens[n1][n2]
+
+
+def mann_whitney_maior(a, b) -> float:
+    """p-valor unilateral de Mann–Whitney para H1: `a` tende a ser maior que `b`
+
+    Sem empates e com até 20 valores por lado usa a distribuição exata de U;
+    caso contrário, a aproximação normal com correção de empates e de
+    continuidade.
+    """
+    a, b = list(a), list(b)
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    valores = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    postos = [0.0] * len(valores)
+    empates = 0.0
+    inicio = 0
+    while inicio < len(valores):
+        fim = inicio
+        while fim + 1 < len(valores) and valores[fim + 1][0] == valores[inicio][0]:
+            fim += 1
+        posto_medio = (inicio + fim) / 2 + 1
+        for p in range(inicio, fim + 1):
+            postos[p] = posto_medio
+        t = fim - inicio + 1
+        empates += t ** 3 - t
+        inicio = fim + 1
+    soma_a = sum(posto for posto, (_v, grupo) in zip(postos, valores) if grupo == 0)
+    u = soma_a - n1 * (n1 + 1) / 2
+
+    if empates == 0 and n1 <= 20 and n2 <= 20:
+        distribuicao = _distribuicao_u(n1, n2)
+        return sum(distribuicao[int(u):]) / sum(distribuicao)
+
+    n = n1 + n2
+    variancia = n1 * n2 / 12 * ((n + 1) - empates / (n * (n - 1)))
+    if variancia <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variancia)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def resumo(df: pd.DataFrame) -> pd.DataFrame:
+    """Mediana e IC 95% do tempo e mediana do custo por cenário/algoritmo"""
+    linhas = []
+    for (cenario, algoritmo), grupo in df.groupby(['Cenario', 'Algoritmo'], sort=False):
+        ic_inf, ic_sup = intervalo_bootstrap(grupo['Tempo'])
+        linhas.append({
+            'Cenario': cenario,
+            'Algoritmo': algoritmo,
+            'Repeticoes': len(grupo),
+            'Tempo_mediana': grupo['Tempo'].median(),
+            'Tempo_IC_inf': ic_inf,
+            'Tempo_IC_sup': ic_sup,
+            'Custo_mediana': grupo['Custo'].median(),
+            'Viaveis': int(grupo['Viavel'].sum()),
+        })
+    return pd.DataFrame(linhas)
+
+
+def comparar_com_baseline(atual: pd.DataFrame, baseline: pd.DataFrame, alfa: float = 0.05,
+                          efeito_minimo: float = 0.05, tempo_minimo: float = 0.01) -> pd.DataFrame:
+    """Compara o tempo de cada cenário/algoritmo com o baseline
+
+    Só é regressão o que for significativo (p < alfa) e piorar a mediana em
+    mais de `efeito_minimo` (relativo) e de `tempo_minimo` segundos, para que
+    ruído em tempos de microssegundos não seja sinalizado.
+    """
+    linhas = []
+    for (cenario, algoritmo), grupo in atual.groupby(['Cenario', 'Algoritmo'], sort=False):
+        base = baseline[(baseline['Cenario'] == cenario) & (baseline['Algoritmo'] == algoritmo)]
+        if base.empty:
+            continue
+        mediana_atual = grupo['Tempo'].median()
+        mediana_base = base['Tempo'].median()
+        razao = mediana_atual / mediana_base if mediana_base > 0 else float('inf')
+        p = mann_whitney_maior(grupo['Tempo'], base['Tempo'])
+        linhas.append({
+            'Cenario': cenario,
+            'Algoritmo': algoritmo,
+            'Tempo_mediana': mediana_atual,
+            'Tempo_baseline': mediana_base,
+            'Razao': razao,
+            'p_valor': p,
+            'Regressao': bool(p < alfa and razao > 1 + efeito_minimo
+                              and mediana_atual - mediana_base > tempo_minimo),
+        })
+    return pd.DataFrame(linhas)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark com histórico e detecção de regressões")
+    parser.add_argument("--repeticoes", type=int, default=10,
+                        help="execuções de cada cenário/algoritmo")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--historico", default="benchmarks.sqlite",
+                        help="arquivo SQLite com o histórico")
+    parser.add_argument("--baseline", type=int, default=None,
+                        help="id da execução de referência (padrão: a anterior com os mesmos parâmetros)")
+    parser.add_argument("--alfa", type=float, default=0.05,
+                        help="nível de significância do teste de Mann–Whitney")
+    parser.add_argument("--efeito-minimo", type=float, default=0.05,
+                        help="piora relativa mínima da mediana para sinalizar regressão")
+    parser.add_argument("--tempo-minimo", type=float, default=0.01,
+                        help="piora absoluta mínima da mediana (s) para sinalizar regressão")
+    args = parser.parse_args(argv)
+
+    parametros = {
+        "repeticoes": args.repeticoes,
+        "seed": args.seed,
+        "cenarios": CENARIOS,
+        "algoritmos": [algoritmo.__name__ for algoritmo in ALGORITMOS],
+    }
+    df = executar_repeticoes(args.repeticoes, args.seed)
+
+    # a conexão é fechada mesmo se a comparação falhar
+    with contextlib.closing(abrir_historico(args.historico)) as con:
+        execucao_id = salvar_execucao(con, df, parametros)
+        print(f"\nExecução {execucao_id} gravada em {args.historico}\n")
+
+        with pd.option_context('display.width', 200, 'display.max_columns', None):
+            print(resumo(df).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+            baseline_id = args.baseline or baseline_anterior(con, execucao_id)
+            if baseline_id is None:
+                print("\nSem baseline compatível no histórico; esta execução passa a ser a referência.")
+                return 0
+
+            comparacao = comparar_com_baseline(df, carregar_execucao(con, baseline_id),
+                                               args.alfa, args.efeito_minimo, args.tempo_minimo)
+            print(f"\nComparação com a execução {baseline_id}:")
+            print(comparacao.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+        regressoes = comparacao[comparacao['Regressao']] if not comparacao.empty else comparacao
+        if len(regressoes):
+            print(f"\n✗ {len(regressoes)} regressão(ões) de tempo detectada(s)")
+            return 1
+        print("\n✓ Nenhuma regressão de tempo")
+        return 0
+
+
 if __name__ == "__main__":
-    from cenarios_comparacao import testar_cenarios
-    import random
-    random.seed(42)
-    
-    resultados = testar_cenarios()
-    df = analisar_desempenho(resultados)
\ No newline at end of file
+    sys.exit(main())